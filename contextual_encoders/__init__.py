@@ -12,14 +12,24 @@ from contextual_encoders.measure import (
     SimilarityMeasure,
     WuPalmer,
     PathLengthMeasure,
+    InformationContentMeasure,
+    Resnik,
+    Lin,
+    JiangConrath,
 )
 from contextual_encoders.computer import MatrixComputer
+from contextual_encoders.index import SimilarityIndex
 from contextual_encoders.context import (
     TreeContext,
     GraphContext,
     GraphBasedContext,
     Context,
+    TreeIndex,
+    CompiledGraph,
 )
+from contextual_encoders.oracle import LandmarkDistanceOracle
+from contextual_encoders.registry import CacheRegistry
+from contextual_encoders.planner import Planner, Plan, ColumnPlan
 from contextual_encoders.encoder import ContextualEncoder
 from contextual_encoders.gatherer import (
     Gatherer,
@@ -27,6 +37,9 @@ from contextual_encoders.gatherer import (
     IdentityGatherer,
     FirstValueGatherer,
     SymMaxMeanGatherer,
+    MeanGatherer,
+    HausdorffGatherer,
+    SoftJaccardGatherer,
 )
 from contextual_encoders.inverter import (
     Inverter,
@@ -36,8 +49,13 @@ from contextual_encoders.inverter import (
     ExponentialInverter,
     CosineInverter,
 )
+from contextual_encoders.tokenizer import Tokenizer, TokenizedColumn
+from contextual_encoders.value_matrix import ValueMatrix
 from contextual_encoders.reducer import (
     Reducer,
     ReducerFactory,
     MultidimensionalScalingReducer,
+    EigenReducer,
+    KernelPCAReducer,
+    SpectralEmbeddingReducer,
 )
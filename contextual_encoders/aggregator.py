@@ -19,10 +19,14 @@ median      :math:`\\mathcal{A} (D^1, D^2, ..., D^k) = \\left\\{ \\begin{array}{
 max         :math:`\\mathcal{A} (D^1, D^2, ..., D^k) = max_{ l} \\; D_{i,j}^l`
 min         :math:`\\mathcal{A} (D^1, D^2, ..., D^k) = min_{ l} \\; D_{i,j}^l`
 =========== ===========
+
+The *MeanAggregator* is linear, so the aggregated matrix can also be given as a ``LinearOperator``
+that is never materialized, see :meth:`.Aggregator.aggregate_operator`.
 """
 
 import numpy as np
 from abc import ABC, abstractmethod
+from scipy.sparse.linalg import LinearOperator
 
 
 class Aggregator(ABC):
@@ -43,6 +47,82 @@ class Aggregator(ABC):
         """
         pass
 
+    def aggregate_values(self, value_matrices, block_size=None):
+        """
+        Aggregates matrices given as :class:`.ValueMatrix` instances.
+        The matrices are expanded block by block of rows and each block is aggregated right away,
+        so only the aggregated matrix is of full size.
+        By default, the expanded blocks are aggregated using :meth:`aggregate`.
+
+        :param value_matrices: A list of *ValueMatrix* instances of the same shape.
+        :param block_size: The amount of rows expanded at once. If ``None``, a default size is chosen.
+        :return: The aggregated matrix as 2D numpy array.
+        """
+        result = np.empty(value_matrices[0].get_shape())
+
+        for start, end in value_matrices[0].iterate_blocks(block_size):
+            blocks = [matrix.expand(start, end) for matrix in value_matrices]
+            result[start:end] = self.aggregate(blocks)
+
+        return result
+
+    @staticmethod
+    def _accumulate_values(value_matrices, ufunc, block_size=None):
+        """
+        Aggregates matrices given as :class:`.ValueMatrix` instances by accumulating them with a binary ufunc,
+        e.g. ``numpy.add`` or ``numpy.maximum``. The matrices are expanded into a single buffer per block.
+
+        :param value_matrices: A list of *ValueMatrix* instances of the same shape.
+        :param ufunc: The numpy ufunc combining two matrices.
+        :param block_size: The amount of rows expanded at once. If ``None``, a default size is chosen.
+        :return: The accumulated matrix as 2D numpy array.
+        """
+        result = np.empty(value_matrices[0].get_shape())
+        buffer = None
+
+        for start, end in value_matrices[0].iterate_blocks(block_size):
+            block = result[start:end]
+            value_matrices[0].expand(start, end, out=block)
+            if buffer is None or buffer.shape != block.shape:
+                buffer = np.empty(block.shape)
+            for matrix in value_matrices[1:]:
+                ufunc(block, matrix.expand(start, end, out=buffer), out=block)
+
+        return result
+
+    def supports_operator(self):
+        """
+        Returns ``True`` if the *Aggregator* can aggregate matrices to a ``LinearOperator``,
+        see :meth:`aggregate_operator`.
+
+        :return: ``True`` if the *Aggregator* supports operators.
+        """
+        return False
+
+    def aggregate_operator(self, value_matrices):
+        """
+        Aggregates matrices given as :class:`.ValueMatrix` instances to a ``LinearOperator``,
+        which applies the aggregated matrix to vectors without materializing it.
+        This method is implemented by linear *Aggregators*.
+
+        :param value_matrices: A list of *ValueMatrix* instances of the same shape.
+        :return: The aggregated matrix as ``scipy.sparse.linalg.LinearOperator``.
+        :raise ValueError: The *Aggregator* does not support operators.
+        """
+        raise ValueError(
+            f"The aggregator {type(self).__name__} does not support matrix-free aggregation."
+        )
+
+    def is_monotone(self):
+        """
+        Returns ``True`` if the *Aggregator* is monotone, i.e. if increasing any of the aggregated values
+        never decreases the result. This allows to stop top-:math:`k` queries early, see :class:`.SimilarityIndex`.
+        Custom *Aggregators* are not considered as monotone, unless they override this method.
+
+        :return: ``True`` if the *Aggregator* is monotone.
+        """
+        return False
+
 
 class AggregatorFactory:
     """
@@ -91,6 +171,57 @@ class MeanAggregator(Aggregator):
         """
         return np.mean(matrices, axis=0)
 
+    def aggregate_values(self, value_matrices, block_size=None):
+        """
+        Calculates the mean of the given matrices by summing them block by block, see :meth:`.Aggregator.aggregate_values`.
+
+        :param value_matrices: A list of :class:`.ValueMatrix` instances of the same shape.
+        :param block_size: The amount of rows expanded at once. If ``None``, a default size is chosen.
+        :return: A 2D numpy array.
+        """
+        result = self._accumulate_values(value_matrices, np.add, block_size)
+        result /= len(value_matrices)
+
+        return result
+
+    def supports_operator(self):
+        """
+        The mean is linear, so it supports operators.
+
+        :return: ``True``.
+        """
+        return True
+
+    def aggregate_operator(self, value_matrices):
+        """
+        Aggregates the given matrices to the operator :math:`\\frac{1}{k} \\sum_{i=1}^{k} P_r^i V^i {P_c^i}^T`.
+        Each product costs :math:`O(n m k + \\sum_i u_i^2 m)` for :math:`m` vectors, see :meth:`.ValueMatrix.matmat`.
+
+        :param value_matrices: A list of :class:`.ValueMatrix` instances of the same shape.
+        :return: The aggregated matrix as ``scipy.sparse.linalg.LinearOperator``.
+        """
+
+        def matmat(vectors):
+            result = value_matrices[0].matmat(vectors)
+            for value_matrix in value_matrices[1:]:
+                result += value_matrix.matmat(vectors)
+            return result / len(value_matrices)
+
+        return LinearOperator(
+            value_matrices[0].get_shape(),
+            matvec=matmat,
+            matmat=matmat,
+            dtype=np.float64,
+        )
+
+    def is_monotone(self):
+        """
+        The mean is monotone.
+
+        :return: ``True``.
+        """
+        return True
+
 
 class MedianAggregator(Aggregator):
     """
@@ -111,6 +242,14 @@ class MedianAggregator(Aggregator):
         """
         return np.median(matrices, axis=0)
 
+    def is_monotone(self):
+        """
+        The median is monotone.
+
+        :return: ``True``.
+        """
+        return True
+
 
 class MaxAggregator(Aggregator):
     """
@@ -131,6 +270,24 @@ class MaxAggregator(Aggregator):
         """
         return np.max(matrices, axis=0)
 
+    def aggregate_values(self, value_matrices, block_size=None):
+        """
+        Calculates the max of the given matrices block by block, see :meth:`.Aggregator.aggregate_values`.
+
+        :param value_matrices: A list of :class:`.ValueMatrix` instances of the same shape.
+        :param block_size: The amount of rows expanded at once. If ``None``, a default size is chosen.
+        :return: A 2D numpy array.
+        """
+        return self._accumulate_values(value_matrices, np.maximum, block_size)
+
+    def is_monotone(self):
+        """
+        The max is monotone.
+
+        :return: ``True``.
+        """
+        return True
+
 
 class MinAggregator(Aggregator):
     """
@@ -150,3 +307,21 @@ class MinAggregator(Aggregator):
         :return: A 2D numpy array.
         """
         return np.min(matrices, axis=0)
+
+    def aggregate_values(self, value_matrices, block_size=None):
+        """
+        Calculates the min of the given matrices block by block, see :meth:`.Aggregator.aggregate_values`.
+
+        :param value_matrices: A list of :class:`.ValueMatrix` instances of the same shape.
+        :param block_size: The amount of rows expanded at once. If ``None``, a default size is chosen.
+        :return: A 2D numpy array.
+        """
+        return self._accumulate_values(value_matrices, np.minimum, block_size)
+
+    def is_monotone(self):
+        """
+        The min is monotone.
+
+        :return: ``True``.
+        """
+        return True
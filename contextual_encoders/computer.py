@@ -5,10 +5,42 @@ The *MatrixComputer* combines the :class:`.Measure` with the :class:`.Gatherer`
 dissimilarity matrix for one attribute.
 Thus, the *MatrixComputer* can be seen as a mapping :math:`\\mathcal{M}: F \\rightarrow \\mathbb{R}^{n \\times n}`,
 with :math:`F` being the feature space and :math:`n` the amount of features.
+
+Long computations, e.g. with expensive custom *Measures*, can be split into tiles of the matrix of the
+distinct values. The tiles are dispatched through any ``concurrent.futures`` compatible executor,
+like a ``ThreadPoolExecutor``, a ``ProcessPoolExecutor`` or a loky executor.
+If a checkpoint directory is given, each finished tile is stored as ``.npy`` file next to a manifest,
+which identifies the computation. A restarted computation with the same directory only computes the
+missing tiles.
+
+Before any comparison takes place, the forms of the distinct values are checked against the concepts of the
+*Context* of the *Measure* in a single pass. Forms that are not part of the *Context* are handled by the
+unknown value policy:
+
+=========== ===========
+Policy      Description
+----------- -----------
+error       | Raises a ``ValueError`` listing the unknown forms.
+root        | Replaces the unknown forms by the root of the :class:`.TreeContext`.
+float       | Compares the unknown forms with the given fixed value, see :meth:`.Measure.set_unknown_forms`.
+=========== ===========
+
+The policy is resolved once per computation, so the comparisons themselves do not depend on it.
+The fixed value is assigned to a copy of the *Measure* for the computation only,
+which shares the cache with the *Measure*, so other users of the *Measure* are not affected.
 """
 
+import copy
+import hashlib
+import json
+import os
 import numpy as np
+from concurrent.futures import CancelledError, as_completed
 from .gatherer import GathererFactory, Gatherer
+from .data_utils import DataUtils
+from .tokenizer import Tokenizer
+from .context import TreeContext
+from .value_matrix import ValueMatrix
 
 
 class MatrixComputer:
@@ -16,7 +48,20 @@ class MatrixComputer:
     The service class to compute a similarity or dissimilarity matrix.
     """
 
-    def __init__(self, measure, gatherer, separator_token):
+    # the amount of values per side of a tile, if tiles are needed but no size is given
+    TILE_SIZE = 512
+
+    def __init__(
+        self,
+        measure,
+        gatherer,
+        separator_token,
+        tokenizer=None,
+        tile_size=None,
+        executor=None,
+        checkpoint_dir=None,
+        unknown="error",
+    ):
         """
         Initializes the *MatrixComputer*.
 
@@ -28,9 +73,37 @@ class MatrixComputer:
             If the specified measure can handle multiple values (forms of an attribute),
             the :class:`.IdentityGatherer` will be taken in any way.
         :param separator_token: A string for separating forms of categorical attributes.
+        :param tokenizer: An optional :class:`.Tokenizer` instance used to split the values into forms.
+            If ``None``, a *Tokenizer* with the ``separator_token`` is used.
+        :param tile_size: The amount of values per side of a tile of the matrix of the distinct values.
+            If ``None``, the matrix is computed at once, unless an ``executor`` or a ``checkpoint_dir``
+            is given, in which case ``TILE_SIZE`` is used.
+        :param executor: An optional ``concurrent.futures`` compatible executor the tiles are submitted to.
+            For process based executors, the *Measure*, the *Gatherer* and the *Tokenizer* need to be picklable.
+            If ``None``, the tiles are computed one after another.
+        :param checkpoint_dir: An optional directory, in which finished tiles are stored.
+            Each computation gets its own subdirectory with a manifest, see :meth:`compute_values`.
+            If it contains tiles of the same computation, only the missing tiles are computed.
+        :param unknown: The policy for forms that are not part of the *Context* of the *Measure*,
+            which can be ``error``, ``root`` or a fixed comparison value in :math:`[0,1]`.
+        :raise ValueError: The given policy does not exist.
         """
         self.__measure = measure
         self.__separator_token = separator_token
+        self.__tile_size = tile_size
+        self.__executor = executor
+        self.__checkpoint_dir = checkpoint_dir
+
+        if isinstance(unknown, bool) or (
+            not isinstance(unknown, (int, float)) and unknown not in ("error", "root")
+        ):
+            raise ValueError(f"An unknown value policy of type {unknown} does not exist.")
+        self.__unknown = unknown
+
+        if tokenizer is None:
+            self.__tokenizer = Tokenizer(separator_token)
+        else:
+            self.__tokenizer = tokenizer
 
         if self.__measure.can_handle_multiple_values():
             self.__gatherer = GathererFactory.create("id")
@@ -40,25 +113,425 @@ class MatrixComputer:
             else:
                 self.__gatherer = GathererFactory.create(gatherer)
 
-    def compute(self, data):
+    def __getstate__(self):
+        """
+        Returns the state of the *MatrixComputer* for pickling and copying.
+        The executor is excluded, since executors cannot be pickled.
+
+        :return: The state as dictionary.
+        """
+        state = self.__dict__.copy()
+        state["_MatrixComputer__executor"] = None
+
+        return state
+
+    def get_measure(self):
+        """
+        Returns the *Measure* of the *MatrixComputer*.
+
+        :return: The *Measure* instance.
+        """
+        return self.__measure
+
+    def get_tokenizer(self):
+        """
+        Returns the *Tokenizer* used to split the values into forms.
+
+        :return: The :class:`.Tokenizer` instance.
+        """
+        return self.__tokenizer
+
+    def is_tiled(self):
+        """
+        Checks whether the matrices are computed tile by tile, see :meth:`compute_values`.
+
+        :return: ``True`` if a tile size, an executor or a checkpoint directory is configured.
+        """
+        return (
+            self.__tile_size is not None
+            or self.__executor is not None
+            or self.__checkpoint_dir is not None
+        )
+
+    def compute(self, data, other=None, cancel_event=None):
         """
         Computes the similarity or dissimilarity matrix based on the given data.
+        Each distinct value is only compared once, see :meth:`compute_codes`.
 
         :param data: A single pandas series containing the data.
             Note, that each entry can have multiple values (the forms of an attribute),
             that are separated with the ``separator_token``.
+        :param other: An optional second pandas series.
+            If given, the rows of ``data`` are compared with the rows of ``other``,
+            otherwise the rows of ``data`` are compared with each other.
+        :param cancel_event: An optional ``threading.Event``.
+            If it is set, the computation stops before the next row.
+        :return: A 2D numpy array representing the similarity or dissimilarity matrix
+            of size :math:`n_1 \\times n_2`, with :math:`n_1` and :math:`n_2` being the
+            amount of rows of ``data`` and ``other``.
+        :raise CancelledError: The computation was cancelled using the ``cancel_event``.
+        """
+        return self.compute_value_matrix(data, other, cancel_event=cancel_event).expand()
+
+    def compute_value_matrix(self, data, other=None, cancel_event=None):
+        """
+        Computes the similarity or dissimilarity matrix based on the given data,
+        but keeps it in its compact form, i.e. as matrix of the distinct values and the codes of the rows.
+
+        :param data: A single pandas series containing the data.
+        :param other: An optional second pandas series, see :meth:`compute`.
+        :param cancel_event: An optional ``threading.Event``.
+            If it is set, the computation stops before the next value.
+        :return: The :class:`.ValueMatrix` of size :math:`n_1 \\times n_2`.
+        :raise CancelledError: The computation was cancelled using the ``cancel_event``.
+        """
+        codes, values = DataUtils.factorize(data)
+
+        if other is None:
+            value_matrix = self.compute_values(values, cancel_event=cancel_event)
+            return ValueMatrix(value_matrix, codes, codes)
+
+        other_codes, other_values = DataUtils.factorize(other)
+        value_matrix = self.compute_values(
+            values, other_values, cancel_event=cancel_event
+        )
+
+        return ValueMatrix(value_matrix, codes, other_codes)
+
+    def compute_codes(
+        self, codes, values, other_codes=None, other_values=None, cancel_event=None
+    ):
+        """
+        Computes the similarity or dissimilarity matrix based on integer-coded data.
+        The matrix of the distinct values is computed first and then expanded to all rows.
+
+        :param codes: The codes of the rows as 1D integer numpy array, referring to the ``values``.
+        :param values: The distinct values as 1D numpy array.
+            Note, that each value can consist of multiple forms of an attribute,
+            that are separated with the ``separator_token``.
+        :param other_codes: The optional codes of the rows to compare with, referring to the ``other_values``.
+            If ``None``, the rows are compared with each other.
+        :param other_values: The distinct values of the rows to compare with as 1D numpy array.
+        :param cancel_event: An optional ``threading.Event``.
+            If it is set, the computation stops before the next value.
         :return: A 2D numpy array representing the similarity or dissimilarity matrix.
+        :raise CancelledError: The computation was cancelled using the ``cancel_event``.
         """
-        n_samples = len(data)
-        matrix = np.zeros((n_samples, n_samples))
+        if other_codes is None:
+            value_matrix = self.compute_values(values, cancel_event=cancel_event)
+            return ValueMatrix(value_matrix, codes, codes).expand()
 
-        for i in range(0, n_samples):
-            for j in range(0, n_samples):
-                first = str(data[i])
-                first = first.split(self.__separator_token)
-                second = str(data[j])
-                second = second.split(self.__separator_token)
-                self.__gatherer.set_measure(self.__measure)
-                matrix[i, j] = self.__gatherer.gather(first, second)
+        value_matrix = self.compute_values(
+            values, other_values, cancel_event=cancel_event
+        )
+
+        return ValueMatrix(value_matrix, codes, other_codes).expand()
+
+    def compute_values(
+        self, values, other_values=None, cancel_event=None, unknown_forms=None
+    ):
+        """
+        Computes the similarity or dissimilarity matrix of the given distinct values.
+        The values are split into their forms in a single pass using the *Tokenizer*
+        and the *Gatherer* combines the forms of all pairs of values.
+        If a tile size, an executor or a checkpoint directory is configured, the matrix is computed tile by tile.
+        Each computation stores its tiles in a subdirectory of the checkpoint directory,
+        which is named by a fingerprint of the *Measure*, the *Gatherer*, the tile size and the values,
+        and contains a ``manifest.json`` describing the computation.
+
+        :param values: The distinct values as 1D numpy array.
+        :param other_values: The optional distinct values to compare with as 1D numpy array.
+            If ``None``, the ``values`` are compared with each other.
+        :param cancel_event: An optional ``threading.Event``.
+            If it is set, the computation stops before the next value or, if computed tile by tile,
+            before the next tile.
+        :param unknown_forms: The forms of both ``values`` and ``other_values``, which are compared
+            with the fixed value of the unknown value policy. If given, the values are expected to be
+            checked by :meth:`check_vocabulary` already, e.g. to report unknown values of all columns at once.
+            If ``None``, the values are checked here.
+        :return: A 2D numpy array of size :math:`u_1 \\times u_2`,
+            with :math:`u_1` and :math:`u_2` being the amount of values.
+        :raise CancelledError: The computation was cancelled using the ``cancel_event``.
+        :raise ValueError: A form is not part of the *Context* and the unknown value policy is ``error``.
+        """
+        self.__measure.share_cache()
+
+        if unknown_forms is None:
+            values, unknown_forms = self.check_vocabulary(values)
+            if other_values is not None:
+                other_values, other_unknown_forms = self.check_vocabulary(other_values)
+                unknown_forms = np.concatenate((unknown_forms, other_unknown_forms))
+
+        if len(unknown_forms) == 0:
+            gatherer = self.__gatherer
+            gatherer.set_measure(self.__measure)
+        else:
+            # the fixed value is scoped to this computation, the copies share the cache of the measure
+            measure = copy.copy(self.__measure)
+            measure.set_unknown_forms(unknown_forms, self.__unknown)
+            gatherer = copy.copy(self.__gatherer)
+            gatherer.set_measure(measure)
+
+        tile_size = self.__tile_size
+        if tile_size is None and self.is_tiled():
+            tile_size = self.TILE_SIZE
+
+        if tile_size is None:
+            return self._compute_tile(
+                gatherer, self.__tokenizer, values, other_values, cancel_event
+            )
+
+        return self.__compute_tiles(
+            gatherer, values, other_values, tile_size, cancel_event
+        )
+
+    def check_vocabulary(self, values):
+        """
+        Checks the forms of the given values against the concepts of the *Context* of the *Measure*
+        in a single pass and applies the unknown value policy.
+        It is called by :meth:`compute_values` before any comparison takes place, unless the values
+        were checked already.
+
+        :param values: The distinct values as 1D numpy array.
+        :return: A tuple of the values as 1D numpy array, in which unknown forms are replaced by the root
+            for the ``root`` policy, and the unknown forms as 1D numpy array,
+            which are compared with the fixed value for a fixed value policy and empty otherwise.
+        :raise ValueError: A form is not part of the *Context* and the policy is ``error``,
+            or the policy is ``root`` but the *Context* is not a *TreeContext*.
+        """
+        no_forms = np.zeros(0, dtype=object)
+        context = self.__measure.get_context()
+        if context is None or self.__measure.can_handle_multiple_values():
+            return values, no_forms
+
+        tokens = self.__tokenizer.tokenize(values)
+        forms = tokens.get_forms()
+        known = context.compile().isin(forms)
+        if known.all():
+            return values, no_forms
+
+        unknown_forms = forms[~known]
+        if self.__unknown == "error":
+            examples = ", ".join(str(form) for form in unknown_forms[:10])
+            raise ValueError(
+                f"{len(unknown_forms)} values are not part of the context {context.get_name()}: {examples}."
+            )
+
+        if self.__unknown != "root":
+            return values, np.asarray(unknown_forms, dtype=object)
+
+        if not isinstance(context, TreeContext):
+            raise ValueError("The unknown value policy root requires a TreeContext.")
+
+        mapped_forms = np.array(forms, dtype=object)
+        mapped_forms[~known] = context.get_root()
+        form_ids = tokens.get_form_ids()
+        offsets = tokens.get_offsets()
+        separator_token = self.__tokenizer.get_separator_token()
+
+        mapped_values = np.empty(len(values), dtype=object)
+        for i in range(0, len(values)):
+            value_forms = mapped_forms[form_ids[offsets[i] : offsets[i + 1]]]
+            mapped_values[i] = separator_token.join(str(form) for form in value_forms)
+
+        return mapped_values, no_forms
+
+    def __compute_tiles(self, gatherer, values, other_values, tile_size, cancel_event):
+        """
+        Computes the matrix of the distinct values tile by tile.
+        Tiles found in the checkpoint directory are loaded, the others are computed
+        using the executor and stored in the checkpoint directory as soon as they are finished.
+
+        :param gatherer: The *Gatherer* with the *Measure* of the computation already set.
+        :param values: The distinct values as 1D numpy array.
+        :param other_values: The optional distinct values to compare with as 1D numpy array.
+        :param tile_size: The amount of values per side of a tile.
+        :param cancel_event: An optional ``threading.Event``.
+            If it is set, no further tiles are started.
+        :return: A 2D numpy array of size :math:`u_1 \\times u_2`.
+        :raise CancelledError: The computation was cancelled using the ``cancel_event``.
+        """
+        symmetric = other_values is None
+        if symmetric:
+            other_values = values
+
+        row_starts = range(0, len(values), tile_size)
+        column_starts = range(0, len(other_values), tile_size)
+        matrix = np.zeros((len(values), len(other_values)))
+
+        directory = None
+        if self.__checkpoint_dir is not None:
+            directory = self.__prepare_checkpoint(
+                values, other_values, symmetric, tile_size
+            )
+
+        pending = []
+        for i in row_starts:
+            for j in column_starts:
+                tile = self.__load_tile(directory, i, j)
+                if tile is None:
+                    pending.append((i, j))
+                else:
+                    matrix[i : i + tile_size, j : j + tile_size] = tile
+
+        def finish(i, j, tile):
+            matrix[i : i + tile_size, j : j + tile_size] = tile
+            self.__store_tile(directory, i, j, tile)
+            return
+
+        if self.__executor is None:
+            for i, j in pending:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CancelledError()
+                tile = self._compute_tile(
+                    gatherer,
+                    self.__tokenizer,
+                    values[i : i + tile_size],
+                    other_values[j : j + tile_size],
+                )
+                finish(i, j, tile)
+
+            return matrix
+
+        futures = {}
+        for i, j in pending:
+            future = self.__executor.submit(
+                self._compute_tile,
+                gatherer,
+                self.__tokenizer,
+                values[i : i + tile_size],
+                other_values[j : j + tile_size],
+            )
+            futures[future] = (i, j)
+
+        try:
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CancelledError()
+                i, j = futures[future]
+                finish(i, j, future.result())
+        finally:
+            for future in futures:
+                future.cancel()
 
         return matrix
+
+    @staticmethod
+    def _compute_tile(gatherer, tokenizer, values, other_values=None, cancel_event=None):
+        """
+        Computes a tile of the matrix of the distinct values.
+        It is a static method, so it can be submitted to process based executors.
+
+        :param gatherer: The *Gatherer* with the *Measure* already set.
+        :param tokenizer: The *Tokenizer* used to split the values into their forms.
+        :param values: The distinct values of the rows of the tile as 1D numpy array.
+        :param other_values: The distinct values of the columns of the tile as 1D numpy array.
+            If ``None``, the ``values`` are compared with each other.
+        :param cancel_event: An optional ``threading.Event``.
+            If it is set, the computation stops before the next value.
+        :return: The tile as 2D numpy array.
+        :raise CancelledError: The computation was cancelled using the ``cancel_event``.
+        """
+        tokens = tokenizer.tokenize(values)
+        if other_values is None:
+            other_tokens = tokens
+        else:
+            other_tokens = tokenizer.tokenize(other_values)
+
+        return gatherer.gather_block(tokens, other_tokens, cancel_event=cancel_event)
+
+    def __prepare_checkpoint(self, values, other_values, symmetric, tile_size):
+        """
+        Creates the checkpoint directory of a computation, which is a subdirectory of the ``checkpoint_dir``
+        named by a fingerprint of everything the tiles depend on: the *Measure* and its parameters,
+        the content and the version of its *Context*, the *Gatherer*, the *Tokenizer*,
+        the unknown value policy, the tile size and the values.
+        This way, different computations, e.g. with new values to compare with or after the *Context* changed,
+        never mix their tiles.
+
+        :param values: The distinct values as 1D numpy array.
+        :param other_values: The distinct values to compare with as 1D numpy array.
+        :param symmetric: ``True`` if the values are compared with each other.
+        :param tile_size: The amount of values per side of a tile.
+        :return: The path of the checkpoint directory of the computation.
+        """
+        digest = hashlib.sha256()
+        for column in (values, other_values):
+            text, offsets = DataUtils.encode_strings([str(v) for v in column])
+            digest.update(text.tobytes())
+            digest.update(offsets.tobytes())
+
+        context = self.__measure.get_context()
+        if context is None:
+            context_description = None
+        else:
+            context_description = {
+                "fingerprint": context.get_fingerprint(),
+                "version": context.get_version(),
+            }
+
+        manifest = {
+            "measure": type(self.__measure).__name__,
+            "parameters": self.__measure._get_parameters(),
+            "context": context_description,
+            "gatherer": type(self.__gatherer).__name__,
+            "tokenizer": self.__tokenizer.get_parameters(),
+            "unknown": self.__unknown,
+            "shape": [len(values), len(other_values)],
+            "symmetric": symmetric,
+            "tile_size": tile_size,
+            "values": digest.hexdigest(),
+        }
+        fingerprint = hashlib.sha256(
+            json.dumps(manifest, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+        directory = os.path.join(self.__checkpoint_dir, fingerprint[:16])
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "manifest.json")
+        if not os.path.exists(path):
+            with open(path + ".tmp", "w") as file:
+                json.dump(manifest, file, default=str)
+            os.replace(path + ".tmp", path)
+
+        return directory
+
+    @staticmethod
+    def __load_tile(directory, i, j):
+        """
+        Loads a finished tile from the checkpoint directory.
+
+        :param directory: The checkpoint directory of the computation or ``None``.
+        :param i: The first row of the tile.
+        :param j: The first column of the tile.
+        :return: The tile as 2D numpy array or ``None``, if it was not finished yet.
+        """
+        if directory is None:
+            return None
+
+        path = os.path.join(directory, f"tile_{i}_{j}.npy")
+        if not os.path.exists(path):
+            return None
+
+        return np.load(path)
+
+    @staticmethod
+    def __store_tile(directory, i, j, tile):
+        """
+        Stores a finished tile in the checkpoint directory.
+        The tile is written to a temporary file first, so a tile is never stored partially.
+
+        :param directory: The checkpoint directory of the computation or ``None``.
+        :param i: The first row of the tile.
+        :param j: The first column of the tile.
+        :param tile: The tile as 2D numpy array.
+        """
+        if directory is None:
+            return
+
+        path = os.path.join(directory, f"tile_{i}_{j}.npy")
+        with open(path + ".tmp", "wb") as file:
+            np.save(file, tile)
+        os.replace(path + ".tmp", path)
+
+        return
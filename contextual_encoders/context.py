@@ -7,12 +7,24 @@ So far, two different Context-Types are implemented: :class:`.GraphContext` and
 However, it is very likely that custom context needs to be implemented.
 Therefore, the base classes :class:`.Context` and :class:`.GraphBasedContext` are used,
 that come with optimized in- and export functions as well as caching.
+
+Each modification of a *Context* increments its version and is recorded in a change log,
+together with the concepts it affects. A :class:`.Measure` compares the version with the one of its
+cached values and only discards the values of pairs containing an affected concept,
+see :meth:`Context.get_changes`.
 """
 
 from abc import ABC, abstractmethod
 import networkx as nx
+import numpy as np
+import pandas as pd
+import hashlib
 import json
 import matplotlib.pyplot as plt
+from scipy.sparse import csr_matrix
+from .data_utils import DataUtils
+from .oracle import LandmarkDistanceOracle
+from .registry import CacheRegistry
 
 
 class Context(ABC):
@@ -20,6 +32,9 @@ class Context(ABC):
     The abstract base class for all *Context*.
     """
 
+    # the amount of changes kept in the change log, older versions are considered as entirely changed
+    CHANGE_LOG_SIZE = 1024
+
     def __init__(self, name):
         """
         Initializes the *Context*.
@@ -27,6 +42,72 @@ class Context(ABC):
         :param name: The name of the *Context*.
         """
         self._name = name
+        self.__version = 0
+        self.__changes = []
+
+        return
+
+    def get_name(self):
+        """
+        Returns the name of the *Context*.
+
+        :return: The name.
+        """
+        return self._name
+
+    def get_version(self):
+        """
+        Returns the version of the *Context*, which is incremented by each modification.
+
+        :return: The version as integer.
+        """
+        return self.__version
+
+    def get_changes(self, version):
+        """
+        Returns the concepts whose comparison values might have changed since the given version.
+
+        :param version: A previous version, see :meth:`get_version`.
+        :return: A frozenset of the affected concepts or ``None``, if all concepts are affected,
+            e.g. because a change affects the whole *Context* or is not part of the change log anymore.
+        """
+        if version == self.__version:
+            return frozenset()
+        if version > self.__version or self.__changes[0][0] > version + 1:
+            return None
+
+        concepts = set()
+        for change_version, change in self.__changes:
+            if change_version <= version:
+                continue
+            if change is None:
+                return None
+            concepts.update(change)
+
+        return self._expand_changes(concepts)
+
+    def _expand_changes(self, concepts):
+        """
+        Extends the changed concepts by the concepts depending on them, e.g. their descendants.
+        *Contexts* with such dependencies override this method.
+
+        :param concepts: A set of changed concepts.
+        :return: A frozenset of the affected concepts.
+        """
+        return frozenset(concepts)
+
+    def _record_change(self, concepts=None):
+        """
+        Increments the version and records a change in the change log.
+        This method needs to be called whenever the *Context* is modified.
+
+        :param concepts: The changed concepts or ``None``, if the whole *Context* changed.
+        """
+        self.__version += 1
+        self.__changes.append(
+            (self.__version, None if concepts is None else frozenset(concepts))
+        )
+        del self.__changes[: -self.CHANGE_LOG_SIZE]
 
         return
 
@@ -61,7 +142,129 @@ class GraphBasedContext(Context):
         :param name: The name of the *Context*.
         """
         super().__init__(name)
-        self._graph = nx.DiGraph()
+        self.__graph = nx.DiGraph()
+        self._indexes = dict()
+
+        return
+
+    @property
+    def _graph(self):
+        """
+        The networkx DiGraph instance.
+        After importing a binary file, it is created from the :class:`.CompiledGraph` on the first access.
+        """
+        if self.__graph is None:
+            self.__graph = self._indexes["graph"].to_networkx()
+
+        return self.__graph
+
+    @_graph.setter
+    def _graph(self, graph):
+        self.__graph = graph
+
+    @classmethod
+    def from_edge_list(cls, name, edges):
+        """
+        Creates a *Context* from a list of edges in a single pass, see :meth:`add_concepts`.
+
+        :param name: The name of the *Context*.
+        :param edges: An iterable of tuples ``(first, second)`` or ``(first, second, weight)``.
+        :return: The *Context* instance.
+        """
+        context = cls(name)
+        context.add_concepts(edges)
+
+        return context
+
+    @classmethod
+    def from_dataframe(cls, name, df, first, second, weight=None):
+        """
+        Creates a *Context* from the edges given as rows of a pandas DataFrame in a single pass.
+
+        :param name: The name of the *Context*.
+        :param df: The pandas DataFrame.
+        :param first: The column of the first concepts of the edges, i.e. the nodes of a :class:`.GraphContext`
+            or the children of a :class:`.TreeContext`.
+        :param second: The column of the second concepts of the edges, i.e. the neighbors or the parents.
+        :param weight: The optional column of the weights. If ``None``, all edges get the weight one.
+        :return: The *Context* instance.
+        """
+        if weight is None:
+            weights = np.ones(len(df))
+        else:
+            weights = df[weight].to_numpy(dtype=np.float64)
+
+        context = cls(name)
+        context._add_edges(
+            df[first].to_numpy(dtype=object), df[second].to_numpy(dtype=object), weights
+        )
+
+        return context
+
+    def add_concepts(self, edges):
+        """
+        Adds many concepts at once, which is much faster than calling ``add_concept`` for each edge.
+        If an edge is given more than once, the last weight is used.
+
+        :param edges: An iterable of tuples ``(first, second)`` or ``(first, second, weight)``,
+            with the same meaning as the parameters of ``add_concept``.
+        """
+        frame = pd.DataFrame.from_records(list(edges))
+        if len(frame) == 0:
+            return
+
+        if frame.shape[1] > 2:
+            weights = frame[2].fillna(1.0).to_numpy(dtype=np.float64)
+        else:
+            weights = np.ones(len(frame))
+
+        self._add_edges(
+            frame[0].to_numpy(dtype=object),
+            frame[1].to_numpy(dtype=object) if frame.shape[1] > 1 else None,
+            weights,
+        )
+
+        return
+
+    @abstractmethod
+    def _add_edges(self, first, second, weights):
+        """
+        Adds the given edges in a single pass.
+        This method is implemented by concrete instances of *GraphBasedContexts*.
+
+        :param first: The first concepts of the edges as 1D numpy array.
+        :param second: The second concepts of the edges as 1D numpy array, which may contain ``None``.
+        :param weights: The weights of the edges as 1D numpy array.
+        """
+        pass
+
+    @staticmethod
+    def _deduplicate_edges(sources, targets, weights):
+        """
+        Removes repeated edges, keeping the last weight of each edge.
+
+        :param sources: The source concepts of the edges as 1D numpy array.
+        :param targets: The target concepts of the edges as 1D numpy array.
+        :param weights: The weights of the edges as 1D numpy array.
+        :return: A tuple of the sources, targets and weights without repetitions.
+        """
+        edges = pd.DataFrame({"source": sources, "target": targets})
+        keep = ~edges.duplicated(keep="last").to_numpy()
+
+        return sources[keep], targets[keep], weights[keep]
+
+    def _invalidate(self, concepts=None):
+        """
+        Discards all compiled indexes of the graph and records the change, see :meth:`get_changes`.
+        This method needs to be called whenever the graph is modified.
+
+        :param concepts: The changed concepts or ``None``, if comparisons of all concepts might change.
+        """
+        self._record_change(concepts)
+        if self.__graph is None:
+            self.__graph = self._indexes["graph"].to_networkx()
+        # the indexes might be shared with other contexts, see get_fingerprint
+        self._indexes = dict()
 
         return
 
@@ -83,10 +286,87 @@ class GraphBasedContext(Context):
         :param path: The path to import the graph from.
         """
         with open(path, "r") as file:
-            self._graph = nx.readwrite.json_graph.node_link_data(json.load(file))
+            graph = nx.readwrite.json_graph.node_link_graph(json.load(file))
+        self._record_change()
+        self._indexes = dict()
+        self._graph = graph
 
         return
 
+    def export_to_binary(self, path):
+        """
+        Exports the compiled graph to the given file path in a compact binary format.
+        The file contains the names of the nodes and the arrays of the compiled indexes,
+        see :meth:`.DataUtils.write_arrays`. Unlike :meth:`export_to_file`, node names need to be strings
+        or JSON-serializable and other attributes than the weights of the edges are not exported.
+
+        :param path: The path to export the graph to.
+        """
+        nodes, arrays = self._export_arrays()
+        metadata = {"type": type(self).__name__, "name": self._name}
+
+        if all(isinstance(node, str) for node in nodes):
+            arrays["node_text"], arrays["node_offsets"] = DataUtils.encode_strings(nodes)
+        else:
+            metadata["nodes"] = list(nodes)
+
+        DataUtils.write_arrays(path, metadata, arrays)
+
+        return
+
+    def import_from_binary(self, path, mmap=True):
+        """
+        Imports the graph from a binary file created by :meth:`export_to_binary`.
+        The compiled indexes are restored from the file, while the networkx DiGraph is only created
+        when it is accessed, e.g. by adding concepts or by measures that work on the graph.
+
+        :param path: The path to import the graph from.
+        :param mmap: If ``True``, the arrays are memory-mapped read-only,
+            so that processes loading the same file share its memory.
+        :raise ValueError: The file was exported from a different type of *Context*.
+        """
+        metadata, arrays = DataUtils.read_arrays(path, mmap=mmap)
+        if metadata["type"] != type(self).__name__:
+            raise ValueError(
+                f"The file {path} contains a {metadata['type']}, not a {type(self).__name__}."
+            )
+
+        if "nodes" in metadata:
+            nodes = np.empty(len(metadata["nodes"]), dtype=object)
+            nodes[:] = metadata["nodes"]
+        else:
+            nodes = DataUtils.decode_strings(arrays["node_text"], arrays["node_offsets"])
+
+        self._name = metadata["name"]
+        self._record_change()
+        self._indexes = dict()
+        self._import_arrays(nodes, arrays)
+        self.__graph = None
+
+        return
+
+    @abstractmethod
+    def _export_arrays(self):
+        """
+        Returns the arrays of the compiled indexes to export.
+        This method is implemented by concrete instances of *GraphBasedContexts*.
+
+        :return: A tuple of the names of the nodes and a dictionary of numpy arrays.
+        """
+        pass
+
+    @abstractmethod
+    def _import_arrays(self, nodes, arrays):
+        """
+        Restores the compiled indexes from the imported arrays.
+        This method is implemented by concrete instances of *GraphBasedContexts*.
+        It needs to restore at least the :class:`.CompiledGraph`.
+
+        :param nodes: The names of the nodes as 1D numpy array.
+        :param arrays: A dictionary of numpy arrays, see :meth:`_export_arrays`.
+        """
+        pass
+
     def get_graph(self):
         """
         Returns the networkx DiGraph instance.
@@ -95,6 +375,67 @@ class GraphBasedContext(Context):
         """
         return self._graph
 
+    def compile(self):
+        """
+        Returns the compiled :class:`.CompiledGraph` of the graph.
+        It is built on the first call and kept until the graph is modified.
+
+        :return: The *CompiledGraph* instance.
+        """
+        if "graph" not in self._indexes:
+            self._indexes["graph"] = CompiledGraph.from_graph(self._graph)
+
+        return self._indexes["graph"]
+
+    def get_fingerprint(self):
+        """
+        Returns a deterministic fingerprint of the *Context*, i.e. a hash of its type, its name and its graph.
+        On the first call, the compiled indexes are registered in the :class:`.CacheRegistry`,
+        so that all *Contexts* with the same fingerprint share them and build them only once.
+        The fingerprint is kept until the graph is modified.
+
+        :return: The fingerprint as hexadecimal string.
+        """
+        if "fingerprint" not in self._indexes:
+            compiled_graph = self.compile()
+            text, offsets = DataUtils.encode_strings(
+                [str(node) for node in compiled_graph.get_nodes()]
+            )
+
+            digest = hashlib.sha256()
+            digest.update(f"{type(self).__name__}:{self._name}".encode("utf-8"))
+            for array in (
+                text,
+                offsets,
+                compiled_graph.get_indptr(),
+                compiled_graph.get_indices(),
+                compiled_graph.get_weights(),
+            ):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            fingerprint = digest.hexdigest()
+
+            indexes = self._indexes
+            shared = CacheRegistry.get(("context", fingerprint), lambda: indexes)
+            for key, value in indexes.items():
+                shared.setdefault(key, value)
+            shared["fingerprint"] = fingerprint
+            self._indexes = shared
+
+        return self._indexes["fingerprint"]
+
+    def freeze(self):
+        """
+        Compiles the indexes of the graph and releases the networkx DiGraph,
+        so that the *Context* only consists of numpy arrays and the names of the nodes.
+        A frozen *Context* is cheap to save or to share between processes,
+        see :meth:`.DataUtils.share_object`.
+        The DiGraph is recreated from the :class:`.CompiledGraph` when it is accessed again.
+        """
+        self.compile()
+        self.__graph = None
+
+        return
+
     def draw(self):
         """
         Draws the graph using matplotlib.
@@ -112,6 +453,82 @@ class GraphContext(GraphBasedContext):
     A graph based Context than can be used for graph based measures.
     """
 
+    def __init__(self, name):
+        """
+        Initializes the *GraphContext*.
+
+        :param name: The name of the *Context*.
+        """
+        super().__init__(name)
+        self._oracle_parameters = None
+
+        return
+
+    def set_distance_oracle(
+        self,
+        n_landmarks=16,
+        exact=True,
+        selection="degree",
+        weighted=False,
+        random_state=None,
+    ):
+        """
+        Enables answering distance queries with a :class:`.LandmarkDistanceOracle`
+        instead of searching the graph for each pair, e.g. for graphs with millions of nodes.
+        The oracle is built on the first query and rebuilt after the graph has been modified.
+
+        :param n_landmarks: The amount of landmark nodes.
+        :param exact: If ``True``, distances are exact. If ``False``, the landmark upper bound is used.
+        :param selection: The selection of the landmarks, which can be ``degree`` or ``random``.
+        :param weighted: If ``True``, the weights of the edges are used, otherwise the edges are counted.
+        :param random_state: The seed used for the ``random`` selection.
+        """
+        self._oracle_parameters = dict(
+            n_landmarks=n_landmarks,
+            exact=exact,
+            selection=selection,
+            weighted=weighted,
+            random_state=random_state,
+        )
+
+        return
+
+    def get_distance_oracle_parameters(self):
+        """
+        Returns the parameters of the distance oracle, see :meth:`set_distance_oracle`.
+
+        :return: A dictionary of the parameters or ``None``, if the oracle is not enabled.
+        """
+        return self._oracle_parameters
+
+    def get_distance_oracle(self):
+        """
+        Returns the :class:`.LandmarkDistanceOracle` of the graph, if enabled with :meth:`set_distance_oracle`.
+
+        :return: The *LandmarkDistanceOracle* instance or ``None``, if it is not enabled.
+        """
+        if self._oracle_parameters is None:
+            return None
+
+        # the indexes might be shared with contexts using other parameters, see get_fingerprint
+        key = "oracle:" + json.dumps(self._oracle_parameters, sort_keys=True)
+        if key not in self._indexes:
+            self._indexes[key] = LandmarkDistanceOracle(
+                self.compile(), **self._oracle_parameters
+            )
+
+        return self._indexes[key]
+
+    def freeze(self):
+        """
+        Compiles the indexes of the graph, including the distance oracle if enabled,
+        and releases the networkx DiGraph, see :meth:`.GraphBasedContext.freeze`.
+        """
+        self.get_distance_oracle()
+        super().freeze()
+
+        return
+
     def add_concept(self, node, neighbor=None, weight=1.0):
         """
         Adds a new node to the graph.
@@ -122,6 +539,21 @@ class GraphContext(GraphBasedContext):
         :param neighbor: The name of the neighbor node.
         :param weight: The wight of the edge between the node and the neighbor.
         """
+        # a new node with a single edge does not change the distances of the other nodes
+        if (
+            neighbor is not None
+            and self._graph.has_node(node)
+            and self._graph.has_node(neighbor)
+        ):
+            concepts = None
+        else:
+            concepts = {
+                c
+                for c in (node, neighbor)
+                if c is not None and not self._graph.has_node(c)
+            }
+        self._invalidate(concepts)
+
         if not self._graph.has_node(node):
             self._graph.add_node(node)
 
@@ -136,6 +568,64 @@ class GraphContext(GraphBasedContext):
 
         return
 
+    def _add_edges(self, nodes, neighbors, weights):
+        """
+        Adds the given edges in a single pass.
+        Nodes without a neighbor are added as single nodes.
+        If the graph was empty, the :class:`.CompiledGraph` is created directly from the edges.
+
+        :param nodes: The nodes as 1D numpy array.
+        :param neighbors: The neighbors of the nodes as 1D numpy array, which may contain ``None``.
+        :param weights: The weights of the edges as 1D numpy array.
+        """
+        was_empty = self._graph.number_of_nodes() == 0
+        self._invalidate()
+
+        if neighbors is None:
+            neighbors = np.full(len(nodes), None, dtype=object)
+        has_neighbor = ~pd.isna(neighbors)
+        sources, targets, weights = self._deduplicate_edges(
+            nodes[has_neighbor], neighbors[has_neighbor], weights[has_neighbor]
+        )
+
+        self._graph.add_nodes_from(nodes)
+        self._graph.add_weighted_edges_from(zip(sources, targets, weights.tolist()))
+
+        if was_empty:
+            self._indexes["graph"] = CompiledGraph.from_edges(
+                list(self._graph.nodes()), sources, targets, weights
+            )
+
+        return
+
+    def _export_arrays(self):
+        """
+        Returns the CSR arrays of the :class:`.CompiledGraph` to export.
+
+        :return: A tuple of the names of the nodes and a dictionary of numpy arrays.
+        """
+        compiled_graph = self.compile()
+        arrays = {
+            "indptr": compiled_graph.get_indptr(),
+            "indices": compiled_graph.get_indices(),
+            "weights": compiled_graph.get_weights(),
+        }
+
+        return compiled_graph.get_nodes(), arrays
+
+    def _import_arrays(self, nodes, arrays):
+        """
+        Restores the :class:`.CompiledGraph` from the imported arrays.
+
+        :param nodes: The names of the nodes as 1D numpy array.
+        :param arrays: A dictionary of numpy arrays, see :meth:`_export_arrays`.
+        """
+        self._indexes["graph"] = CompiledGraph(
+            nodes, arrays["indptr"], arrays["indices"], arrays["weights"]
+        )
+
+        return
+
 
 # noinspection DuplicatedCode
 class TreeContext(GraphBasedContext):
@@ -157,6 +647,14 @@ class TreeContext(GraphBasedContext):
         if parent is None:
             parent = self._name
 
+        # a new leaf is appended to the index, instead of rebuilding it
+        index = self._indexes.get("tree")
+        new_leaf = not self._graph.has_node(child) and self._graph.has_node(parent)
+        if self._graph.has_node(parent):
+            self._invalidate({child})
+        else:
+            self._invalidate({child, parent})
+
         if not self._graph.has_node(parent):
             self._graph.add_node(parent)
         if not self._graph.has_node(child):
@@ -167,8 +665,151 @@ class TreeContext(GraphBasedContext):
             self._graph.remove_edge(parent, child)
             self._graph.add_edge(parent, child, weight=weight)
 
+        if index is not None and new_leaf and index.contains(parent):
+            self._indexes["tree"] = index.add_leaf(child, parent)
+
+        return
+
+    @classmethod
+    def from_dataframe(cls, name, df, child, parent, weight=None):
+        """
+        Creates a *TreeContext* from the edges given as rows of a pandas DataFrame in a single pass.
+        The tree is validated and its :class:`.TreeIndex` is created directly.
+
+        :param name: The name of the *TreeContext*, which serves as root node.
+        :param df: The pandas DataFrame.
+        :param child: The column of the child nodes.
+        :param parent: The column of the parent nodes. Missing parents are replaced by the root.
+        :param weight: The optional column of the weights. If ``None``, all edges get the weight one.
+        :return: The *TreeContext* instance.
+        :raise ValueError: The edges do not form a tree rooted at the name of the context.
+        """
+        return super().from_dataframe(name, df, child, parent, weight)
+
+    def _add_edges(self, children, parents, weights):
+        """
+        Adds the given edges in a single pass.
+        Before the tree is modified, the new edges and the existing ones are validated
+        with vectorized operations and the :class:`.TreeIndex` is created directly.
+
+        :param children: The child nodes as 1D numpy array.
+        :param parents: The parent nodes as 1D numpy array, which may contain ``None`` for the root.
+        :param weights: The weights of the edges as 1D numpy array.
+        :raise ValueError: The edges do not form a tree rooted at the name of the context.
+        """
+        if parents is None:
+            parents = np.full(len(children), self._name, dtype=object)
+        else:
+            parents = np.where(pd.isna(parents), self._name, parents)
+
+        existing = list(self._graph.edges())
+        sources = np.empty(len(existing) + len(parents), dtype=object)
+        targets = np.empty(len(existing) + len(children), dtype=object)
+        sources[: len(existing)] = [edge[0] for edge in existing]
+        targets[: len(existing)] = [edge[1] for edge in existing]
+        sources[len(existing) :] = parents
+        targets[len(existing) :] = children
+        sources, targets, _ = self._deduplicate_edges(
+            sources, targets, np.zeros(len(sources))
+        )
+
+        index = TreeIndex.from_edges(sources, targets, self._name)
+
+        self._invalidate(children.tolist())
+        self._graph.add_node(self._name)
+        self._graph.add_weighted_edges_from(zip(parents, children, weights.tolist()))
+        self._indexes["tree"] = index
+
+        return
+
+    def _export_arrays(self):
+        """
+        Returns the arrays of the :class:`.TreeIndex` and the weights of the edges to export.
+        The edges are given by the parents, so the :class:`.CompiledGraph` does not need to be stored.
+
+        :return: A tuple of the names of the nodes and a dictionary of numpy arrays.
+        """
+        index = self.get_index()
+        nodes = index.get_nodes()
+        parents = index.get_parents()
+
+        weights = np.ones(len(nodes))
+        for i in range(1, len(nodes)):
+            weights[i] = self._graph[nodes[parents[i]]][nodes[i]].get("weight", 1.0)
+
+        arrays = {
+            "parents": parents,
+            "depths": index.get_depths(),
+            "preorder": index.get_preorder(),
+            "sizes": index.get_subtree_sizes(),
+            "weights": weights,
+        }
+
+        return nodes, arrays
+
+    def _import_arrays(self, nodes, arrays):
+        """
+        Restores the :class:`.TreeIndex` and the :class:`.CompiledGraph` from the imported arrays.
+
+        :param nodes: The names of the nodes as 1D numpy array.
+        :param arrays: A dictionary of numpy arrays, see :meth:`_export_arrays`.
+        """
+        parents = arrays["parents"]
+        self._indexes["tree"] = TreeIndex(
+            nodes, parents, arrays["depths"], arrays["preorder"], arrays["sizes"]
+        )
+
+        children = np.argsort(parents[1:], kind="stable") + 1
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(parents[1:], minlength=len(nodes)), out=indptr[1:])
+        self._indexes["graph"] = CompiledGraph(
+            nodes, indptr, children.astype(np.int32), arrays["weights"][children]
+        )
+
         return
 
+    def freeze(self):
+        """
+        Compiles the :class:`.TreeIndex` and the :class:`.CompiledGraph`
+        and releases the networkx DiGraph, see :meth:`.GraphBasedContext.freeze`.
+
+        :raise ValueError: The graph is not a tree rooted at the name of the context.
+        """
+        self.get_index()
+        super().freeze()
+
+        return
+
+    def _expand_changes(self, concepts):
+        """
+        Extends the changed concepts by their subtrees, since moving or adding a concept
+        changes the depths of all its descendants.
+
+        :param concepts: A set of changed concepts.
+        :return: A frozenset of the affected concepts.
+        """
+        try:
+            index = self.get_index()
+        except ValueError:
+            # without a valid tree, the descendants are taken from the graph
+            affected = set(concepts)
+            for concept in concepts:
+                if concept in self._graph:
+                    affected.update(nx.descendants(self._graph, concept))
+            return frozenset(affected)
+
+        ids = index.get_ids([concept for concept in concepts if index.contains(concept)])
+        preorder = index.get_preorder()
+        sizes = index.get_subtree_sizes()
+
+        # each subtree is a contiguous range of the preorder
+        marks = np.zeros(len(index) + 1, dtype=np.int64)
+        np.add.at(marks, preorder[ids], 1)
+        np.add.at(marks, preorder[ids] + sizes[ids], -1)
+        covered = np.cumsum(marks[:-1]) > 0
+
+        return frozenset(index.get_nodes()[covered[preorder]]).union(concepts)
+
     def get_tree(self):
         """
         Returns the networkx DiGraph instance.
@@ -184,3 +825,578 @@ class TreeContext(GraphBasedContext):
         :return: The name of the root.
         """
         return self._name
+
+    def get_index(self):
+        """
+        Returns the compiled :class:`.TreeIndex` of the tree.
+        The index is built on the first call and kept until the tree is modified.
+
+        :return: The *TreeIndex* instance.
+        :raise ValueError: The graph is not a tree rooted at the name of the context.
+        """
+        if "tree" not in self._indexes:
+            self._indexes["tree"] = TreeIndex.from_graph(self._graph, self._name)
+
+        return self._indexes["tree"]
+
+
+class CompiledGraph:
+    """
+    A compiled, array based representation of a directed graph.
+    The edges are stored as adjacency matrix in the compressed sparse row (CSR) format.
+    """
+
+    def __init__(self, nodes, indptr, indices, weights):
+        """
+        Initializes the *CompiledGraph*.
+
+        :param nodes: The names of the nodes as 1D numpy array.
+        :param indptr: The CSR offsets of the edges of each node as 1D integer numpy array of size :math:`N + 1`.
+        :param indices: The ids of the target nodes of the edges as 1D integer numpy array.
+        :param weights: The weights of the edges as 1D numpy array.
+        """
+        self.__nodes = nodes
+        self.__node_ids = None
+        self.__indptr = indptr
+        self.__indices = indices
+        self.__weights = weights
+
+        return
+
+    @staticmethod
+    def from_graph(graph):
+        """
+        Creates a *CompiledGraph* from a networkx DiGraph.
+        Edges without a weight get the weight one.
+
+        :param graph: The networkx DiGraph instance.
+        :return: The *CompiledGraph* instance.
+        """
+        edges = list(graph.edges(data="weight", default=1.0))
+        sources = np.empty(len(edges), dtype=object)
+        targets = np.empty(len(edges), dtype=object)
+        weights = np.zeros(len(edges))
+        for i, (source, target, weight) in enumerate(edges):
+            sources[i] = source
+            targets[i] = target
+            weights[i] = weight
+
+        return CompiledGraph.from_edges(list(graph.nodes()), sources, targets, weights)
+
+    @staticmethod
+    def from_edges(nodes, sources, targets, weights):
+        """
+        Creates a *CompiledGraph* from arrays of edges.
+
+        :param nodes: The names of all nodes as list.
+        :param sources: The names of the source nodes of the edges as 1D numpy array.
+        :param targets: The names of the target nodes of the edges as 1D numpy array.
+        :param weights: The weights of the edges as 1D numpy array.
+        :return: The *CompiledGraph* instance.
+        """
+        names = np.empty(len(nodes), dtype=object)
+        names[:] = nodes
+        node_index = pd.Index(names, tupleize_cols=False)
+        source_ids = node_index.get_indexer(sources)
+        target_ids = node_index.get_indexer(targets).astype(np.int32)
+
+        order = np.argsort(source_ids, kind="stable")
+        indptr = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source_ids, minlength=len(names)), out=indptr[1:])
+
+        return CompiledGraph(
+            names, indptr, target_ids[order], np.asarray(weights, dtype=np.float64)[order]
+        )
+
+    def __len__(self):
+        """
+        Returns the amount of nodes.
+
+        :return: The amount of nodes.
+        """
+        return len(self.__nodes)
+
+    def get_nodes(self):
+        """
+        Returns the names of the nodes.
+
+        :return: The names as 1D numpy array.
+        """
+        return self.__nodes
+
+    def get_indptr(self):
+        """
+        Returns the CSR offsets of the edges of each node.
+
+        :return: The offsets as 1D numpy array.
+        """
+        return self.__indptr
+
+    def get_indices(self):
+        """
+        Returns the ids of the target nodes of the edges.
+
+        :return: The ids as 1D numpy array.
+        """
+        return self.__indices
+
+    def get_weights(self):
+        """
+        Returns the weights of the edges.
+
+        :return: The weights as 1D numpy array.
+        """
+        return self.__weights
+
+    def get_ids(self, names):
+        """
+        Returns the ids of the given nodes.
+
+        :param names: A sequence of node names.
+        :return: The ids as 1D numpy array.
+        :raise ValueError: A node does not exist.
+        """
+        if self.__node_ids is None:
+            self.__node_ids = {node: i for i, node in enumerate(self.__nodes)}
+
+        try:
+            return np.array([self.__node_ids[name] for name in names], dtype=np.int64)
+        except KeyError as error:
+            raise ValueError(f"The concept {error.args[0]} does not exist.")
+
+    def contains(self, name):
+        """
+        Checks whether the given node exists.
+
+        :param name: The name of the node.
+        :return: ``True`` if the node exists.
+        """
+        if self.__node_ids is None:
+            self.__node_ids = {node: i for i, node in enumerate(self.__nodes)}
+
+        return name in self.__node_ids
+
+    def isin(self, names):
+        """
+        Checks for each of the given names whether the node exists, in a single vectorized pass.
+
+        :param names: A sequence of node names.
+        :return: A 1D boolean numpy array.
+        """
+        nodes = pd.Index(self.__nodes, tupleize_cols=False)
+        names = pd.Index(np.asarray(names, dtype=object), tupleize_cols=False)
+
+        return names.isin(nodes)
+
+    def to_networkx(self):
+        """
+        Creates a networkx DiGraph of the compiled graph.
+
+        :return: The networkx DiGraph instance.
+        """
+        sources = np.repeat(self.__nodes, np.diff(self.__indptr))
+        targets = self.__nodes[self.__indices]
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.__nodes)
+        graph.add_weighted_edges_from(zip(sources, targets, self.__weights.tolist()))
+
+        return graph
+
+    def to_sparse(self, undirected=False, weighted=True):
+        """
+        Returns the adjacency matrix as scipy sparse matrix.
+
+        :param undirected: If ``True``, the adjacency matrix is symmetrized.
+            For edges in both directions, the smaller weight is used.
+        :param weighted: If ``False``, all edges get the weight one.
+        :return: The adjacency matrix as ``scipy.sparse.csr_matrix``.
+        """
+        if weighted:
+            weights = self.__weights
+        else:
+            weights = np.ones(len(self.__indices))
+
+        n_nodes = len(self.__nodes)
+        if not undirected:
+            return csr_matrix(
+                (weights, self.__indices, self.__indptr), shape=(n_nodes, n_nodes)
+            )
+
+        sources = np.repeat(np.arange(n_nodes), np.diff(self.__indptr))
+        rows = np.concatenate((sources, self.__indices))
+        columns = np.concatenate((self.__indices, sources))
+        weights = np.concatenate((weights, weights))
+
+        # keep the smallest weight of each pair of nodes
+        order = np.lexsort((weights, columns, rows))
+        rows = rows[order]
+        columns = columns[order]
+        weights = weights[order]
+        keep = np.ones(len(rows), dtype=bool)
+        keep[1:] = (rows[1:] != rows[:-1]) | (columns[1:] != columns[:-1])
+
+        return csr_matrix(
+            (weights[keep], (rows[keep], columns[keep])), shape=(n_nodes, n_nodes)
+        )
+
+
+class TreeIndex:
+    """
+    A compiled, array based representation of a tree.
+    The nodes are numbered in breadth-first order, starting with the root.
+    The index answers lowest common ancestor queries in constant time using a sparse table
+    over the Euler tour of the tree.
+    """
+
+    def __init__(self, nodes, parents, depths=None, preorder=None, sizes=None):
+        """
+        Initializes the *TreeIndex*.
+
+        :param nodes: The names of the nodes as 1D numpy array.
+        :param parents: The id of the parent of each node as 1D integer numpy array, with ``-1`` for the root.
+            Parents need to have a smaller id than their children, i.e. the nodes need to be
+            in breadth-first or depth-first order.
+        :param depths: The optional depths of the nodes as 1D integer numpy array.
+            If ``None``, the depths are calculated from the parents.
+        :param preorder: The optional preorder positions of the nodes as 1D integer numpy array,
+            see :meth:`get_preorder`. If ``None``, they are calculated from the parents.
+        :param sizes: The optional subtree sizes of the nodes as 1D integer numpy array,
+            see :meth:`get_subtree_sizes`. Needs to be given together with ``preorder``.
+        """
+        self.__nodes = nodes
+        self.__node_ids = None
+        self.__parents = parents
+        self.__preorder = preorder
+        self.__sizes = sizes
+
+        n_nodes = len(nodes)
+        if depths is None:
+            depths = np.zeros(n_nodes, dtype=np.int32)
+            for i in range(1, n_nodes):
+                depths[i] = depths[parents[i]] + 1
+        self.__depths = np.asarray(depths, dtype=np.int32)
+
+        self.__build_euler_tour()
+
+        return
+
+    @staticmethod
+    def from_graph(graph, root):
+        """
+        Creates a *TreeIndex* from a networkx DiGraph, with the edges pointing from the parents to the children.
+
+        :param graph: The networkx DiGraph instance.
+        :param root: The name of the root node.
+        :return: The *TreeIndex* instance.
+        :raise ValueError: The graph is not a tree rooted at ``root``.
+        """
+        if not graph.has_node(root):
+            return TreeIndex(np.array([root], dtype=object), np.array([-1]))
+
+        nodes = [root]
+        parents = [-1]
+        for parent, child in nx.bfs_edges(graph, root):
+            nodes.append(child)
+            parents.append(-1)
+
+        node_ids = {node: i for i, node in enumerate(nodes)}
+        if len(nodes) != graph.number_of_nodes():
+            raise ValueError(f"Not all concepts of the tree are reachable from {root}.")
+
+        for parent, child in graph.edges():
+            if parents[node_ids[child]] != -1 or child == root:
+                raise ValueError(f"The concept {child} has more than one parent.")
+            parents[node_ids[child]] = node_ids[parent]
+
+        return TreeIndex(np.array(nodes, dtype=object), np.array(parents))
+
+    @staticmethod
+    def from_edges(parents, children, root):
+        """
+        Creates a *TreeIndex* from arrays of edges using vectorized operations only.
+        The depths are calculated by pointer doubling, which needs :math:`\\log_2(N)` steps.
+        A node that does not reach the root within these steps lies on a cycle.
+
+        :param parents: The names of the parent nodes of the edges as 1D numpy array.
+        :param children: The names of the child nodes of the edges as 1D numpy array.
+        :param root: The name of the root node.
+        :return: The *TreeIndex* instance.
+        :raise ValueError: The edges do not form a tree rooted at ``root``.
+        """
+        names = np.empty(len(parents) + len(children) + 1, dtype=object)
+        names[0] = root
+        names[1 : len(parents) + 1] = parents
+        names[len(parents) + 1 :] = children
+        ids, nodes = pd.factorize(names)
+        parent_ids = ids[1 : len(parents) + 1]
+        child_ids = ids[len(parents) + 1 :]
+        n_nodes = len(nodes)
+
+        multiple = pd.Series(child_ids).duplicated().to_numpy() | (child_ids == 0)
+        if multiple.any():
+            raise ValueError(
+                f"The concept {nodes[child_ids[multiple][0]]} has more than one parent."
+            )
+
+        # the root points to itself, so all jumps end there
+        jumps = np.full(n_nodes, -1, dtype=np.int64)
+        jumps[0] = 0
+        jumps[child_ids] = parent_ids
+        orphans = np.flatnonzero(jumps < 0)
+        if len(orphans) > 0:
+            raise ValueError(f"Not all concepts of the tree are reachable from {root}.")
+
+        depths = np.ones(n_nodes, dtype=np.int64)
+        depths[0] = 0
+        for _ in range(0, int(np.ceil(np.log2(max(n_nodes, 2))))):
+            depths += depths[jumps]
+            jumps = jumps[jumps]
+
+        cyclic = np.flatnonzero(jumps != 0)
+        if len(cyclic) > 0:
+            raise ValueError(f"The concept {nodes[cyclic[0]]} is part of a cycle.")
+
+        # ordering by depth puts every parent before its children
+        order = np.argsort(depths, kind="stable")
+        new_ids = np.empty(n_nodes, dtype=np.int64)
+        new_ids[order] = np.arange(n_nodes)
+        tree_parents = np.full(n_nodes, -1, dtype=np.int64)
+        tree_parents[new_ids[child_ids]] = new_ids[parent_ids]
+
+        sorted_nodes = np.empty(n_nodes, dtype=object)
+        sorted_nodes[:] = list(nodes[order])
+
+        return TreeIndex(sorted_nodes, tree_parents, depths[order])
+
+    def __build_euler_tour(self):
+        """
+        Builds the Euler tour of the tree.
+        """
+        n_nodes = len(self.__nodes)
+        if self.__preorder is None or self.__sizes is None:
+            self.__preorder, self.__sizes = self.__traverse()
+        preorder = self.__preorder
+        sizes = self.__sizes
+
+        # each node enters the tour at its first visit and its parent returns after its subtree
+        first = 2 * preorder - self.__depths
+        tour = np.zeros(max(2 * n_nodes - 1, 1), dtype=np.int32)
+        tour[first] = np.arange(n_nodes)
+        tour[first[1:] + 2 * sizes[1:] - 1] = self.__parents[1:]
+
+        self.__tour = tour
+        self.__first = first
+
+        self.__table = None
+
+        return
+
+    def __build_sparse_table(self):
+        """
+        Builds the sparse table for range minimum queries on the depths of the Euler tour.
+        It is built on the first query, so that loading an index stays cheap.
+        """
+        tour = self.__tour
+        tour_depths = self.__depths[tour]
+        table = [np.arange(len(tour), dtype=np.int32)]
+        width = 1
+        while 2 * width <= len(tour):
+            previous = table[-1]
+            left = previous[: len(tour) - 2 * width + 1]
+            right = previous[width : len(tour) - width + 1]
+            table.append(np.where(tour_depths[left] <= tour_depths[right], left, right))
+            width *= 2
+        self.__table = table
+
+        return
+
+    def __traverse(self):
+        """
+        Calculates the preorder positions and the subtree sizes of the nodes.
+
+        :return: A tuple of the preorder positions and the subtree sizes as 1D numpy arrays.
+        """
+        n_nodes = len(self.__nodes)
+        parents = self.__parents.tolist()
+
+        # children always have larger ids than their parents
+        sizes = [1] * n_nodes
+        for child in range(n_nodes - 1, 0, -1):
+            sizes[parents[child]] += sizes[child]
+        sizes = np.array(sizes, dtype=np.int64)
+
+        # the preorder position of a child follows its parent and the subtrees of its preceding siblings
+        children = np.argsort(self.__parents[1:], kind="stable") + 1
+        group_sizes = np.cumsum(sizes[children]) - sizes[children]
+        group_starts = np.searchsorted(self.__parents[children], self.__parents[children])
+        steps = np.zeros(n_nodes, dtype=np.int64)
+        steps[children] = group_sizes - group_sizes[group_starts] + 1
+        steps = steps.tolist()
+        preorder = [0] * n_nodes
+        for child in range(1, n_nodes):
+            preorder[child] = preorder[parents[child]] + steps[child]
+
+        return np.array(preorder, dtype=np.int64), sizes
+
+    def __len__(self):
+        """
+        Returns the amount of nodes.
+
+        :return: The amount of nodes.
+        """
+        return len(self.__nodes)
+
+    def add_leaf(self, name, parent):
+        """
+        Creates a new *TreeIndex* with an additional leaf, without traversing the tree again.
+        The leaf is the last child of its parent, so its subtree is inserted at the end of the subtree of the parent
+        in the preorder, and the subtree sizes of the ancestors of the parent grow by one.
+
+        :param name: The name of the new leaf.
+        :param parent: The name of the existing parent.
+        :return: The new *TreeIndex* instance.
+        :raise ValueError: The parent does not exist.
+        """
+        parent_id = self.get_ids([parent])[0]
+        preorder = self.__preorder
+        sizes = self.__sizes
+        position = preorder[parent_id] + sizes[parent_id]
+
+        nodes = np.empty(len(self.__nodes) + 1, dtype=object)
+        nodes[:-1] = self.__nodes
+        nodes[-1] = name
+        ancestors = (preorder <= preorder[parent_id]) & (
+            preorder[parent_id] < preorder + sizes
+        )
+
+        return TreeIndex(
+            nodes,
+            np.append(self.__parents, parent_id),
+            np.append(self.__depths, self.__depths[parent_id] + 1),
+            np.append(preorder + (preorder >= position), position),
+            np.append(sizes + ancestors, 1),
+        )
+
+    def get_nodes(self):
+        """
+        Returns the names of the nodes.
+
+        :return: The names as 1D numpy array.
+        """
+        return self.__nodes
+
+    def get_preorder(self):
+        """
+        Returns the positions of the nodes in a depth-first preorder traversal.
+        The subtree of a node covers the positions from its own one to its own one plus its subtree size.
+
+        :return: The positions as 1D numpy array.
+        """
+        return self.__preorder
+
+    def get_subtree_sizes(self):
+        """
+        Returns the amount of nodes in the subtree of each node, including the node itself.
+
+        :return: The amounts as 1D numpy array.
+        """
+        return self.__sizes
+
+    def get_parents(self):
+        """
+        Returns the parent ids of the nodes.
+
+        :return: The parent ids as 1D numpy array, with ``-1`` for the root.
+        """
+        return self.__parents
+
+    def get_depths(self):
+        """
+        Returns the depths of the nodes, i.e. the amount of edges to the root.
+
+        :return: The depths as 1D numpy array.
+        """
+        return self.__depths
+
+    def get_ids(self, names):
+        """
+        Returns the ids of the given nodes.
+
+        :param names: A sequence of node names.
+        :return: The ids as 1D numpy array.
+        :raise ValueError: A node does not exist.
+        """
+        if self.__node_ids is None:
+            self.__node_ids = {node: i for i, node in enumerate(self.__nodes)}
+
+        try:
+            return np.array([self.__node_ids[name] for name in names], dtype=np.int64)
+        except KeyError as error:
+            raise ValueError(f"The concept {error.args[0]} does not exist.")
+
+    def contains(self, name):
+        """
+        Checks whether the given node exists.
+
+        :param name: The name of the node.
+        :return: ``True`` if the node exists.
+        """
+        if self.__node_ids is None:
+            self.__node_ids = {node: i for i, node in enumerate(self.__nodes)}
+
+        return name in self.__node_ids
+
+    def get_descendant_counts(self):
+        """
+        Returns the amount of descendants of each node, excluding the node itself.
+
+        :return: The amounts as 1D numpy array.
+        """
+        return (self.__sizes - 1).astype(np.float64)
+
+    def accumulate(self, values):
+        """
+        Sums the given node values over the subtree of each node.
+
+        :param values: The values of the nodes as 1D numpy array.
+        :return: The sums as 1D numpy array.
+        """
+        # the subtree of each node is a contiguous range of the preorder
+        sums = np.zeros(len(self.__nodes) + 1)
+        sums[self.__preorder + 1] = values
+        np.cumsum(sums, out=sums)
+
+        return sums[self.__preorder + self.__sizes] - sums[self.__preorder]
+
+    def lowest_common_ancestors(self, first, second):
+        """
+        Returns the lowest common ancestors of the given pairs of nodes in constant time per pair.
+
+        :param first: The ids of the first nodes as numpy array.
+        :param second: The ids of the second nodes as numpy array of the same shape.
+        :return: The ids of the lowest common ancestors as numpy array of the same shape.
+        """
+        if self.__table is None:
+            self.__build_sparse_table()
+
+        first_positions = self.__first[np.asarray(first)]
+        second_positions = self.__first[np.asarray(second)]
+        left = np.minimum(first_positions, second_positions)
+        right = np.maximum(first_positions, second_positions) + 1
+
+        level = np.floor(np.log2(right - left)).astype(np.int64)
+        width = np.left_shift(1, level)
+
+        candidates = np.empty((2,) + np.shape(left), dtype=np.int64)
+        for j in np.unique(level):
+            mask = level == j
+            candidates[0][mask] = self.__table[j][left[mask]]
+            candidates[1][mask] = self.__table[j][right[mask] - width[mask]]
+
+        tour_depths = self.__depths[self.__tour[candidates]]
+        positions = np.where(
+            tour_depths[0] <= tour_depths[1], candidates[0], candidates[1]
+        )
+
+        return self.__tour[positions].astype(np.int64)
@@ -1,30 +1,81 @@
+import io
+import json
+import os
+import pickle
+import struct
+import sys
+import weakref
+from collections.abc import Iterator
 import pandas as pd
 import numpy as np
 
+# the size of the .npy header, which is fixed to rewrite it after streaming all rows
+NPY_HEADER_SIZE = 128
+
+# arrays of at least this size are stored in separate .npy files when saving objects
+EXTERNAL_ARRAY_SIZE = 1 << 16
+
+# the magic string and the alignment of the arrays within binary array files
+BINARY_MAGIC = b"CEARRAY1"
+BINARY_ALIGNMENT = 64
+
 
 class DataUtils:
     """
     A helper class containing static functions for data handling.
     """
 
+    # the shared memories owned by this process by their names, which vanish once the owner drops them
+    __owned_memories = weakref.WeakValueDictionary()
+
     @staticmethod
-    def ensure_pandas_dataframe(x):
+    def ensure_pandas_dataframe(x, categories=None):
         """
         Ensure that the given data is of pandas dataframe.
         If not, the data will be converted.
         Additionally, the names of the columns will be replaced by indices.
 
-        :param x: The data to check in either pandas dataframe, pandas series, numpy array or python list format.
+        Dictionary-encoded data is kept as categorical columns, i.e. the codes are not converted to strings.
+        This is the case for categorical pandas columns, pandas ``Categorical`` instances,
+        pyarrow dictionary arrays and tables, as well as integer-coded numpy arrays
+        if ``categories`` are given.
+
+        Paths of CSV or Parquet files and iterators of chunks are read in a streaming pass,
+        see :meth:`read_codes`, so the raw data never needs to be resident at once.
+
+        :param x: The data to check in either pandas dataframe, pandas series, pandas categorical,
+            numpy array, python list or pyarrow array or table format,
+            or the path of a ``.csv`` or ``.parquet`` file, or an iterator of chunks in one of these formats.
+        :param categories: If given, ``x`` is interpreted as integer-coded numpy array.
+            For a 1D array, this is the list of categories the codes refer to.
+            For a 2D array, this is a list containing the list of categories of each column.
         :return: The pandas dataframe representing the data.
         """
+        if categories is not None:
+            return DataUtils.__from_codes(x, categories)
+
+        if isinstance(x, (str, os.PathLike, Iterator)):
+            return DataUtils.read_codes(x)
+
+        if type(x).__module__.split(".")[0] == "pyarrow":
+            # dictionary arrays become categorical columns without copying the indices
+            x = x.to_pandas()
+
         if isinstance(x, pd.DataFrame):
-            x_df = x.reindex(np.arange(len(x)))
+            if x.index.equals(pd.RangeIndex(len(x))):
+                x_df = x.copy(deep=False)
+            else:
+                x_df = x.reset_index(drop=True)
             x_df.columns = np.arange(len(x_df.columns))
             return x_df
         elif isinstance(x, pd.Series):
             x_df = x.to_frame()
             x_df.columns = np.arange(len(x_df.columns))
             return x_df
+        elif isinstance(x, pd.Categorical):
+            x_df = pd.Series(x, copy=False).to_frame()
+            x_df.columns = np.arange(len(x_df.columns))
+            return x_df
         elif isinstance(x, np.ndarray):
             x_df = pd.DataFrame(x)
             x_df.columns = np.arange(len(x_df.columns))
@@ -36,6 +87,633 @@ class DataUtils:
         else:
             raise ValueError(f"The given data of type {type(x)} is not supported.")
 
+    @staticmethod
+    def __from_codes(codes, categories):
+        """
+        Creates a pandas dataframe with categorical columns from integer codes.
+        The codes are only copied, if their integer type differs from the one pandas uses.
+
+        :param codes: The integer codes as 1D or 2D numpy array.
+        :param categories: The categories of the column or a list with the categories of each column.
+        :return: The pandas dataframe with categorical columns.
+        """
+        codes = np.asarray(codes)
+        if codes.ndim == 1:
+            codes = codes.reshape(-1, 1)
+            categories = [categories]
+
+        if len(categories) != codes.shape[1]:
+            raise ValueError(
+                f"{len(categories)} lists of categories are given for {codes.shape[1]} columns."
+            )
+
+        columns = dict()
+        for col in range(0, codes.shape[1]):
+            columns[col] = pd.Categorical.from_codes(codes[:, col], categories[col])
+
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def factorize(column):
+        """
+        Encodes the given column as integer codes referring to its distinct values.
+        For categorical columns, the existing codes are used without copying them,
+        unless some categories are not used by any row, which are dropped.
+        Missing values are treated as a value on its own.
+
+        :param column: A single pandas series.
+        :return: A tuple of the codes as 1D numpy array and the distinct values as 1D numpy array.
+        """
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            codes = column.array.codes
+            values = column.array.categories.to_numpy()
+
+            # categories without rows are dropped, since they would be checked and compared for nothing
+            present = np.bincount(codes[codes >= 0], minlength=len(values)) > 0
+            if not present.all():
+                lookup = (np.cumsum(present) - 1).astype(codes.dtype)
+                codes = np.where(codes >= 0, lookup[codes], codes)
+                values = values[present]
+        else:
+            # the missing values get the sentinel -1, which is supported by all versions of pandas
+            codes, values = pd.factorize(column)
+            values = np.asarray(values)
+
+        if (codes < 0).any():
+            codes = np.where(codes < 0, len(values), codes)
+            values = np.append(values, np.nan)
+
+        return codes, values
+
+    @staticmethod
+    def read_codes(source, chunk_size=100000):
+        """
+        Reads the given source chunk by chunk and encodes each column as integer codes
+        referring to a vocabulary of its distinct values, which grows with each chunk.
+        Only the codes and the vocabularies are kept, so the result is small,
+        even if the raw data does not fit into memory.
+        Missing values get the code ``-1``, see :meth:`factorize`.
+
+        :param source: The path of a ``.csv`` or ``.parquet`` file, see :meth:`read_chunks`,
+            or an iterable of chunks in a format supported by :meth:`ensure_pandas_dataframe`.
+        :param chunk_size: The amount of rows of each chunk read from a file.
+        :return: The pandas dataframe with categorical columns.
+        :raise ValueError: The chunks have different amounts of columns.
+        """
+        codes = None
+        vocabularies = None
+        for chunk in DataUtils.iterate_chunks(source, chunk_size):
+            chunk_df = DataUtils.ensure_pandas_dataframe(chunk)
+            if codes is None:
+                codes = [[] for _ in chunk_df.columns]
+                vocabularies = [pd.Index([], dtype=object) for _ in chunk_df.columns]
+            elif len(chunk_df.columns) != len(codes):
+                raise ValueError(
+                    f"A chunk has {len(chunk_df.columns)} instead of {len(codes)} columns."
+                )
+
+            for col in chunk_df.columns:
+                chunk_codes, values = DataUtils.factorize(chunk_df[col])
+                missing = pd.isna(values)
+                vocabulary = vocabularies[col]
+
+                positions = vocabulary.get_indexer(values)
+                new = (positions < 0) & ~missing
+                if new.any():
+                    positions[new] = np.arange(
+                        len(vocabulary), len(vocabulary) + np.count_nonzero(new)
+                    )
+                    vocabularies[col] = vocabulary.append(
+                        pd.Index(values[new], dtype=object)
+                    )
+                positions[missing] = -1
+
+                codes[col].append(positions.astype(np.int32)[chunk_codes])
+
+        if codes is None:
+            return pd.DataFrame()
+
+        columns = dict()
+        for col in range(0, len(codes)):
+            columns[col] = pd.Categorical.from_codes(
+                np.concatenate(codes[col]), vocabularies[col]
+            )
+
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def read_chunks(path, chunk_size):
+        """
+        Reads the given file in chunks of rows. The format is chosen by the file extension.
+        CSV files are expected to have a header row and their values are read as strings,
+        so that the type of a value does not depend on the other values of its chunk.
+
+        .. note::
+
+            Reading Parquet files requires `pyarrow <https://arrow.apache.org/docs/python/>`_.
+
+        :param path: The path of a ``.csv`` or ``.parquet`` file.
+        :param chunk_size: The amount of rows of each chunk.
+        :return: A generator of the chunks as pandas dataframes.
+        :raise ValueError: The file extension is not supported.
+        """
+        if str(path).endswith(".csv"):
+            reader = pd.read_csv(path, chunksize=chunk_size, dtype=str)
+            try:
+                for chunk in reader:
+                    yield chunk
+            finally:
+                reader.close()
+        elif str(path).endswith(".parquet"):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError(
+                    "Reading Parquet files requires pyarrow, "
+                    "install it with `pip install contextual-encoders[parquet]`."
+                )
+
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+        else:
+            raise ValueError(f"The file extension of {path} is not supported.")
+
+    @staticmethod
+    def iterate_chunks(x, chunk_size):
+        """
+        Iterates over the given data in chunks of rows.
+        In-memory data is split into chunks of the given size, files are read chunk by chunk,
+        any other iterable is considered to already yield chunks and is passed through.
+
+        :param x: The data in either pandas dataframe, pandas series, numpy array or python list format,
+            the path of a ``.csv`` or ``.parquet`` file, or an iterable of chunks in one of these formats.
+        :param chunk_size: The amount of rows of each chunk of in-memory data or files.
+        :return: A generator of the chunks.
+        """
+        if isinstance(x, (str, os.PathLike)):
+            for chunk in DataUtils.read_chunks(x, chunk_size):
+                yield chunk
+        elif isinstance(x, (pd.DataFrame, pd.Series)):
+            for start in range(0, len(x), chunk_size):
+                yield x.iloc[start : start + chunk_size]
+        elif isinstance(x, (np.ndarray, list)):
+            for start in range(0, len(x), chunk_size):
+                yield x[start : start + chunk_size]
+        else:
+            for chunk in x:
+                yield chunk
+
+    @staticmethod
+    def write_npy(chunks, path):
+        """
+        Writes the given chunks of a 2D numpy array into a single ``.npy`` file as they arrive.
+        The amount of rows does not need to be known in advance.
+        The file can be loaded memory-mapped with ``numpy.load(path, mmap_mode="r")``.
+
+        :param chunks: An iterable of 2D numpy arrays with the same amount of columns.
+        :param path: The path of the ``.npy`` file.
+        :return: The amount of written rows.
+        """
+        n_rows = 0
+        n_columns = 0
+        dtype = np.dtype(np.float64)
+
+        with open(path, "wb") as file:
+            file.write(DataUtils.__npy_header(n_rows, n_columns, dtype))
+            for chunk in chunks:
+                chunk = np.ascontiguousarray(chunk, dtype=dtype)
+                n_columns = chunk.shape[1]
+                n_rows += chunk.shape[0]
+                file.write(chunk.tobytes())
+
+            # rewrite the header with the final shape
+            file.seek(0)
+            file.write(DataUtils.__npy_header(n_rows, n_columns, dtype))
+
+        return n_rows
+
+    @staticmethod
+    def __npy_header(n_rows, n_columns, dtype):
+        """
+        Creates a ``.npy`` header of fixed size for a 2D array.
+
+        :param n_rows: The amount of rows.
+        :param n_columns: The amount of columns.
+        :param dtype: The numpy dtype of the array.
+        :return: The header as bytes.
+        """
+        header = "{'descr': %r, 'fortran_order': False, 'shape': (%d, %d), }" % (
+            np.lib.format.dtype_to_descr(dtype),
+            n_rows,
+            n_columns,
+        )
+        magic = np.lib.format.magic(1, 0)
+        header_length = NPY_HEADER_SIZE - len(magic) - 2
+        header = header.ljust(header_length - 1) + "\n"
+
+        return magic + struct.pack("<H", header_length) + header.encode("latin1")
+
+    @staticmethod
+    def write_parquet(chunks, path):
+        """
+        Writes the given chunks of a 2D numpy array into a single Parquet file as they arrive.
+        Each chunk becomes a row group. The columns are named by their index.
+
+        .. note::
+
+            Writing Parquet files requires `pyarrow <https://arrow.apache.org/docs/python/>`_.
+
+        :param chunks: An iterable of 2D numpy arrays with the same amount of columns.
+        :param path: The path of the Parquet file.
+        :return: The amount of written rows.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Writing Parquet files requires pyarrow, "
+                "install it with `pip install contextual-encoders[parquet]`."
+            )
+
+        n_rows = 0
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.table(
+                    {str(col): chunk[:, col] for col in range(0, chunk.shape[1])}
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                n_rows += chunk.shape[0]
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return n_rows
+
+    @staticmethod
+    def write_arrays(path, metadata, arrays):
+        """
+        Writes numpy arrays into a single binary file, which can be loaded memory-mapped.
+        The file starts with a magic string, the length of a JSON header and the header itself.
+        The header contains the given metadata as well as the dtype, shape and offset of each array.
+        Each array is stored as contiguous block aligned to 64 bytes.
+
+        :param path: The path of the binary file.
+        :param metadata: A JSON-serializable dictionary of metadata.
+        :param arrays: A dictionary of the numpy arrays by their names.
+        """
+        arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+
+        # the offsets are relative to the end of the header, since its length depends on them
+        descriptions = {}
+        offset = 0
+        for name, array in arrays.items():
+            descriptions[name] = {
+                "dtype": np.lib.format.dtype_to_descr(array.dtype),
+                "shape": list(array.shape),
+                "offset": offset,
+            }
+            offset += DataUtils.__align(array.nbytes)
+
+        header = json.dumps({"metadata": metadata, "arrays": descriptions}).encode(
+            "utf-8"
+        )
+        start = DataUtils.__align(len(BINARY_MAGIC) + 8 + len(header))
+
+        with open(path, "wb") as file:
+            file.write(BINARY_MAGIC)
+            file.write(struct.pack("<Q", start))
+            file.write(header.ljust(start - len(BINARY_MAGIC) - 8))
+            for array in arrays.values():
+                file.write(array.tobytes())
+                file.write(bytes(DataUtils.__align(array.nbytes) - array.nbytes))
+
+        return
+
+    @staticmethod
+    def read_arrays(path, mmap=True):
+        """
+        Reads a binary file written by :meth:`write_arrays`.
+        If memory-mapped, the arrays are read-only views of the file, that are paged in on access
+        and shared by all processes reading the same file.
+
+        :param path: The path of the binary file.
+        :param mmap: If ``True``, the arrays are memory-mapped, otherwise they are read into memory.
+        :return: A tuple of the metadata and a dictionary of the numpy arrays by their names.
+        :raise ValueError: The file is not a binary array file.
+        """
+        with open(path, "rb") as file:
+            if file.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+                raise ValueError(f"The file {path} is not a binary array file.")
+            (start,) = struct.unpack("<Q", file.read(8))
+            header = json.loads(file.read(start - len(BINARY_MAGIC) - 8).decode("utf-8"))
+
+            if mmap:
+                buffer = np.memmap(path, dtype=np.uint8, mode="r")
+            else:
+                file.seek(0)
+                buffer = np.frombuffer(file.read(), dtype=np.uint8)
+
+        arrays = {}
+        for name, description in header["arrays"].items():
+            dtype = np.dtype(np.lib.format.descr_to_dtype(description["dtype"]))
+            shape = tuple(description["shape"])
+            begin = start + description["offset"]
+            n_bytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            arrays[name] = buffer[begin : begin + n_bytes].view(dtype).reshape(shape)
+
+        return header["metadata"], arrays
+
+    @staticmethod
+    def encode_strings(strings):
+        """
+        Encodes strings into a compact array representation, i.e. the UTF-8 text of the strings
+        separated by null characters and the character offsets of the strings within the text.
+
+        :param strings: A sequence of strings.
+        :return: A tuple of the text as 1D ``uint8`` numpy array and the character offsets
+            as 1D numpy array of size :math:`n + 1`.
+        """
+        lengths = np.fromiter((len(string) + 1 for string in strings), dtype=np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        text = np.frombuffer("\0".join(strings).encode("utf-8"), dtype=np.uint8)
+
+        return text, offsets
+
+    @staticmethod
+    def decode_strings(text, offsets):
+        """
+        Decodes strings encoded by :meth:`encode_strings`.
+
+        :param text: The UTF-8 text as 1D ``uint8`` numpy array.
+        :param offsets: The character offsets as 1D numpy array.
+        :return: The strings as 1D numpy array of objects.
+        """
+        decoded = bytes(text).decode("utf-8")
+        strings = np.empty(len(offsets) - 1, dtype=object)
+
+        parts = decoded.split("\0")
+        if len(parts) != len(strings):
+            # some strings contain null characters themselves
+            offsets = offsets.tolist()
+            parts = [
+                decoded[offsets[i] : offsets[i + 1] - 1] for i in range(len(strings))
+            ]
+        strings[:] = parts
+
+        return strings
+
+    @staticmethod
+    def __align(n_bytes):
+        """
+        Rounds the given amount of bytes up to the alignment of binary array files.
+
+        :param n_bytes: The amount of bytes.
+        :return: The aligned amount of bytes.
+        """
+        return -(-n_bytes // BINARY_ALIGNMENT) * BINARY_ALIGNMENT
+
+    @staticmethod
+    def save_object(obj, path):
+        """
+        Saves an object into the given directory using pickle.
+        Large numpy arrays are not pickled, but stored as separate ``.npy`` files within the ``arrays``
+        subdirectory, so that :meth:`load_object` can memory-map them.
+        Arrays that are referenced more than once are stored once.
+
+        .. note::
+
+            Saving an object into the directory it was loaded from memory-mapped is not supported,
+            since the mapped files would be overwritten.
+
+        :param obj: The object to save.
+        :param path: The path of the directory, which is created if it does not exist.
+        """
+        array_path = os.path.join(path, "arrays")
+        os.makedirs(array_path, exist_ok=True)
+        for name in os.listdir(array_path):
+            if name.endswith(".npy"):
+                os.remove(os.path.join(array_path, name))
+
+        names = {}
+        arrays = []
+
+        def persistent_id(value):
+            if (
+                not isinstance(value, np.ndarray)
+                or value.dtype.hasobject
+                or value.nbytes < EXTERNAL_ARRAY_SIZE
+            ):
+                return None
+
+            if id(value) not in names:
+                name = f"{len(names):06d}.npy"
+                np.save(os.path.join(array_path, name), np.asarray(value))
+                names[id(value)] = name
+                # keep the array alive, so that its id is not reused
+                arrays.append(value)
+
+            return names[id(value)]
+
+        with open(os.path.join(path, "object.pkl"), "wb") as file:
+            pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.persistent_id = persistent_id
+            pickler.dump(obj)
+
+        return
+
+    @staticmethod
+    def load_object(path, mmap=True):
+        """
+        Loads an object saved by :meth:`save_object`.
+
+        :param path: The path of the directory.
+        :param mmap: If ``True``, the large numpy arrays are memory-mapped read-only,
+            i.e. they are paged in on access and shared by all processes loading the same directory.
+        :return: The loaded object.
+        """
+        array_path = os.path.join(path, "arrays")
+        mmap_mode = "r" if mmap else None
+
+        def persistent_load(name):
+            return np.load(os.path.join(array_path, name), mmap_mode=mmap_mode)
+
+        with open(os.path.join(path, "object.pkl"), "rb") as file:
+            unpickler = pickle.Unpickler(file)
+            unpickler.persistent_load = persistent_load
+
+            return unpickler.load()
+
+    @staticmethod
+    def share_object(obj, name=None):
+        """
+        Publishes an object within a block of shared memory, so that other processes can attach it
+        with :meth:`attach_object` without copying its large numpy arrays.
+        As in :meth:`save_object`, the object is pickled, while large arrays are stored separately,
+        i.e. aligned within the shared memory after the pickled data.
+
+        .. note::
+
+            The calling process owns the shared memory. It needs to keep the returned instance
+            and call ``close()`` and ``unlink()`` once no other process needs the object anymore.
+
+        :param obj: The object to publish, e.g. a compiled *Context*, a frozen *Measure*
+            or a fitted *ContextualEncoder*.
+        :param name: The name of the shared memory. If ``None``, a unique name is chosen.
+        :return: The ``multiprocessing.shared_memory.SharedMemory`` instance, whose ``name`` is used to attach.
+        :raise ImportError: Shared memory is not available, i.e. the Python version is below 3.8.
+        """
+        shared_memory, _ = DataUtils.__import_shared_memory()
+
+        descriptions = {}
+        arrays = []
+        size = 0
+
+        def persistent_id(value):
+            nonlocal size
+            if (
+                not isinstance(value, np.ndarray)
+                or value.dtype.hasobject
+                or value.nbytes < EXTERNAL_ARRAY_SIZE
+            ):
+                return None
+
+            if id(value) not in descriptions:
+                descriptions[id(value)] = (
+                    size,
+                    np.lib.format.dtype_to_descr(value.dtype),
+                    value.shape,
+                )
+                arrays.append(value)
+                size += DataUtils.__align(value.nbytes)
+
+            return descriptions[id(value)]
+
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = persistent_id
+        pickler.dump(obj)
+        data = buffer.getvalue()
+
+        start = DataUtils.__align(8 + len(data))
+        memory = shared_memory.SharedMemory(name=name, create=True, size=start + size)
+        memory.buf[:8] = struct.pack("<Q", len(data))
+        memory.buf[8 : 8 + len(data)] = data
+        for array in arrays:
+            offset, _, shape = descriptions[id(array)]
+            target = np.ndarray(
+                shape, dtype=array.dtype, buffer=memory.buf, offset=start + offset
+            )
+            target[...] = array
+            del target
+        DataUtils.__owned_memories[memory.name] = memory
+
+        return memory
+
+    @staticmethod
+    def attach_object(name):
+        """
+        Attaches an object published by :meth:`share_object`.
+        The large numpy arrays of the object are read-only views of the shared memory.
+        The shared memory stays attached as long as any of these arrays exists.
+
+        :param name: The name of the shared memory.
+        :return: The attached object.
+        :raise ImportError: Shared memory is not available, i.e. the Python version is below 3.8.
+        """
+        shared_memory, resource_tracker = DataUtils.__import_shared_memory()
+
+        # the owning process is responsible for unlinking the shared memory,
+        # so attaching processes must not register it for cleanup
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            # the registration of the owner is kept, if the resource tracker is shared with it
+            if os.name == "posix" and name not in DataUtils.__owned_memories:
+                resource_tracker.unregister(memory._name, "shared_memory")
+
+        (length,) = struct.unpack("<Q", bytes(memory.buf[:8]))
+        start = DataUtils.__align(8 + length)
+
+        # all arrays are views of a single array, which closes the shared memory once it is collected,
+        # i.e. once neither the object nor any of its arrays is referenced anymore
+        root = np.ndarray((memory.size,), dtype=np.uint8, buffer=memory.buf)
+        weakref.finalize(root, memory.close)
+
+        def persistent_load(description):
+            offset, descr, shape = description
+            dtype = np.lib.format.descr_to_dtype(descr)
+            n_bytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            array = root[start + offset : start + offset + n_bytes]
+            array = array.view(dtype).reshape(shape)
+            array.flags.writeable = False
+
+            return array
+
+        unpickler = pickle.Unpickler(io.BytesIO(bytes(memory.buf[8 : 8 + length])))
+        unpickler.persistent_load = persistent_load
+
+        return unpickler.load()
+
+    @staticmethod
+    def __import_shared_memory():
+        """
+        Imports the shared memory support of ``multiprocessing``, which is available from Python 3.8 on.
+
+        :return: A tuple of the ``shared_memory`` and the ``resource_tracker`` module.
+        :raise ImportError: The Python version is below 3.8.
+        """
+        if sys.version_info < (3, 8):
+            raise ImportError(
+                "Sharing objects needs multiprocessing.shared_memory, which requires Python 3.8 or newer."
+            )
+
+        from multiprocessing import resource_tracker, shared_memory
+
+        return shared_memory, resource_tracker
+
+    @staticmethod
+    def get_available_memory():
+        """
+        Returns the memory that is available for new allocations without swapping.
+        On Linux, ``MemAvailable`` of ``/proc/meminfo`` is used, otherwise the free physical pages.
+
+        :return: The amount of bytes or ``None``, if it cannot be determined.
+        """
+        try:
+            with open("/proc/meminfo") as file:
+                for line in file:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    @staticmethod
+    def format_bytes(n_bytes):
+        """
+        Formats an amount of bytes with a binary unit, e.g. ``1.5 GiB``.
+
+        :param n_bytes: The amount of bytes.
+        :return: The formatted amount as string.
+        """
+        n_bytes = float(n_bytes)
+        for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+            if n_bytes < 1024 or unit == "TiB":
+                break
+            n_bytes /= 1024
+
+        return f"{n_bytes:.1f} {unit}"
+
     @staticmethod
     def is_float(value):
         """
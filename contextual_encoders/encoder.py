@@ -40,8 +40,23 @@ or a mix of both and produces :math:`n` vectors of dimension :math:`m \\in \\mat
     - Collect all the feature comparison values and construct the similarity and dissimilarity
       matrix within the :class:`.MatrixComputer`.
     - Convert the similarity or dissimilarity matrix to a set of vectors using a :class:`.Reducer`.
+
+.. note::
+
+    In the ``factorized`` mode, the rows are not embedded at all.
+    Instead, the distinct values of each column are embedded once by the :class:`.Reducer`,
+    based on the matrix of the distinct values of size :math:`u \\times u`.
+    A row is encoded by concatenating the vectors of its values, which are looked up in a table.
+    Thus, fitting is in :math:`O(u^2)` per column and encoding is in :math:`O(n)`.
 """
 
+import asyncio
+import copy
+import functools
+import os
+import threading
+import numpy as np
+import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from .measure import Measure, SimilarityMeasure, DissimilarityMeasure
 from .aggregator import AggregatorFactory, Aggregator
@@ -50,6 +65,9 @@ from .gatherer import Gatherer, GathererFactory
 from .inverter import Inverter, InverterFactory
 from .reducer import ReducerFactory, SimilarityMatrixReducer, Reducer
 from .data_utils import DataUtils
+from .index import SimilarityIndex
+from .value_matrix import ValueMatrix
+from .planner import Planner
 
 
 class ContextualEncoder(BaseEstimator, TransformerMixin):
@@ -65,6 +83,16 @@ class ContextualEncoder(BaseEstimator, TransformerMixin):
         aggregator="mean",
         inverters="sqrt",
         reducer="mds",
+        tokenizer=None,
+        deduplicate=False,
+        tile_size=None,
+        executor=None,
+        checkpoint_dir=None,
+        unknown="error",
+        memory_limit=None,
+        mode="rows",
+        column_weights=None,
+        matrix_free=None,
     ):
         """
         Initializes the *ContextualEncoder*.
@@ -104,7 +132,65 @@ class ContextualEncoder(BaseEstimator, TransformerMixin):
             See :class:`.Reducer` for currently implemented *Reducers*
             and how custom *Reducers* can be implemented.
             See :class:`.ReducerFactory` for the names of the implemented *Reducers*.
+        :param tokenizer: An optional :class:`.Tokenizer` instance used to split the attributes into their forms,
+            e.g. to strip whitespaces or remove repeated forms.
+            If ``None``, the attributes are split at the ``separator_token``.
+        :param deduplicate: If ``True``, rows with the same values in all columns are encoded once.
+            The matrices are computed on the distinct rows only and the *Reducer* gets
+            the multiplicities of the rows as weights, if it supports weights,
+            see :meth:`.Reducer.supports_weights`. The encodings are copied back to the repeated rows.
+            If ``None``, the :class:`.Planner` decides based on the amount of distinct rows.
+        :param tile_size: The amount of distinct values per side of the tiles the matrices are computed in,
+            see :class:`.MatrixComputer`.
+        :param executor: An optional ``concurrent.futures`` compatible executor the tiles are submitted to.
+        :param checkpoint_dir: An optional directory, in which finished tiles are stored,
+            so that a restarted encoding only computes the missing tiles.
+            Each column uses a subdirectory ``column_<index>``.
+        :param unknown: The policy for values that are not part of the *Context* of their *Measure*,
+            which can be ``error``, ``root`` or a fixed comparison value, see :class:`.MatrixComputer`.
+            The values of each column are checked before any comparison takes place.
+        :param memory_limit: The memory in bytes an encoding may use, see :class:`.Planner`.
+            If ``None``, the available memory of the system is used.
+        :param mode: Either ``rows`` for embedding the rows based on the aggregated matrix of all rows,
+            or ``factorized`` for embedding the distinct values of each column separately.
+            In the ``factorized`` mode, the *Aggregator* is not used for the encoding and rows are encoded
+            by looking up the vectors of their values, which are concatenated.
+            Values that were not fitted are projected, see :meth:`.Reducer.project`.
+        :param column_weights: The optional weights of the columns in the ``factorized`` mode as list.
+            The vectors of a column are scaled by the square root of its weight,
+            so that the squared euclidean distance of two rows is the weighted sum of the squared distances
+            of their values.
+        :param matrix_free: If ``True``, the aggregated similarity matrix is never materialized,
+            the *Reducer* multiplies the matrices of the distinct values of the columns with vectors instead,
+            see :meth:`.Aggregator.aggregate_operator`. This needs an *Aggregator* and a *Reducer*
+            that support operators, e.g. the ``mean`` and ``kpca``.
+            If ``None``, the :class:`.Planner` decides based on the amount of rows and the available memory.
+            The similarity and dissimilarity matrices are aggregated on demand by their getters.
+        :raise ValueError: The given mode does not exist or the components do not support
+            the matrix-free aggregation.
         """
+        # the parameters are kept unchanged for get_params and clone of scikit-learn
+        self.measures = measures
+        self.separator_token = separator_token
+        self.gatherers = gatherers
+        self.aggregator = aggregator
+        self.inverters = inverters
+        self.reducer = reducer
+        self.tokenizer = tokenizer
+        self.deduplicate = deduplicate
+        self.tile_size = tile_size
+        self.executor = executor
+        self.checkpoint_dir = checkpoint_dir
+        self.unknown = unknown
+        self.memory_limit = memory_limit
+        self.mode = mode
+        self.column_weights = column_weights
+        self.matrix_free = matrix_free
+
+        if mode not in ("rows", "factorized"):
+            raise ValueError(f"A mode of type {mode} does not exist.")
+        self.__mode = mode
+        self.__column_weights = column_weights
 
         if isinstance(measures, Measure):
             self.__measures = [measures]
@@ -119,7 +205,7 @@ class ContextualEncoder(BaseEstimator, TransformerMixin):
             gatherers = gatherers
 
         self.__gatherers = []
-        for i in range(0, len(measures)):
+        for i in range(0, len(self.__measures)):
             if i >= len(gatherers):
                 temp_gatherer = gatherers[0]
             else:
@@ -148,7 +234,7 @@ class ContextualEncoder(BaseEstimator, TransformerMixin):
             inverters = inverters
 
         self.__inverters = []
-        for i in range(0, len(measures)):
+        for i in range(0, len(self.__measures)):
             if i >= len(inverters):
                 temp_inverter = inverters[0]
             else:
@@ -178,69 +264,783 @@ class ContextualEncoder(BaseEstimator, TransformerMixin):
                     self.__measures[i],
                     self.__gatherers[i],
                     separator_token=self.__separator_token,
+                    tokenizer=tokenizer,
+                    tile_size=tile_size,
+                    executor=executor,
+                    checkpoint_dir=(
+                        None
+                        if checkpoint_dir is None
+                        else os.path.join(checkpoint_dir, f"column_{i}")
+                    ),
+                    unknown=unknown,
                 )
             )
 
+        if matrix_free and not (
+            self.__aggregator.supports_operator() and self.__reducer.supports_operator()
+        ):
+            raise ValueError(
+                "The matrix-free aggregation needs an Aggregator and a Reducer that support operators."
+            )
+        self.__matrix_free = matrix_free
+
+        self.__deduplicate = deduplicate
+        self.__planner = Planner(memory_limit)
+        self.__value_matrices = None
         self.__similarity_matrix = None
         self.__dissimilarity_matrix = None
+        self.__row_inverse = None
+        self.__reduction_codes = None
+
+        self.__catalog_codes = None
+        self.__catalog_values = None
+        self.__catalog_vocabularies = None
+        self.__index = None
+        self.__catalog_embedded = False
+
+        self.__value_tables = None
 
         return
 
-    def transform(self, x):
+    def fit(self, x, y=None):
+        """
+        Fits the *ContextualEncoder* to the given catalog, which can be queried with :meth:`most_similar`.
+        Only the distinct values of each column are compared,
+        i.e. the similarity matrix of all rows is not computed.
+
+        In the ``factorized`` mode, the distinct values of each column are embedded as well.
+
+        :param x: The catalog as numpy array, pandas dataframe or python list format,
+            or as path of a ``.csv`` or ``.parquet`` file or iterator of chunks,
+            which is read in a streaming pass, see :meth:`.DataUtils.read_codes`.
+        :param y: Not used, present for scikit-learn API consistency.
+        :return: The fitted *ContextualEncoder*.
+        :raise ValueError: The embedding of the values does not fit into the available memory.
+        """
+        self.__fit(DataUtils.ensure_pandas_dataframe(x))
+
+        return self
+
+    def __fit(self, x_df):
+        """
+        Fits the *ContextualEncoder* to the given catalog, see :meth:`fit`.
+
+        :param x_df: The catalog as pandas dataframe.
+        :return: A list with the :class:`.ValueMatrix` of each column, which is reused by :meth:`fit_transform`.
+        :raise ValueError: The embedding of the values does not fit into the available memory.
+        """
+        vocabularies = self.__check_vocabularies(x_df)
+        factorized = self.__mode == "factorized"
+        if factorized:
+            self.__check_plan(x_df)
+
+        value_matrices = []
+        value_similarities = []
+        value_tables = []
+        self.__catalog_codes = []
+        self.__catalog_values = []
+        self.__catalog_vocabularies = []
+        for col in x_df.columns:
+            codes, values, checked_values, unknown_forms = vocabularies[col]
+            value_matrix = self.__computer[col].compute_values(
+                checked_values, unknown_forms=unknown_forms
+            )
+            value_matrices.append(ValueMatrix(value_matrix, codes, codes))
+            value_similarities.append(self.__to_similarity(col, value_matrix))
+            self.__catalog_codes.append(codes)
+            self.__catalog_values.append(pd.Index(values))
+            self.__catalog_vocabularies.append((checked_values, unknown_forms))
+            if factorized:
+                value_tables.append(self.__fit_value_table(col, codes, value_matrix))
+
+        self.__value_tables = value_tables if factorized else None
+
+        self.__index = SimilarityIndex(
+            self.__catalog_codes, value_similarities, self.__aggregator
+        )
+        self.__catalog_embedded = False
+
+        return value_matrices
+
+    def fit_transform(self, x, y=None, **fit_params):
+        """
+        Fits the *ContextualEncoder* to the given catalog and encodes it.
+        Afterwards, new rows can be projected into the encoding of the catalog
+        using :meth:`transform_iter` or :meth:`transform_to_file`.
+
+        :param x: The catalog as numpy array, pandas dataframe or python list format,
+            or as path of a ``.csv`` or ``.parquet`` file or iterator of chunks,
+            which is read in a streaming pass, see :meth:`.DataUtils.read_codes`.
+        :param y: Not used, present for scikit-learn API consistency.
+        :param fit_params: Not used, present for scikit-learn API consistency.
+        :return: The encoded catalog as numpy array.
+        """
+        # a file or an iterator is read once
+        x_df = DataUtils.ensure_pandas_dataframe(x)
+        if self.__mode == "factorized":
+            data_points = self.fit(x_df).transform(x_df)
+        else:
+            # the matrices of the values computed by the fit are encoded directly
+            plan = self.__check_plan(x_df)
+            data_points = self.__encode_matrices(
+                self.__fit(x_df), plan.get_deduplicate(), plan.get_matrix_free()
+            )
+        self.__catalog_embedded = True
+
+        return data_points
+
+    def transform_iter(self, chunks, chunk_size=10000):
+        """
+        Encodes new rows chunk by chunk by projecting them into the encoding of the fitted catalog,
+        see :meth:`.Reducer.project`. For each chunk, only the matrix between the chunk and the catalog
+        is computed, i.e. the memory is bounded by the chunk size times the size of the catalog.
+        In the ``factorized`` mode, the vectors of the values are looked up, see :meth:`transform`.
+
+        :param chunks: Either the data in numpy array, pandas dataframe or python list format,
+            which is split into chunks, or an iterable of chunks in one of these formats.
+        :param chunk_size: The amount of rows of each chunk, if the data is not given as iterable of chunks.
+        :return: A generator of the encoded chunks as numpy arrays.
+        :raise ValueError: The catalog is not encoded with :meth:`fit_transform` or
+            the *Reducer* does not support projections.
+        """
+        if self.__mode == "factorized":
+            if self.__value_tables is None:
+                raise ValueError("The ContextualEncoder needs to be fitted first.")
+            for chunk in DataUtils.iterate_chunks(chunks, chunk_size):
+                yield self.__lookup_values(DataUtils.ensure_pandas_dataframe(chunk))
+            return
+
+        if not self.__catalog_embedded:
+            raise ValueError("The catalog needs to be encoded with fit_transform first.")
+        if not self.__reducer.can_project():
+            raise ValueError(
+                f"The reducer {type(self.__reducer).__name__} does not support projections."
+            )
+
+        similarity = isinstance(self.__reducer, SimilarityMatrixReducer)
+
+        for chunk in DataUtils.iterate_chunks(chunks, chunk_size):
+            chunk_df = DataUtils.ensure_pandas_dataframe(chunk)
+
+            value_matrices = []
+            for col in chunk_df.columns:
+                codes, values = DataUtils.factorize(chunk_df[col])
+                value_matrix = self.__computer[col].compute_values(
+                    values, self.__catalog_values[col].to_numpy()
+                )
+                if similarity:
+                    value_matrix = self.__to_similarity(col, value_matrix)
+                else:
+                    value_matrix = self.__to_dissimilarity(col, value_matrix)
+                value_matrices.append(
+                    ValueMatrix(value_matrix, codes, self.__reduction_codes[col])
+                )
+
+            yield self.__reducer.project(
+                self.__aggregator.aggregate_values(value_matrices)
+            )
+
+    def transform_to_file(self, source, path, chunk_size=10000):
+        """
+        Encodes new rows chunk by chunk, see :meth:`transform_iter`,
+        and streams the encoded chunks into a file.
+        The format is chosen by the file extension, which can be ``.npy`` or ``.parquet``.
+        A ``.npy`` file can be loaded memory-mapped with ``numpy.load(path, mmap_mode="r")``.
+
+        :param source: Either the data in numpy array, pandas dataframe or python list format,
+            which is split into chunks, or an iterable of chunks in one of these formats.
+        :param path: The path of the file to write.
+        :param chunk_size: The amount of rows of each chunk, if the data is not given as iterable of chunks.
+        :return: The amount of written rows.
+        :raise ValueError: The file extension is not supported.
+        """
+        encoded_chunks = self.transform_iter(source, chunk_size=chunk_size)
+
+        if str(path).endswith(".npy"):
+            return DataUtils.write_npy(encoded_chunks, path)
+        elif str(path).endswith(".parquet"):
+            return DataUtils.write_parquet(encoded_chunks, path)
+        else:
+            raise ValueError(f"The file extension of {path} is not supported.")
+
+    def most_similar(self, query_rows, k=20):
+        """
+        Finds the most similar rows of the fitted catalog for each of the given query rows.
+        The search walks through the values of each column sorted by similarity and stops early,
+        as soon as no unseen row can be more similar, see :class:`.SimilarityIndex`.
+
+        :param query_rows: The query rows in the same format and with the same columns as the catalog.
+        :param k: The amount of rows to find for each query row.
+        :return: A tuple of the row indices within the catalog and their aggregated similarities
+            as 2D numpy arrays of size :math:`q \\times k`, with :math:`q` being the amount of query rows.
+            The rows are sorted by descending similarity.
+        :raise ValueError: The *ContextualEncoder* is not fitted.
+        """
+        if self.__index is None:
+            raise ValueError("The ContextualEncoder needs to be fitted first.")
+
+        q_df = DataUtils.ensure_pandas_dataframe(query_rows)
+
+        query_codes = []
+        query_similarities = []
+        catalog_codes = []
+        for col in q_df.columns:
+            codes, values = DataUtils.factorize(q_df[col])
+            catalog_values = self.__catalog_values[col]
+            value_matrix = self.__computer[col].compute_values(
+                values, catalog_values.to_numpy()
+            )
+            query_codes.append(codes)
+            query_similarities.append(self.__to_similarity(col, value_matrix))
+            catalog_codes.append(catalog_values.get_indexer(values))
+
+        k = min(k, len(self.__index))
+        indices = np.zeros((len(q_df), k), dtype=np.int64)
+        similarities = np.zeros((len(q_df), k))
+        for row in range(0, len(q_df)):
+            row_similarities = []
+            neighbours = []
+            for col in range(0, len(q_df.columns)):
+                code = query_codes[col][row]
+                row_similarities.append(query_similarities[col][code])
+                # values of the catalog have precomputed neighbour lists
+                if catalog_codes[col][code] >= 0:
+                    neighbours.append(
+                        self.__index.get_neighbours(col, catalog_codes[col][code])
+                    )
+                else:
+                    neighbours.append(
+                        np.argsort(-query_similarities[col][code], kind="stable")
+                    )
+
+            rows, scores = self.__index.query(row_similarities, k, neighbours=neighbours)
+            indices[row] = rows
+            similarities[row] = scores
+
+        return indices, similarities
+
+    def transform(self, x, categories=None):
         """
         Encodes the given contextual variables.
+        In the ``factorized`` mode, the vectors of the values are looked up in the tables of the last
+        :meth:`fit`, which is called with ``x`` if the *ContextualEncoder* is not fitted yet.
 
-        :param x: The data as numpy array, pandas dataframe or python list format.
+        :param x: The data as numpy array, pandas dataframe or python list format,
+            or as path of a ``.csv`` or ``.parquet`` file or iterator of chunks,
+            which is read in a streaming pass, see :meth:`.DataUtils.read_codes`.
+            Categorical columns and pyarrow dictionary arrays are encoded based on their codes.
+        :param categories: If given, ``x`` is interpreted as integer-coded numpy array,
+            see :meth:`.DataUtils.ensure_pandas_dataframe`.
         :return: The encoded data as numpy array.
+        :raise ValueError: The encoding does not fit into the available memory.
         """
+        x_df = DataUtils.ensure_pandas_dataframe(x, categories)
+        if self.__mode == "factorized":
+            if self.__value_tables is None:
+                self.fit(x_df)
+            return self.__lookup_values(x_df)
 
-        similarity_matrices = []
-        dissimilarity_matrices = []
+        vocabularies = self.__check_vocabularies(x_df)
+        plan = self.__check_plan(x_df)
 
-        x_df = DataUtils.ensure_pandas_dataframe(x)
+        value_matrices = []
+        for col in x_df.columns:
+            value_matrices.append(self.__compute_value_matrix(col, vocabularies[col]))
+
+        return self.__encode_matrices(
+            value_matrices, plan.get_deduplicate(), plan.get_matrix_free()
+        )
+
+    async def atransform(self, x, categories=None, executor=None):
+        """
+        Encodes the given contextual variables without blocking the event loop.
+        The matrices of all columns are computed concurrently within the given executor.
+        Since the *Measures* are shared, concurrent requests containing the same values
+        do not calculate the same comparison twice.
+
+        .. note::
+
+            If the calling task is cancelled, the running computations stop before their next row.
+            The similarity and dissimilarity matrices are the ones of the request that finished last.
+
+        :param x: The data as numpy array, pandas dataframe or python list format,
+            or as path of a ``.csv`` or ``.parquet`` file or iterator of chunks,
+            which is read in a streaming pass, see :meth:`.DataUtils.read_codes`.
+        :param categories: If given, ``x`` is interpreted as integer-coded numpy array,
+            see :meth:`.DataUtils.ensure_pandas_dataframe`.
+        :param executor: A thread based ``concurrent.futures.Executor``.
+            If ``None``, the default executor of the event loop is used.
+        :return: The encoded data as numpy array.
+        :raise ValueError: The encoding does not fit into the available memory.
+        """
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+
+        x_df = DataUtils.ensure_pandas_dataframe(x, categories)
+        if self.__mode == "factorized":
+            return await loop.run_in_executor(executor, self.transform, x_df)
+
+        vocabularies = self.__check_vocabularies(x_df)
+        plan = self.__check_plan(x_df)
 
+        futures = []
         for col in x_df.columns:
+            compute = functools.partial(
+                self.__compute_value_matrix,
+                col,
+                vocabularies[col],
+                cancel_event=cancel_event,
+            )
+            futures.append(loop.run_in_executor(executor, compute))
 
-            matrix = self.__computer[col].compute(x_df[col])
+        try:
+            value_matrices = await asyncio.gather(*futures)
+            data_points = await loop.run_in_executor(
+                executor,
+                self.__encode_matrices,
+                value_matrices,
+                plan.get_deduplicate(),
+                plan.get_matrix_free(),
+            )
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
 
-            if isinstance(self.__measures[col], SimilarityMeasure):
-                similarity_matrices.append(matrix)
-                dissimilarity_matrices.append(
-                    self.__inverters[col].similarity_to_dissimilarity(matrix)
-                )
-            elif isinstance(self.__measures[col], DissimilarityMeasure):
-                dissimilarity_matrices.append(matrix)
-                similarity_matrices.append(
-                    self.__inverters[col].dissimilarity_to_similarity(matrix)
+        return data_points
+
+    def __check_vocabularies(self, x_df):
+        """
+        Checks the values of all columns against the *Contexts* of their *Measures*,
+        so that unknown values are reported before the matrix of any column is computed,
+        see :meth:`.MatrixComputer.check_vocabulary`.
+        The values are checked only here, the matrices are computed on the checked values.
+
+        :param x_df: The data as pandas dataframe.
+        :return: A list with a tuple of the codes, the distinct values, the checked values
+            and the unknown forms of each column.
+        :raise ValueError: A value is not part of its *Context* and the unknown value policy is ``error``.
+        """
+        vocabularies = []
+        for col in x_df.columns:
+            codes, values = DataUtils.factorize(x_df[col])
+            checked_values, unknown_forms = self.__computer[col].check_vocabulary(values)
+            vocabularies.append((codes, values, checked_values, unknown_forms))
+
+        return vocabularies
+
+    def __compute_value_matrix(self, col, vocabulary, cancel_event=None):
+        """
+        Computes the matrix of a column from its checked values, see :meth:`__check_vocabularies`.
+
+        :param col: The index of the column.
+        :param vocabulary: The tuple of the codes, the distinct values, the checked values
+            and the unknown forms of the column.
+        :param cancel_event: An optional ``threading.Event``.
+            If it is set, the computation stops before the next value.
+        :return: The :class:`.ValueMatrix` of the column.
+        :raise CancelledError: The computation was cancelled using the ``cancel_event``.
+        """
+        codes, _, checked_values, unknown_forms = vocabulary
+        value_matrix = self.__computer[col].compute_values(
+            checked_values, cancel_event=cancel_event, unknown_forms=unknown_forms
+        )
+
+        return ValueMatrix(value_matrix, codes, codes)
+
+    def plan(self, x, categories=None):
+        """
+        Plans the encoding of the given data without comparing any values, see :class:`.Planner`.
+
+        :param x: The data as numpy array, pandas dataframe or python list format,
+            or as path of a ``.csv`` or ``.parquet`` file or iterator of chunks,
+            which is read in a streaming pass, see :meth:`.DataUtils.read_codes`.
+        :param categories: If given, ``x`` is interpreted as integer-coded numpy array,
+            see :meth:`.DataUtils.ensure_pandas_dataframe`.
+        :return: The :class:`.Plan`.
+        """
+        x_df = DataUtils.ensure_pandas_dataframe(x, categories)
+
+        return self.__planner.plan(
+            x_df,
+            self.__computer,
+            self.__reducer,
+            deduplicate=self.__deduplicate,
+            factorized=self.__mode == "factorized",
+            aggregator=self.__aggregator,
+            matrix_free=self.__matrix_free,
+        )
+
+    def explain(self, x, categories=None):
+        """
+        Describes how the given data would be encoded, i.e. the strategy of each column,
+        the amount of comparisons and the estimated memory, see :meth:`.Plan.explain`.
+
+        :param x: The data as numpy array, pandas dataframe or python list format,
+            or as path of a ``.csv`` or ``.parquet`` file or iterator of chunks,
+            which is read in a streaming pass, see :meth:`.DataUtils.read_codes`.
+        :param categories: If given, ``x`` is interpreted as integer-coded numpy array,
+            see :meth:`.DataUtils.ensure_pandas_dataframe`.
+        :return: The description as string.
+        """
+        return self.plan(x, categories).explain()
+
+    def __check_plan(self, x_df):
+        """
+        Plans the encoding of the given data and rejects it, if it does not fit into the available memory.
+
+        :param x_df: The data as pandas dataframe.
+        :return: The feasible :class:`.Plan`.
+        :raise ValueError: The encoding does not fit into the available memory.
+        """
+        plan = self.plan(x_df)
+        if not plan.is_feasible():
+            raise ValueError(
+                "The encoding does not fit into the available memory.\n" + plan.explain()
+            )
+
+        return plan
+
+    def __encode_matrices(self, value_matrices, deduplicate, matrix_free=False):
+        """
+        Converts the matrices of all columns to the kind of matrix the *Reducer* consumes,
+        aggregates them and reduces the aggregated matrix to vectors.
+        The *Inverters* are applied to the matrices of the distinct values,
+        which are expanded to all rows only while aggregating them.
+
+        :param value_matrices: A list with the :class:`.ValueMatrix` of each column.
+        :param deduplicate: If ``True``, only the distinct rows are aggregated and reduced.
+        :param matrix_free: If ``True``, the aggregated matrix is passed to the *Reducer* as operator.
+        :return: The encoded data as numpy array.
+        """
+        inverse = None
+        counts = None
+        if deduplicate:
+            value_matrices, inverse, counts = self.__deduplicate_rows(value_matrices)
+
+        self.__value_matrices = value_matrices
+        self.__similarity_matrix = None
+        self.__dissimilarity_matrix = None
+        self.__row_inverse = inverse
+        self.__reduction_codes = [m.get_row_codes() for m in value_matrices]
+        self.__catalog_embedded = False
+
+        # only the matrix consumed by the reducer is aggregated, the other one on demand
+        if matrix_free:
+            matrix = self.__aggregator.aggregate_operator(
+                self.__convert_matrices(similarity=True)
+            )
+        elif isinstance(self.__reducer, SimilarityMatrixReducer):
+            matrix = self.__aggregate_matrices(similarity=True)
+        else:
+            matrix = self.__aggregate_matrices(similarity=False)
+
+        if inverse is None:
+            return self.__reducer.reduce(matrix)
+
+        if self.__reducer.supports_weights():
+            return self.__reducer.reduce(matrix, weights=counts)[inverse]
+
+        # the reducer needs all rows, but the matrix is still computed on the distinct rows only
+        self.__reduction_codes = [codes[inverse] for codes in self.__reduction_codes]
+
+        return self.__reducer.reduce(matrix[np.ix_(inverse, inverse)])
+
+    def __aggregate_matrices(self, similarity):
+        """
+        Converts the matrices of the last encoding to similarity or dissimilarity matrices
+        and aggregates them. The result is cached.
+
+        :param similarity: If ``True``, the similarity matrix is aggregated, otherwise the dissimilarity matrix.
+        :return: The aggregated matrix as 2D numpy array or ``None``, if nothing was encoded yet.
+        """
+        if similarity and self.__similarity_matrix is not None:
+            return self.__similarity_matrix
+        if not similarity and self.__dissimilarity_matrix is not None:
+            return self.__dissimilarity_matrix
+        if self.__value_matrices is None:
+            return None
+
+        matrix = self.__aggregator.aggregate_values(self.__convert_matrices(similarity))
+        if similarity:
+            self.__similarity_matrix = matrix
+        else:
+            self.__dissimilarity_matrix = matrix
+
+        return matrix
+
+    def __convert_matrices(self, similarity):
+        """
+        Converts the matrices of the distinct values of the last encoding to similarity or dissimilarity matrices.
+
+        :param similarity: If ``True``, the matrices are converted to similarity matrices,
+            otherwise to dissimilarity matrices.
+        :return: A list with the converted :class:`.ValueMatrix` of each column.
+        """
+        if similarity:
+            convert = self.__to_similarity
+        else:
+            convert = self.__to_dissimilarity
+
+        converted_matrices = []
+        for col, value_matrix in enumerate(self.__value_matrices):
+            converted_matrices.append(value_matrix.apply(functools.partial(convert, col)))
+
+        return converted_matrices
+
+    def __fit_value_table(self, col, codes, value_matrix):
+        """
+        Embeds the distinct values of a column with a copy of the *Reducer*.
+        If the *Reducer* supports weights, the multiplicities of the values are used as weights,
+        so that frequent values are embedded more accurately.
+
+        :param col: The index of the column.
+        :param codes: The codes of the rows as 1D numpy array.
+        :param value_matrix: The matrix of the distinct values computed by the *Measure* of the column.
+        :return: A tuple of the embedded vectors of the values as 2D numpy array
+            and the *Reducer*, which is used to project further values.
+        """
+        reducer = copy.deepcopy(self.__reducer)
+        if isinstance(reducer, SimilarityMatrixReducer):
+            matrix = self.__to_similarity(col, value_matrix)
+        else:
+            matrix = self.__to_dissimilarity(col, value_matrix)
+
+        if reducer.supports_weights():
+            counts = np.bincount(codes, minlength=len(matrix))
+            vectors = reducer.reduce(matrix, weights=counts)
+        else:
+            vectors = reducer.reduce(matrix)
+
+        return vectors, reducer
+
+    def __lookup_values(self, x_df):
+        """
+        Encodes the rows by concatenating the vectors of their values, see the ``factorized`` mode.
+        Values that were not fitted are compared with the fitted values and projected.
+
+        :param x_df: The data as pandas dataframe.
+        :return: The encoded data as numpy array.
+        :raise ValueError: A value was not fitted and the *Reducer* does not support projections.
+        """
+        # the values that were not fitted are checked for all columns, before any of them is compared
+        lookups = []
+        for col in x_df.columns:
+            codes, values = DataUtils.factorize(x_df[col])
+            positions = self.__catalog_values[col].get_indexer(values)
+            known = positions >= 0
+            checked = None
+            if not known.all():
+                reducer = self.__value_tables[col][1]
+                if not reducer.can_project():
+                    raise ValueError(
+                        f"The values {list(values[~known])} of column {col} were not fitted "
+                        f"and the reducer {type(reducer).__name__} does not support projections."
+                    )
+                checked = self.__computer[col].check_vocabulary(values[~known])
+            lookups.append((codes, positions, known, checked))
+
+        blocks = []
+        for col, (codes, positions, known, checked) in enumerate(lookups):
+            table, reducer = self.__value_tables[col]
+            vectors = np.empty((len(positions), table.shape[1]))
+            vectors[known] = table[positions[known]]
+
+            if checked is not None:
+                checked_values, unknown_forms = checked
+                fitted_values, fitted_unknown_forms = self.__catalog_vocabularies[col]
+                matrix = self.__computer[col].compute_values(
+                    checked_values,
+                    fitted_values,
+                    unknown_forms=np.concatenate((unknown_forms, fitted_unknown_forms)),
                 )
+                if isinstance(reducer, SimilarityMatrixReducer):
+                    matrix = self.__to_similarity(col, matrix)
+                else:
+                    matrix = self.__to_dissimilarity(col, matrix)
+                vectors[~known] = reducer.project(matrix)
+
+            if self.__column_weights is not None:
+                vectors *= np.sqrt(self.__column_weights[col])
+            blocks.append(vectors[codes])
+
+        return np.hstack(blocks)
 
-        aggregated_similarity_matrix = self.__aggregator.aggregate(similarity_matrices)
-        aggregated_dissimilarity_matrix = self.__aggregator.aggregate(
-            dissimilarity_matrices
+    @staticmethod
+    def __deduplicate_rows(value_matrices):
+        """
+        Finds the distinct rows, i.e. the distinct tuples of the values of all columns.
+
+        :param value_matrices: A list with the :class:`.ValueMatrix` of each column.
+        :return: A tuple of the *ValueMatrices* of the distinct rows, the index of the distinct row of each row
+            and the multiplicities of the distinct rows.
+        """
+        codes = np.stack([m.get_row_codes() for m in value_matrices], axis=1)
+        unique_codes, inverse, counts = np.unique(
+            codes, axis=0, return_inverse=True, return_counts=True
         )
 
-        self.__similarity_matrix = aggregated_similarity_matrix
-        self.__dissimilarity_matrix = aggregated_dissimilarity_matrix
+        unique_matrices = []
+        for col, value_matrix in enumerate(value_matrices):
+            col_codes = unique_codes[:, col]
+            unique_matrices.append(
+                ValueMatrix(value_matrix.get_values(), col_codes, col_codes)
+            )
+
+        return unique_matrices, inverse.ravel(), counts
+
+    def __to_similarity(self, col, matrix):
+        """
+        Converts the matrix of the given column to a similarity matrix, if necessary.
+
+        :param col: The index of the column.
+        :param matrix: The similarity or dissimilarity matrix computed by the *Measure* of the column.
+        :return: The similarity matrix.
+        """
+        if isinstance(self.__measures[col], DissimilarityMeasure):
+            return self.__inverters[col].dissimilarity_to_similarity(matrix)
+
+        return matrix
+
+    def __to_dissimilarity(self, col, matrix):
+        """
+        Converts the matrix of the given column to a dissimilarity matrix, if necessary.
+
+        :param col: The index of the column.
+        :param matrix: The similarity or dissimilarity matrix computed by the *Measure* of the column.
+        :return: The dissimilarity matrix.
+        """
+        if isinstance(self.__measures[col], SimilarityMeasure):
+            return self.__inverters[col].similarity_to_dissimilarity(matrix)
 
-        if isinstance(self.__reducer, SimilarityMatrixReducer):
-            data_points = self.__reducer.reduce(self.__similarity_matrix)
+        return matrix
+
+    def pairwise(self, x, y=None, dissimilarity=False, chunk_size=None):
+        """
+        Computes the aggregated similarities or dissimilarities between the rows of two datasets,
+        e.g. to compare a few query rows with a large catalog.
+        Only the distinct values of each column are compared,
+        and the conversion by the *Inverters* takes place on the distinct values as well.
+
+        :param x: The first data as numpy array, pandas dataframe or python list format.
+        :param y: The second data in the same format and with the same columns as ``x``.
+            If ``None``, the rows of ``x`` are compared with each other.
+        :param dissimilarity: If ``True``, dissimilarities are returned instead of similarities.
+        :param chunk_size: The amount of rows of ``x`` that are expanded and aggregated at once.
+            If ``None``, a size is chosen that bounds the memory needed for the column matrices.
+        :return: A 2D numpy array of size :math:`n_1 \\times n_2`,
+            with :math:`n_1` and :math:`n_2` being the amount of rows of ``x`` and ``y``.
+        """
+        x_df = DataUtils.ensure_pandas_dataframe(x)
+        if y is None:
+            y_df = x_df
         else:
-            data_points = self.__reducer.reduce(self.__dissimilarity_matrix)
+            y_df = DataUtils.ensure_pandas_dataframe(y)
 
-        return data_points
+        value_matrices = []
+        for col in x_df.columns:
+            codes, values = DataUtils.factorize(x_df[col])
+            other_codes, other_values = DataUtils.factorize(y_df[col])
+            value_matrix = self.__computer[col].compute_values(values, other_values)
+
+            if dissimilarity:
+                value_matrix = self.__to_dissimilarity(col, value_matrix)
+            else:
+                value_matrix = self.__to_similarity(col, value_matrix)
+            value_matrices.append(ValueMatrix(value_matrix, codes, other_codes))
+
+        return self.__aggregator.aggregate_values(value_matrices, block_size=chunk_size)
+
+    def save(self, path):
+        """
+        Saves the *ContextualEncoder* into the given directory, including its configuration,
+        the *Contexts* with their compiled indexes, the caches of the *Measures*,
+        the similarity and dissimilarity matrices, the fitted catalog and the state of the *Reducer*.
+        Large arrays are stored as separate ``.npy`` files, see :meth:`.DataUtils.save_object`.
+
+        :param path: The path of the directory.
+        """
+        DataUtils.save_object(self, path)
+
+        return
+
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Loads a *ContextualEncoder* saved with :meth:`save`.
+        Since nothing is recomputed, loading is dominated by reading the files.
+
+        :param path: The path of the directory.
+        :param mmap: If ``True``, the large arrays are memory-mapped read-only
+            and shared by all processes loading the same directory.
+        :return: The loaded *ContextualEncoder*.
+        :raise ValueError: The directory does not contain a *ContextualEncoder*.
+        """
+        encoder = DataUtils.load_object(path, mmap=mmap)
+        if not isinstance(encoder, ContextualEncoder):
+            raise ValueError(
+                f"The directory {path} does not contain a ContextualEncoder."
+            )
+
+        return encoder
+
+    def share(self, name=None):
+        """
+        Publishes the *ContextualEncoder* within shared memory, so that worker processes can attach it
+        with :meth:`attach` and use a single copy of its matrices, indexes and tables.
+        Freezing the *Contexts* and *Measures* beforehand, see :meth:`.GraphBasedContext.freeze` and
+        :meth:`.Measure.freeze`, turns their heavy data into arrays that are shared as well.
+
+        :param name: The name of the shared memory. If ``None``, a unique name is chosen.
+        :return: The ``multiprocessing.shared_memory.SharedMemory`` instance,
+            which needs to be kept and unlinked by the calling process, see :meth:`.DataUtils.share_object`.
+        """
+        return DataUtils.share_object(self, name)
+
+    @staticmethod
+    def attach(name):
+        """
+        Attaches a *ContextualEncoder* published with :meth:`share`.
+
+        :param name: The name of the shared memory.
+        :return: The attached *ContextualEncoder*.
+        :raise ValueError: The shared memory does not contain a *ContextualEncoder*.
+        """
+        encoder = DataUtils.attach_object(name)
+        if not isinstance(encoder, ContextualEncoder):
+            raise ValueError(
+                f"The shared memory {name} does not contain a ContextualEncoder."
+            )
+
+        return encoder
 
     def get_similarity_matrix(self):
         """
         Gets the similarity matrix.
+        If the *Reducer* consumes dissimilarities, the matrix is aggregated on the first call.
+        If the rows are deduplicated, the matrix of the distinct rows is expanded on each call.
 
         :return: The similarity matrix as 2D numpy array.
         """
-        return self.__similarity_matrix
+        return self.__expand_rows(self.__aggregate_matrices(similarity=True))
 
     def get_dissimilarity_matrix(self):
         """
         Gets the dissimilarity matrix.
+        If the *Reducer* consumes similarities, the matrix is aggregated on the first call.
+        If the rows are deduplicated, the matrix of the distinct rows is expanded on each call.
 
         :return: The dissimilarity matrix as 2D numpy array.
         """
-        return self.__dissimilarity_matrix
+        return self.__expand_rows(self.__aggregate_matrices(similarity=False))
+
+    def __expand_rows(self, matrix):
+        """
+        Expands the matrix of the distinct rows to all rows, if the rows are deduplicated.
+
+        :param matrix: The matrix as 2D numpy array.
+        :return: The expanded matrix as 2D numpy array.
+        """
+        if matrix is None or self.__row_inverse is None:
+            return matrix
+
+        return matrix[np.ix_(self.__row_inverse, self.__row_inverse)]
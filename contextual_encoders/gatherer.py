@@ -26,8 +26,23 @@ Name        Formula
 id          :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\mathcal{M}(x, y)`
 first       :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\mathcal{M}(x_1, y_1)`
 smm         :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\frac{1}{2} \\Big( \\frac{1}{|x|} \\sum_{i=1}^{l_x} \\mathcal{M}(x_i, \\tilde{y}) + \\frac{1}{|y|} \\sum_{i=1}^{l_y} \\mathcal{M}(\\tilde{x}, y_i) \\Big)`
+mean        :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\frac{1}{|x| |y|} \\sum_{i=1}^{l_x} \\sum_{j=1}^{l_y} \\mathcal{M}(x_i, y_j)`
+hausdorff   :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\min \\big( \\min_{i} \\max_{j} \\mathcal{M}(x_i, y_j), \\min_{j} \\max_{i} \\mathcal{M}(x_i, y_j) \\big)`
+jaccard     :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\frac{I}{|x| + |y| - I}` with :math:`I = \\frac{1}{2} \\Big( \\sum_{i=1}^{l_x} \\max_{j} \\mathcal{M}(x_i, y_j) + \\sum_{j=1}^{l_y} \\max_{i} \\mathcal{M}(x_i, y_j) \\Big)`
 =========== ===========
 
+The formulas of ``hausdorff`` refer to *Similarity Measures*.
+For *Dissimilarity Measures*, the minima and maxima are swapped.
+
+.. note::
+
+    For reflexive *Measures*, see :meth:`.Measure.is_reflexive`, identical forms are exact matches,
+    i.e. their comparison value is :math:`1` for *Similarity Measures* and :math:`0` for *Dissimilarity Measures*.
+    The *Gatherers* look up exact matches by a set intersection first and skip the *Measure* for them.
+    Only vectorized *Measures*, see :meth:`.Measure.is_vectorized`, compare whole blocks of forms
+    including the identical ones, whose values are replaced afterwards.
+    If the best comparison value of a form is reached by an exact match, the remaining forms are not compared.
+
 .. note::
 
     If a *Measure* has the property ``multiple_values``,
@@ -37,7 +52,11 @@ smm         :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\frac{1}{2} \\Big( \\fra
     In this case, a *Gatherer* is not needed.
 """
 
+import numpy as np
+import pandas as pd
 from abc import ABC, abstractmethod
+from concurrent.futures import CancelledError
+from .measure import SimilarityMeasure
 
 
 class Gatherer(ABC):
@@ -99,6 +118,206 @@ class Gatherer(ABC):
 
         return self._gather(first, second)
 
+    def gather_block(self, first, second, cancel_event=None):
+        """
+        Combines all pairs of values of the two given tokenized columns.
+        By default, each pair is combined using ``_gather``.
+        Concrete *Gatherers* can override this method with a vectorized implementation
+        based on the form comparison values, see :meth:`.Measure.compare_block`.
+
+        :param first: The :class:`.TokenizedColumn` of the first values.
+        :param second: The :class:`.TokenizedColumn` of the second values.
+        :param cancel_event: An optional ``threading.Event``.
+            If it is set, the computation stops before the next value.
+        :return: The aggregated values as 2D numpy array of size :math:`u_1 \\times u_2`.
+        :raise CancelledError: The computation was cancelled using the ``cancel_event``.
+        """
+        if self._measure is None:
+            raise ValueError("No measure is specified")
+
+        block = np.zeros((len(first), len(second)))
+        second_values = [second.get_value(j) for j in range(0, len(second))]
+
+        for i in range(0, len(first)):
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError()
+            first_value = first.get_value(i)
+            for j in range(0, len(second)):
+                block[i, j] = self._gather(first_value, second_values[j])
+
+        return block
+
+    def _exact_match_value(self):
+        """
+        Returns the comparison value of identical forms of reflexive *Measures*,
+        which is :math:`1` for *Similarity Measures* and :math:`0` for *Dissimilarity Measures*.
+
+        :return: The comparison value.
+        """
+        if isinstance(self._measure, SimilarityMeasure):
+            return 1.0
+
+        return 0.0
+
+    def _best_values(self, forms, others, maximum):
+        """
+        Finds the best comparison value of each form with the other forms.
+        If the *Measure* is reflexive, forms that are part of the other forms are exact matches
+        and are not compared at all, as long as the exact match value is the best value,
+        i.e. the maximum for *Similarity Measures* and the minimum for *Dissimilarity Measures*.
+
+        :param forms: A list of attribute forms.
+        :param others: A list of the other attribute forms.
+        :param maximum: If ``True``, the maximum comparison value is searched, otherwise the minimum.
+        :return: A list with the best comparison value of each form.
+        """
+        similarity = isinstance(self._measure, SimilarityMeasure)
+        exact_matches = set()
+        if similarity == maximum and self._measure.is_reflexive():
+            exact_matches = set(forms).intersection(others)
+        exact_match_value = self._exact_match_value()
+
+        values = []
+        for a in forms:
+            if a in exact_matches:
+                values.append(exact_match_value)
+            elif maximum:
+                values.append(max(self._measure.compare(a, b) for b in others))
+            else:
+                values.append(min(self._measure.compare(a, b) for b in others))
+
+        return values
+
+    def _compare_forms(self, first, second):
+        """
+        Compares all forms of two tokenized columns in both directions and sets the values of the
+        exact matches, so that they agree with :meth:`_best_values`.
+
+        :param first: The :class:`.TokenizedColumn` of the first values.
+        :param second: The :class:`.TokenizedColumn` of the second values.
+        :return: A tuple of the form comparison values as 2D numpy arrays of size :math:`f_1 \\times f_2`
+            and :math:`f_2 \\times f_1`.
+        """
+        first_forms = first.get_forms()
+        second_forms = second.get_forms()
+
+        first_to_second = self._compare_block(first_forms, second_forms)
+        if self._measure.is_symmetric():
+            second_to_first = first_to_second.T
+        else:
+            second_to_first = self._compare_block(second_forms, first_forms)
+
+        return first_to_second, second_to_first
+
+    def _compare_block(self, first_forms, second_forms):
+        """
+        Compares all pairs of the given forms. If the *Measure* is reflexive, identical forms get the
+        exact match value, see :meth:`_exact_match_value`, without being compared.
+        Vectorized *Measures* compare the whole block at once and the exact matches are set afterwards.
+
+        :param first_forms: The distinct forms of the rows as 1D numpy array.
+        :param second_forms: The distinct forms of the columns as 1D numpy array.
+        :return: The form comparison values as 2D numpy array.
+        """
+        if not self._measure.is_reflexive():
+            return self._measure.compare_block(first_forms, second_forms)
+
+        positions = pd.Index(second_forms, tupleize_cols=False).get_indexer(first_forms)
+        matches = np.flatnonzero(positions >= 0)
+        if len(matches) == 0:
+            return self._measure.compare_block(first_forms, second_forms)
+
+        if self._measure.is_vectorized():
+            forms_block = np.array(
+                self._measure.compare_block(first_forms, second_forms), dtype=np.float64
+            )
+        else:
+            forms_block = np.empty((len(first_forms), len(second_forms)))
+
+            # the rows and columns without an exact match contain no identical forms
+            rows = np.flatnonzero(positions < 0)
+            columns = np.setdiff1d(np.arange(len(second_forms)), positions[matches])
+            if len(rows) > 0:
+                forms_block[rows] = self._measure.compare_block(
+                    first_forms[rows], second_forms
+                )
+            if len(columns) > 0:
+                forms_block[np.ix_(matches, columns)] = self._measure.compare_block(
+                    first_forms[matches], second_forms[columns]
+                )
+
+            # the remaining pairs of forms with an exact match are compared one by one
+            for i in matches:
+                for j in positions[matches]:
+                    if j != positions[i]:
+                        forms_block[i, j] = self._measure.compare(
+                            first_forms[i], second_forms[j]
+                        )
+
+        forms_block[matches, positions[matches]] = self._exact_match_value()
+
+        return forms_block
+
+    @staticmethod
+    def _reduce_per_value(forms_block, values, ufunc):
+        """
+        Reduces the comparison values between each form and the forms of each value.
+
+        :param forms_block: The form comparison values as 2D numpy array,
+            with the columns referring to the forms of the ``values``.
+        :param values: The :class:`.TokenizedColumn` of the values.
+        :param ufunc: The reducing numpy ufunc, e.g. ``numpy.minimum``.
+        :return: A 2D numpy array of size :math:`f \\times u`,
+            with :math:`f` being the amount of rows of the ``forms_block``.
+        """
+        return ufunc.reduceat(
+            forms_block[:, values.get_form_ids()], values.get_offsets()[:-1], axis=1
+        )
+
+    @staticmethod
+    def _max_per_value(forms_block, values):
+        """
+        Calculates the maximum comparison value between each form and the forms of each value.
+
+        :param forms_block: The form comparison values as 2D numpy array,
+            with the columns referring to the forms of the ``values``.
+        :param values: The :class:`.TokenizedColumn` of the values.
+        :return: A 2D numpy array of size :math:`f \\times u`,
+            with :math:`f` being the amount of rows of the ``forms_block``.
+        """
+        return np.maximum.reduceat(
+            forms_block[:, values.get_form_ids()], values.get_offsets()[:-1], axis=1
+        )
+
+    @staticmethod
+    def _mean_per_value(form_rows, values):
+        """
+        Calculates the mean of the given rows over the forms of each value.
+
+        :param form_rows: A 2D numpy array with one row per form of the ``values``.
+        :param values: The :class:`.TokenizedColumn` of the values.
+        :return: A 2D numpy array with one row per value.
+        """
+        sums = np.add.reduceat(
+            form_rows[values.get_form_ids()], values.get_offsets()[:-1], axis=0
+        )
+
+        return sums / values.get_lengths()[:, np.newaxis]
+
+    @staticmethod
+    def _reduce_rows_per_value(form_rows, values, ufunc):
+        """
+        Reduces the given rows over the forms of each value.
+
+        :param form_rows: A 2D numpy array with one row per form of the ``values``.
+        :param values: The :class:`.TokenizedColumn` of the values.
+        :param ufunc: The reducing numpy ufunc, e.g. ``numpy.minimum``.
+        :return: A 2D numpy array with one row per value.
+        """
+        return ufunc.reduceat(
+            form_rows[values.get_form_ids()], values.get_offsets()[:-1], axis=0
+        )
+
 
 class GathererFactory:
     """
@@ -110,7 +329,8 @@ class GathererFactory:
         """
         Creates a *Gatherer* given the name.
 
-        :param gatherer: The name of the *Gatherer*, which can be ``id``, ``first`` or ``smm``.
+        :param gatherer: The name of the *Gatherer*, which can be ``id``, ``first``, ``smm``,
+            ``mean``, ``hausdorff`` or ``jaccard``.
         :return: The concrete instance of the *Gatherer*.
         """
         if gatherer == "id":
@@ -119,6 +339,12 @@ class GathererFactory:
             return FirstValueGatherer()
         elif gatherer == "smm":
             return SymMaxMeanGatherer()
+        elif gatherer == "mean":
+            return MeanGatherer()
+        elif gatherer == "hausdorff":
+            return HausdorffGatherer()
+        elif gatherer == "jaccard":
+            return SoftJaccardGatherer()
         else:
             raise ValueError(f"A gatherer of type {gatherer} does not exist.")
 
@@ -143,6 +369,9 @@ class IdentityGatherer(Gatherer):
         :param second: The value of the second attribute.
         :return: The value returned from the measure.
         """
+        if first == second and self._measure.is_reflexive():
+            return self._exact_match_value()
+
         return self._measure.compare(first, second)
 
 
@@ -169,8 +398,36 @@ class FirstValueGatherer(Gatherer):
         first = first[0]
         second = second[0]
 
+        if first == second and self._measure.is_reflexive():
+            return self._exact_match_value()
+
         return self._measure.compare(first, second)
 
+    def gather_block(self, first, second, cancel_event=None):
+        """
+        Gathers all pairs of values by only comparing the distinct first forms.
+
+        :param first: The :class:`.TokenizedColumn` of the first values.
+        :param second: The :class:`.TokenizedColumn` of the second values.
+        :param cancel_event: Not used, since the computation is vectorized.
+        :return: The combined values as 2D numpy array of size :math:`u_1 \\times u_2`.
+        """
+        if self._measure is None:
+            raise ValueError("No measure is specified")
+
+        first_ids, first_inverse = np.unique(
+            first.get_first_form_ids(), return_inverse=True
+        )
+        second_ids, second_inverse = np.unique(
+            second.get_first_form_ids(), return_inverse=True
+        )
+
+        first_forms = first.get_forms()[first_ids]
+        second_forms = second.get_forms()[second_ids]
+        forms_block = self._compare_block(first_forms, second_forms)
+
+        return forms_block[np.ix_(first_inverse, second_inverse)]
+
 
 class SymMaxMeanGatherer(Gatherer):
     """
@@ -193,34 +450,229 @@ class SymMaxMeanGatherer(Gatherer):
         :param second: The value of the second attribute.
         :return: The combined value.
         """
-        sum1 = 0.0
-        sum2 = 0.0
+        # the maxima of the forms of first over the forms of second and vice versa
+        sum1 = sum(self._best_values(first, second, maximum=True)) / len(first)
+        sum2 = sum(self._best_values(second, first, maximum=True)) / len(second)
+
+        # combine both sums
+        return 0.5 * (sum1 + sum2)
+
+    def gather_block(self, first, second, cancel_event=None):
+        """
+        Gathers all pairs of values symmetrically based on the maximum form comparison values.
+        The forms of both columns are compared once and reduced as arrays afterwards.
+
+        :param first: The :class:`.TokenizedColumn` of the first values.
+        :param second: The :class:`.TokenizedColumn` of the second values.
+        :param cancel_event: Not used, since the computation is vectorized.
+        :return: The combined values as 2D numpy array of size :math:`u_1 \\times u_2`.
+        """
+        if self._measure is None:
+            raise ValueError("No measure is specified")
+
+        if len(first) == 0 or len(second) == 0:
+            return np.zeros((len(first), len(second)))
+
+        first_to_second, second_to_first = self._compare_forms(first, second)
+
+        # mean over the forms of the first values of the max over the forms of the second values
+        sum1 = self._mean_per_value(self._max_per_value(first_to_second, second), first)
+        # and vice versa
+        sum2 = self._mean_per_value(self._max_per_value(second_to_first, first), second)
+
+        return 0.5 * (sum1 + sum2.T)
+
+
+class MeanGatherer(Gatherer):
+    """
+    A *Gatherer* that averages the comparison values of all pairs of attribute forms (average linkage).
+    It can be seen as a mapping
+
+    .. centered::
+        :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\frac{1}{|x| |y|} \\sum_{i=1}^{l_x} \\sum_{j=1}^{l_y} \\mathcal{M}(x_i, y_j)`,
+
+    with :math:`\\mathcal{M}` being the *Similarity* or *Dissimilarity Measure*
+    and :math:`|x|` the amount of attribute forms of the attribute :math:`x`.
+    It can be used with the ``mean`` option.
+    """
+
+    def _gather(self, first, second):
+        """
+        Gathers two attributes by averaging the comparison values of all pairs of forms.
+
+        :param first: The value of the first attribute.
+        :param second: The value of the second attribute.
+        :return: The combined value.
+        """
+        exact_match_value = self._exact_match_value()
+        reflexive = self._measure.is_reflexive()
 
-        # sum over a in first
+        total = 0.0
         for a in first:
-            # get max value_compare(a, b) with b in second
-            max_value = 0.0
             for b in second:
-                temp = self._measure.compare(a, b)
-                if temp > max_value:
-                    max_value = temp
-            sum1 += max_value
-
-        # normalize to size of first
-        sum1 /= len(first)
-
-        # sum over b in second
-        for b in second:
-            # get max value_compare(b, a) with a in first
-            max_value = 0.0
-            for a in first:
-                temp = self._measure.compare(b, a)
-                if temp > max_value:
-                    max_value = temp
-            sum2 += max_value
-
-        # normalize to size of second
-        sum2 /= len(second)
+                if reflexive and a == b:
+                    total += exact_match_value
+                else:
+                    total += self._measure.compare(a, b)
 
-        # combine both sums
-        return 0.5 * (sum1 + sum2)
+        return total / (len(first) * len(second))
+
+    def gather_block(self, first, second, cancel_event=None):
+        """
+        Gathers all pairs of values by averaging the form comparison values.
+        The forms of both columns are compared once and averaged as arrays afterwards.
+
+        :param first: The :class:`.TokenizedColumn` of the first values.
+        :param second: The :class:`.TokenizedColumn` of the second values.
+        :param cancel_event: Not used, since the computation is vectorized.
+        :return: The combined values as 2D numpy array of size :math:`u_1 \\times u_2`.
+        """
+        if self._measure is None:
+            raise ValueError("No measure is specified")
+
+        if len(first) == 0 or len(second) == 0:
+            return np.zeros((len(first), len(second)))
+
+        first_to_second, _ = self._compare_forms(first, second)
+
+        # mean over the forms of the first values, then over the forms of the second values
+        means = self._mean_per_value(first_to_second, first)
+
+        return self._mean_per_value(means.T, second).T
+
+
+class HausdorffGatherer(Gatherer):
+    """
+    A *Gatherer* based on the Hausdorff distance of the sets of attribute forms,
+    i.e. the worst comparison value of a form with its best matching form of the other attribute.
+    For *Similarity Measures*, it can be seen as a mapping
+
+    .. centered::
+        :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\min \\big( \\min_{i} \\max_{j} \\mathcal{M}(x_i, y_j), \\min_{j} \\max_{i} \\mathcal{M}(x_i, y_j) \\big)`.
+
+    For *Dissimilarity Measures*, the minima and maxima are swapped.
+    It can be used with the ``hausdorff`` option.
+    """
+
+    def _gather(self, first, second):
+        """
+        Gathers two attributes based on the Hausdorff distance of their forms.
+
+        :param first: The value of the first attribute.
+        :param second: The value of the second attribute.
+        :return: The combined value.
+        """
+        similarity = isinstance(self._measure, SimilarityMeasure)
+        outer = min if similarity else max
+
+        return outer(
+            outer(self._best_values(first, second, maximum=similarity)),
+            outer(self._best_values(second, first, maximum=similarity)),
+        )
+
+    def gather_block(self, first, second, cancel_event=None):
+        """
+        Gathers all pairs of values based on the Hausdorff distance of their forms.
+        The forms of both columns are compared once and reduced as arrays afterwards.
+
+        :param first: The :class:`.TokenizedColumn` of the first values.
+        :param second: The :class:`.TokenizedColumn` of the second values.
+        :param cancel_event: Not used, since the computation is vectorized.
+        :return: The combined values as 2D numpy array of size :math:`u_1 \\times u_2`.
+        """
+        if self._measure is None:
+            raise ValueError("No measure is specified")
+
+        if len(first) == 0 or len(second) == 0:
+            return np.zeros((len(first), len(second)))
+
+        if isinstance(self._measure, SimilarityMeasure):
+            inner, outer = np.maximum, np.minimum
+        else:
+            inner, outer = np.minimum, np.maximum
+
+        first_to_second, second_to_first = self._compare_forms(first, second)
+
+        # the best match of each form within each other value, then the worst form of each value
+        values1 = self._reduce_rows_per_value(
+            self._reduce_per_value(first_to_second, second, inner), first, outer
+        )
+        values2 = self._reduce_rows_per_value(
+            self._reduce_per_value(second_to_first, first, inner), second, outer
+        )
+
+        return outer(values1, values2.T)
+
+
+class SoftJaccardGatherer(Gatherer):
+    """
+    A *Gatherer* based on a soft Jaccard index of the sets of attribute forms,
+    in which the intersection is the symmetric sum of the best matching comparison values.
+    For *Similarity Measures*, it can be seen as a mapping
+
+    .. centered::
+        :math:`\\mathcal{G} (x, y, \\mathcal{M}) = \\frac{I}{|x| + |y| - I}`, with
+        :math:`I = \\frac{1}{2} \\Big( \\sum_{i=1}^{l_x} \\max_{j} \\mathcal{M}(x_i, y_j) + \\sum_{j=1}^{l_y} \\max_{i} \\mathcal{M}(x_i, y_j) \\Big)`.
+
+    Attributes with the same forms get the value :math:`1`, attributes without similar forms the value :math:`0`.
+    For *Dissimilarity Measures*, the index is calculated on :math:`1 - \\mathcal{M}`
+    and :math:`1 - \\mathcal{G}` is returned.
+    It can be used with the ``jaccard`` option.
+    """
+
+    def _gather(self, first, second):
+        """
+        Gathers two attributes based on the soft Jaccard index of their forms.
+
+        :param first: The value of the first attribute.
+        :param second: The value of the second attribute.
+        :return: The combined value.
+        """
+        similarity = isinstance(self._measure, SimilarityMeasure)
+        best1 = np.array(self._best_values(first, second, maximum=similarity))
+        best2 = np.array(self._best_values(second, first, maximum=similarity))
+        if not similarity:
+            best1 = 1.0 - best1
+            best2 = 1.0 - best2
+
+        intersection = 0.5 * (best1.sum() + best2.sum())
+        index = intersection / (len(first) + len(second) - intersection)
+
+        return index if similarity else 1.0 - index
+
+    def gather_block(self, first, second, cancel_event=None):
+        """
+        Gathers all pairs of values based on the soft Jaccard index of their forms.
+        The forms of both columns are compared once and reduced as arrays afterwards.
+
+        :param first: The :class:`.TokenizedColumn` of the first values.
+        :param second: The :class:`.TokenizedColumn` of the second values.
+        :param cancel_event: Not used, since the computation is vectorized.
+        :return: The combined values as 2D numpy array of size :math:`u_1 \\times u_2`.
+        """
+        if self._measure is None:
+            raise ValueError("No measure is specified")
+
+        if len(first) == 0 or len(second) == 0:
+            return np.zeros((len(first), len(second)))
+
+        similarity = isinstance(self._measure, SimilarityMeasure)
+        first_to_second, second_to_first = self._compare_forms(first, second)
+        if not similarity:
+            first_to_second = 1.0 - first_to_second
+            second_to_first = 1.0 - second_to_first
+
+        # the sum over the forms of the first values of the max over the forms of the second values
+        sum1 = self._reduce_rows_per_value(
+            self._reduce_per_value(first_to_second, second, np.maximum), first, np.add
+        )
+        # and vice versa
+        sum2 = self._reduce_rows_per_value(
+            self._reduce_per_value(second_to_first, first, np.maximum), second, np.add
+        )
+
+        intersection = 0.5 * (sum1 + sum2.T)
+        sizes = first.get_lengths()[:, np.newaxis] + second.get_lengths()[np.newaxis, :]
+        index = intersection / (sizes - intersection)
+
+        return index if similarity else 1.0 - index
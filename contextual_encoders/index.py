@@ -0,0 +1,165 @@
+"""
+SimilarityIndex
+====================================
+The *SimilarityIndex* answers top-:math:`k` queries, i.e. it finds the :math:`k` rows of a catalog
+that are most similar to a query row, without computing the similarity to every row of the catalog.
+
+For each attribute, the index stores the rows of the catalog grouped by their value (posting lists)
+and, for each value, the other values sorted by descending similarity (neighbour lists).
+A query walks the neighbour lists of its values in parallel and only scores the rows it encounters.
+Since the similarity of the rows that have not been encountered yet is bounded by the aggregation of the
+current positions within the neighbour lists, the search stops as soon as the :math:`k`-th best score reaches
+this threshold (threshold algorithm).
+
+.. note::
+
+    The early termination requires a monotone :class:`.Aggregator`, see :meth:`.Aggregator.is_monotone`.
+    For other *Aggregators*, all rows of the catalog are scored.
+"""
+
+import numpy as np
+
+
+class SimilarityIndex:
+    """
+    An index for querying the most similar rows of a catalog.
+    """
+
+    def __init__(self, codes, value_similarities, aggregator):
+        """
+        Initializes the *SimilarityIndex*.
+
+        :param codes: A list with the codes of the catalog rows for each column as 1D integer numpy arrays.
+        :param value_similarities: A list with the similarity matrix of the distinct values of each column
+            as 2D numpy arrays of size :math:`u \\times u`.
+        :param aggregator: The :class:`.Aggregator` used to combine the similarities of the columns.
+        """
+        self.__codes = codes
+        self.__aggregator = aggregator
+        self.__n_rows = len(codes[0]) if len(codes) > 0 else 0
+
+        self.__postings = []
+        self.__neighbours = []
+        for col_codes, similarities in zip(codes, value_similarities):
+            n_values = len(similarities)
+            order = np.argsort(col_codes, kind="stable")
+            offsets = np.zeros(n_values + 1, dtype=np.int64)
+            np.cumsum(np.bincount(col_codes, minlength=n_values), out=offsets[1:])
+            self.__postings.append((order, offsets))
+            self.__neighbours.append(np.argsort(-similarities, axis=1, kind="stable"))
+
+        return
+
+    def __len__(self):
+        """
+        Returns the amount of rows of the catalog.
+
+        :return: The amount of rows.
+        """
+        return self.__n_rows
+
+    def get_neighbours(self, col, code):
+        """
+        Returns the values of a column sorted by descending similarity to the given value.
+
+        :param col: The index of the column.
+        :param code: The code of the value within the catalog.
+        :return: The codes of the values as 1D numpy array.
+        """
+        return self.__neighbours[col][code]
+
+    def query(self, similarities, k, neighbours=None):
+        """
+        Finds the :math:`k` most similar rows of the catalog for a single query row.
+
+        :param similarities: A list with the similarities of the query value to all catalog values
+            for each column as 1D numpy arrays.
+        :param k: The amount of rows to find.
+        :param neighbours: An optional list with the catalog values sorted by descending similarity
+            for each column, see :meth:`get_neighbours`. If ``None``, the values are sorted on the fly.
+        :return: A tuple of the row indices and their similarities as 1D numpy arrays,
+            sorted by descending similarity.
+        """
+        k = min(k, self.__n_rows)
+        if k <= 0 or len(similarities) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        if neighbours is None:
+            neighbours = [np.argsort(-s, kind="stable") for s in similarities]
+
+        if not self.__aggregator.is_monotone():
+            scores = self.__score(similarities, np.arange(self.__n_rows))
+            return self.__top(np.arange(self.__n_rows), scores, k)
+
+        n_cols = len(similarities)
+        # a set keeps each query proportional to the touched rows instead of the catalog size
+        seen = set()
+        positions = np.zeros(n_cols, dtype=np.int64)
+        best_rows = np.zeros(0, dtype=np.int64)
+        best_scores = np.zeros(0)
+
+        while True:
+            for col in range(0, n_cols):
+                # sorted access: take all rows having the next most similar value
+                order, offsets = self.__postings[col]
+                value = neighbours[col][positions[col]]
+                positions[col] += 1
+                rows = order[offsets[value] : offsets[value + 1]]
+                rows = np.fromiter(
+                    (row for row in rows.tolist() if row not in seen), dtype=np.int64
+                )
+                seen.update(rows.tolist())
+
+                # random access: score the new rows over all columns
+                if len(rows) > 0:
+                    scores = self.__score(similarities, rows)
+                    best_rows, best_scores = self.__top(
+                        np.concatenate((best_rows, rows)),
+                        np.concatenate((best_scores, scores)),
+                        k,
+                    )
+
+            # every column walks through all rows, so one exhausted column means all rows are seen
+            exhausted = positions >= np.array([len(n) for n in neighbours])
+            if exhausted.any():
+                break
+
+            bounds = [similarities[c][neighbours[c][positions[c]]] for c in range(n_cols)]
+            threshold = self.__aggregator.aggregate(bounds)
+            if len(best_scores) == k and best_scores[-1] >= threshold:
+                break
+
+        return best_rows, best_scores
+
+    def __score(self, similarities, rows):
+        """
+        Calculates the aggregated similarities of the query row to the given rows.
+
+        :param similarities: A list with the similarities of the query value to all catalog values.
+        :param rows: The indices of the rows as 1D numpy array.
+        :return: The aggregated similarities as 1D numpy array.
+        """
+        matrices = []
+        for col, col_similarities in enumerate(similarities):
+            matrices.append(col_similarities[self.__codes[col][rows]])
+
+        return np.asarray(self.__aggregator.aggregate(matrices))
+
+    @staticmethod
+    def __top(rows, scores, k):
+        """
+        Selects the :math:`k` rows with the highest scores.
+
+        :param rows: The indices of the rows as 1D numpy array.
+        :param scores: The scores of the rows as 1D numpy array.
+        :param k: The amount of rows to select.
+        :return: A tuple of the selected rows and scores, sorted by descending score.
+        """
+        if len(scores) > k:
+            selection = np.argpartition(-scores, k - 1)[:k]
+            rows = rows[selection]
+            scores = scores[selection]
+
+        order = np.argsort(-scores, kind="stable")
+
+        return rows[order], scores[order]
@@ -19,12 +19,23 @@ it maps a similarity or dissimilarity value to each attribute form.
 .. note::
 
     A *Measure* always needs to return values within the range :math:`[0,1]`.
+
+.. note::
+
+    The cached values of a *Measure* follow the modifications of its *Context*.
+    Before comparing, the version of the *Context* is checked and only the values of pairs
+    containing an affected concept are discarded, see :meth:`.Context.get_changes` and :meth:`Measure.invalidate`.
 """
 
+import ast
+import hashlib
 import json
+import threading
+import numpy as np
 import networkx as nx
 from networkx.algorithms.dag import dag_longest_path
 from abc import ABC, abstractmethod
+from .registry import CacheRegistry
 
 
 class Measure(ABC):
@@ -47,6 +58,105 @@ class Measure(ABC):
         self.__symmetric = symmetric
         self.__multiple_values = multiple_values
         self.__cache = dict()
+        self.__lock = threading.Lock()
+        self.__pending = dict()
+        self.__table_forms = None
+        self.__table_ids = None
+        self.__table = None
+        self.__unknown_forms = frozenset()
+        self.__unknown_value = None
+
+        # modifications of the context after the construction are tracked, see __synchronize
+        context = self.get_context()
+        self.__context_version = None if context is None else context.get_version()
+
+    def __getstate__(self):
+        """
+        Returns the state of the *Measure* for pickling and copying.
+        Synchronization primitives are excluded, since they cannot be pickled.
+
+        :return: The state as dictionary.
+        """
+        state = self.__dict__.copy()
+        del state["_Measure__lock"]
+        del state["_Measure__pending"]
+        # the lookup of the table is rebuilt on demand
+        state["_Measure__table_ids"] = None
+
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the state of the *Measure* and recreates the synchronization primitives.
+
+        :param state: The state as dictionary.
+        """
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+        self.__pending = dict()
+
+        return
+
+    def get_fingerprint(self):
+        """
+        Returns a deterministic fingerprint of the *Measure*, i.e. a hash of its type, its parameters
+        and the fingerprint of its *Context*, see :meth:`.GraphBasedContext.get_fingerprint`.
+        *Measures* with the same fingerprint compute the same comparison values.
+
+        :return: The fingerprint as hexadecimal string or ``None``, if the *Measure* is not based on a *Context*.
+        """
+        context = self.get_context()
+        if context is None:
+            return None
+
+        description = [
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            self._get_parameters(),
+            context.get_fingerprint(),
+        ]
+        text = json.dumps(description, sort_keys=True, default=str)
+
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _get_parameters(self):
+        """
+        Returns the parameters of the *Measure*, which influence the comparison values,
+        apart from the *Context*. They are part of the fingerprint, see :meth:`get_fingerprint`.
+        *Measures* with parameters override this method.
+
+        :return: A dictionary of the parameters, which can be serialized to JSON.
+        """
+        return dict()
+
+    def share_cache(self):
+        """
+        Shares the cache and the table with all *Measures* with the same fingerprint
+        using the :class:`.CacheRegistry`, e.g. with the *Measure* of another column using the same *Context*.
+        The entries of the own cache are added to the shared cache.
+        If the *Measure* is not frozen, it adopts the table of the shared state, otherwise it provides its table.
+        This method is called by the :class:`.MatrixComputer` once before each computation.
+        """
+        self.__synchronize()
+        fingerprint = self.get_fingerprint()
+        if fingerprint is None:
+            return
+
+        cache = self.__cache
+        state = CacheRegistry.get(
+            ("measure", fingerprint), lambda: {"cache": cache, "table": None}
+        )
+
+        if state["cache"] is not self.__cache:
+            state["cache"].update(self.__cache)
+            self.__cache = state["cache"]
+
+        if self.__table is not None:
+            state["table"] = (self.__table_forms, self.__table)
+        elif state["table"] is not None:
+            self.__table_forms, self.__table = state["table"]
+            self.__table_ids = None
+
+        return
 
     @abstractmethod
     def _compare(self, first, second):
@@ -64,44 +174,324 @@ class Measure(ABC):
         """
         Compares the two attributes or attribute forms.
         This method caches precalculated values within an in-memory dictionary.
+        If the same comparison is currently calculated by another thread,
+        the method waits for its result instead of calculating it twice.
 
         :param first: The first attribute or attribute form.
         :param second: The second attribute or attribute form.
         :return: The comparison value which is in :math:`[0,1]`.
         """
+        self.__synchronize()
+        if self.__unknown_forms and (
+            first in self.__unknown_forms or second in self.__unknown_forms
+        ):
+            return self.__unknown_value
+
+        if self.__table is not None:
+            ids = self.__lookup_table([first, second])
+            if ids is not None:
+                return float(self.__table[ids[0], ids[1]])
+
         cached_value = self.__read_from_cache(first, second)
         if cached_value is not None:
             return cached_value
-        else:
+
+        cache_key = self.__generate_cache_key(first, second)
+        reverse_cache_key = self.__generate_cache_key(second, first)
+
+        with self.__lock:
+            pending = self.__pending.get(cache_key)
+            if pending is None and self.__symmetric:
+                pending = self.__pending.get(reverse_cache_key)
+            if pending is None:
+                # the value might have been written since the first lookup
+                cached_value = self.__read_from_cache(first, second)
+                if cached_value is not None:
+                    return cached_value
+                self.__pending[cache_key] = threading.Event()
+
+        if pending is not None:
+            pending.wait()
+            cached_value = self.__read_from_cache(first, second)
+            if cached_value is not None:
+                return cached_value
+            # the other thread failed, so the value is calculated here
+            return self._compare(first, second)
+
+        try:
             value = self._compare(first, second)
             self.__write_to_cache(first, second, value)
-            return value
+        finally:
+            with self.__lock:
+                self.__pending.pop(cache_key).set()
+
+        return value
+
+    def compare_block(self, first, second):
+        """
+        Compares all pairs of the given attribute forms.
+        If the *Measure* is frozen and all forms are part of the table, the values are taken from the table.
+        Otherwise, the comparison is done by :meth:`_compare_block`.
+        Pairs with an unknown form get the fixed value, see :meth:`set_unknown_forms`.
+
+        :param first: A sequence of :math:`a` attribute forms.
+        :param second: A sequence of :math:`b` attribute forms.
+        :return: The comparison values as 2D numpy array of size :math:`a \\times b`.
+        """
+        self.__synchronize()
+        if self.__unknown_forms:
+            return self.__compare_known_block(first, second)
+
+        return self.__compare_table_block(first, second)
+
+    def __compare_known_block(self, first, second):
+        """
+        Compares the known forms block-wise and fills the pairs with an unknown form with the fixed value.
+
+        :param first: A sequence of :math:`a` attribute forms.
+        :param second: A sequence of :math:`b` attribute forms.
+        :return: The comparison values as 2D numpy array of size :math:`a \\times b`.
+        """
+        first_known = np.fromiter(
+            (form not in self.__unknown_forms for form in first),
+            dtype=bool,
+            count=len(first),
+        )
+        second_known = np.fromiter(
+            (form not in self.__unknown_forms for form in second),
+            dtype=bool,
+            count=len(second),
+        )
+
+        block = np.full((len(first), len(second)), self.__unknown_value, dtype=np.float64)
+        if first_known.any() and second_known.any():
+            first_forms = np.asarray(first, dtype=object)[first_known]
+            second_forms = np.asarray(second, dtype=object)[second_known]
+            block[np.ix_(first_known, second_known)] = self.__compare_table_block(
+                first_forms, second_forms
+            )
+
+        return block
+
+    def __compare_table_block(self, first, second):
+        """
+        Compares all pairs of the given attribute forms using the table, if possible,
+        or :meth:`_compare_block` otherwise.
+
+        :param first: A sequence of :math:`a` attribute forms.
+        :param second: A sequence of :math:`b` attribute forms.
+        :return: The comparison values as 2D numpy array of size :math:`a \\times b`.
+        """
+        if self.__table is not None:
+            first_ids = self.__lookup_table(first)
+            second_ids = self.__lookup_table(second)
+            if first_ids is not None and second_ids is not None:
+                return self.__table[np.ix_(first_ids, second_ids)]
+
+        return self._compare_block(first, second)
+
+    def _compare_block(self, first, second):
+        """
+        Compares all pairs of the given attribute forms.
+        By default, each pair is compared using :meth:`compare`.
+        Concrete *Measures* can override this method with a vectorized implementation.
+
+        :param first: A sequence of :math:`a` attribute forms.
+        :param second: A sequence of :math:`b` attribute forms.
+        :return: The comparison values as 2D numpy array of size :math:`a \\times b`.
+        """
+        block = np.zeros((len(first), len(second)))
+
+        for i, a in enumerate(first):
+            for j, b in enumerate(second):
+                block[i, j] = self.compare(a, b)
+
+        return block
+
+    def freeze(self, forms):
+        """
+        Compares all pairs of the given attribute forms once and keeps the values in a dense table,
+        which replaces the cache for these forms. The table consists of numpy arrays only,
+        so a frozen *Measure* can be shared between processes without copying the table,
+        see :meth:`.DataUtils.share_object`. Forms that are not part of the table are still compared
+        and cached as usual.
+
+        :param forms: A sequence of :math:`u` attribute forms.
+        :return: The table as 2D numpy array of size :math:`u \\times u`.
+        """
+        forms_array = np.empty(len(forms), dtype=object)
+        forms_array[:] = list(forms)
+
+        self.__table = None
+        table = self.compare_block(forms_array, forms_array)
+
+        self.__table_forms = forms_array
+        self.__table_ids = None
+        self.__table = table
+        self.__cache = dict()
+
+        return table
+
+    def set_unknown_forms(self, forms, value):
+        """
+        Assigns a fixed comparison value to all pairs of attribute forms that contain one of the given forms.
+        This is used by the :class:`.MatrixComputer` to apply the unknown value policy ``value``
+        to a copy of the *Measure*, after the forms missing from the *Context* were found in a single pass.
+        The forms are added to the forms of previous calls.
+
+        :param forms: A sequence of attribute forms, e.g. the forms that are not part of the *Context*.
+        :param value: The comparison value in :math:`[0,1]`.
+        """
+        self.__unknown_forms = self.__unknown_forms.union(forms)
+        self.__unknown_value = float(value)
+
+        return
+
+    def __synchronize(self):
+        """
+        Checks whether the *Context* was modified since the last comparison
+        and discards the cached values of the affected pairs, see :meth:`invalidate`.
+        """
+        context = self.get_context()
+        if context is None:
+            return
+
+        version = context.get_version()
+        if version == self.__context_version:
+            return
+
+        if self.__context_version is not None:
+            self.invalidate(context.get_changes(self.__context_version))
+        self.__context_version = version
+
+        return
+
+    def invalidate(self, concepts=None):
+        """
+        Discards the cached values of all pairs of attribute forms containing one of the given concepts.
+        The table of a frozen *Measure* is discarded, if it contains one of the concepts.
+        This method is called automatically, when the *Context* of the *Measure* was modified.
+
+        :param concepts: A collection of concepts or ``None``, if all cached values are discarded.
+        """
+        concepts = self._get_affected_concepts(concepts)
+        if concepts is not None and len(concepts) == 0:
+            return
+
+        with self.__lock:
+            # attributes with multiple values cannot be matched with single concepts
+            if concepts is None or self.__multiple_values:
+                self.__cache = dict()
+                self.__table = None
+                self.__unknown_forms = frozenset()
+            else:
+                keys = {self.__generate_form_key(concept) for concept in concepts}
+                # the cache might be shared, so it is replaced instead of modified
+                self.__cache = {
+                    key: value
+                    for key, value in self.__cache.items()
+                    if key[0] not in keys and key[1] not in keys
+                }
+                if self.__table is not None and any(
+                    form in concepts for form in self.__table_forms
+                ):
+                    self.__table = None
+                self.__unknown_forms = self.__unknown_forms.difference(concepts)
+
+            if self.__table is None:
+                self.__table_forms = None
+                self.__table_ids = None
+
+        return
+
+    def _get_affected_concepts(self, concepts):
+        """
+        Returns the concepts whose comparison values are affected by a change of the given concepts.
+        By default, these are the changed concepts themselves.
+        *Measures* depending on global properties of the *Context* override this method.
+
+        :param concepts: A frozenset of the changed concepts or ``None``, if all concepts changed.
+        :return: A collection of the affected concepts or ``None``, if all concepts are affected.
+        """
+        return concepts
+
+    def get_context(self):
+        """
+        Returns the *Context* the *Measure* compares the attribute forms in.
+        It is used to check the attribute forms against the concepts of the *Context*
+        before comparing them, see :class:`.MatrixComputer`.
+        *Measures* based on a *Context* override this method and set the *Context*
+        before initializing the *Measure*, so that its modifications are tracked.
+
+        :return: The *Context* or ``None``, if the *Measure* is not based on a *Context*.
+        """
+        return None
+
+    def get_table(self):
+        """
+        Returns the forms and the table of a frozen *Measure*, see :meth:`freeze`.
+
+        :return: A tuple of the forms as 1D numpy array and the table as 2D numpy array,
+            or ``None``, if the *Measure* is not frozen.
+        """
+        if self.__table is None:
+            return None
+
+        return self.__table_forms, self.__table
+
+    def __lookup_table(self, forms):
+        """
+        Returns the positions of the given forms within the table of a frozen *Measure*.
+
+        :param forms: A sequence of attribute forms.
+        :return: The positions as 1D numpy array or ``None``, if a form is not part of the table.
+        """
+        if self.__table_ids is None:
+            self.__table_ids = {form: i for i, form in enumerate(self.__table_forms)}
+
+        ids = np.zeros(len(forms), dtype=np.int64)
+        for i, form in enumerate(forms):
+            try:
+                position = self.__table_ids.get(form)
+            except TypeError:
+                # unhashable attributes are never part of the table
+                return None
+            if position is None:
+                return None
+            ids[i] = position
+
+        return ids
+
+    @staticmethod
+    def __generate_form_key(form):
+        """
+        Generates the part of a cache key representing a single attribute or attribute form.
+
+        :param form: The attribute or attribute form.
+        :return: A string representing the attribute or attribute form.
+        """
+        # if we have list or tuple, convert to comma separated string
+        if isinstance(form, list) or isinstance(form, tuple):
+            form = ",".join(form)
+
+        # if we don't have a string now, convert to hash-string
+        if not isinstance(form, str):
+            form = str(hash(form))
+
+        return form
 
     @staticmethod
     def __generate_cache_key(first, second):
         """
-        Generates a serializable cache key given the two attributes or attribute forms.
+        Generates a cache key given the two attributes or attribute forms.
+        The key is a tuple of both parts, so that the values of a single form can be found,
+        see :meth:`invalidate`.
 
         :param first: The first attribute or attribute form.
         :param second: The second attribute or attribute form.
         :return: A unique key representing the two attributes or attribute forms.
         """
-        first_string = first
-        second_string = second
-
-        # if we have list or tuple, convert to comma separated string
-        if isinstance(first_string, list) or isinstance(first_string, tuple):
-            first_string = ",".join(first_string)
-        if isinstance(second_string, list) or isinstance(second_string, tuple):
-            second_string = ",".join(second_string)
-
-        # if we don't have a string now, convert to hash-string then tuple
-        if not isinstance(first_string, str):
-            first_string = str(hash(first_string))
-        if not isinstance(second_string, str):
-            second_string = str(hash(second_string))
-
-        return str((first_string, second_string))
+        return Measure.__generate_form_key(first), Measure.__generate_form_key(second)
 
     def __write_to_cache(self, first, second, value):
         """
@@ -155,14 +545,47 @@ class Measure(ABC):
         """
         return self.__multiple_values
 
+    def is_vectorized(self):
+        """
+        Returns ``True`` if :meth:`_compare_block` compares whole blocks of attribute forms at once,
+        rather than comparing each pair using :meth:`compare`.
+        It is used by the :class:`.Planner` to estimate the cost of a computation.
+        *Measures* with a vectorized :meth:`_compare_block` override this method.
+
+        :return: ``True`` if the comparison of blocks is vectorized.
+        """
+        return False
+
+    def is_reflexive(self):
+        """
+        Returns ``True`` if identical attribute forms always get the exact match value,
+        i.e. :math:`\\mathcal{M}(x,x) = 1` for *Similarity Measures* and :math:`\\mathcal{M}(x,x) = 0`
+        for *Dissimilarity Measures*. In this case, the *Gatherers* skip the comparison of identical forms.
+        Forms with a fixed value, see :meth:`set_unknown_forms`, get their fixed value instead,
+        so a *Measure* with such forms is not reflexive.
+
+        :return: ``True`` if the *Measure* is reflexive.
+        """
+        return self._is_reflexive() and not self.__unknown_forms
+
+    def _is_reflexive(self):
+        """
+        Returns ``True`` if the concrete *Measure* guarantees the exact match value for identical forms,
+        see :meth:`is_reflexive`. *Measures* guaranteeing this property override this method.
+
+        :return: ``True`` if the comparison is reflexive.
+        """
+        return False
+
     def export_to_file(self, path):
         """
         Exports the *Measure* including the cache to the given path.
 
         :param path: The path to export the *Measure* to.
         """
+        cache = {str(key): value for key, value in self.__cache.items()}
         with open(path, "w") as file:
-            json.dump(self.__cache, file, indent=4)
+            json.dump(cache, file, indent=4)
 
         return
 
@@ -173,7 +596,8 @@ class Measure(ABC):
         :param path: The path to import the *Measure* from.
         """
         with open(path, "r") as file:
-            self.__cache = json.load(file)
+            cache = json.load(file)
+        self.__cache = {ast.literal_eval(key): value for key, value in cache.items()}
 
         return
 
@@ -234,15 +658,13 @@ class WuPalmer(SimilarityMeasure):
             with :math:`N` being the depth of the tree. Using an offset prevent from getting
             a zero similarity.
         """
-        super().__init__(symmetric=True, multiple_values=False)
-
         self.__context = context
+        self.__depth_offset = False
 
         if isinstance(offset, str):
             if offset == "depth":
-                graph = self.__context.get_tree()
-                depth = len(dag_longest_path(graph))
-                self.__offset = 1.0 / depth
+                self.__depth_offset = True
+                self.__offset = self.__calculate_depth_offset()
             else:
                 raise ValueError(
                     "The value " + str(offset) + ' is not valid for "offset".'
@@ -250,8 +672,37 @@ class WuPalmer(SimilarityMeasure):
         else:
             self.__offset = offset + 0.0
 
+        super().__init__(symmetric=True, multiple_values=False)
+
         return
 
+    def __calculate_depth_offset(self):
+        """
+        Calculates the offset :math:`\\frac{1}{N}`, with :math:`N` being the depth of the tree.
+
+        :return: The offset.
+        """
+        graph = self.__context.get_tree()
+        depth = len(dag_longest_path(graph))
+
+        return 1.0 / depth
+
+    def _get_affected_concepts(self, concepts):
+        """
+        Returns the concepts whose comparison values are affected by a change of the given concepts.
+        If the offset depends on the depth of the tree and the depth changed, all concepts are affected.
+
+        :param concepts: A frozenset of the changed concepts or ``None``, if all concepts changed.
+        :return: A collection of the affected concepts or ``None``, if all concepts are affected.
+        """
+        if self.__depth_offset and concepts != frozenset():
+            offset = self.__calculate_depth_offset()
+            if offset != self.__offset:
+                self.__offset = offset
+                return None
+
+        return concepts
+
     def _compare(self, first, second):
         """
         Compares the two given attribute forms using the *WuPalmer Similarity Measure*.
@@ -291,6 +742,31 @@ class WuPalmer(SimilarityMeasure):
 
         return 2.0 * d3 / (d1 + d2 + 2.0 * d3)
 
+    def _is_reflexive(self):
+        """
+        Identical concepts are only exact matches with a positive offset,
+        since the root is compared with itself as zero otherwise.
+
+        :return: ``True`` if the offset is positive.
+        """
+        return self.__offset > 0.0
+
+    def get_context(self):
+        """
+        Returns the :class:`.TreeContext` used for comparison.
+
+        :return: The *TreeContext*.
+        """
+        return self.__context
+
+    def _get_parameters(self):
+        """
+        Returns the parameters of the *WuPalmer Similarity Measure*.
+
+        :return: A dictionary with the offset.
+        """
+        return {"offset": self.__offset}
+
 
 class PathLengthMeasure(SimilarityMeasure):
     """
@@ -303,8 +779,8 @@ class PathLengthMeasure(SimilarityMeasure):
 
         :param context: The :class:`.GraphContext` used for comparison.
         """
-        super().__init__(symmetric=True, multiple_values=False)
         self.__context = context
+        super().__init__(symmetric=True, multiple_values=False)
 
         return
 
@@ -313,12 +789,313 @@ class PathLengthMeasure(SimilarityMeasure):
         Compares the two attribute forms based on their path length in the *Context*.
         The *Measure* counts the shortest path length :math:`p` going from the first to the second value
         and returns :math:`\\frac{1}{1+p}`.
+        If a distance oracle is enabled for the *Context*, see :meth:`.GraphContext.set_distance_oracle`,
+        the path length is taken from the oracle.
 
         :param first: The first attribute form.
         :param second: The second attribute form.
         :return: The *PathLength Similarity* comparison value.
         """
+        oracle = self.__context.get_distance_oracle()
+        if oracle is not None:
+            return float(self._compare_block([first], [second])[0, 0])
+
         graph = self.__context.get_graph().to_undirected()
         shortest_path_length = nx.shortest_path_length(graph, first, second)
 
         return 1.0 / (1.0 + shortest_path_length)
+
+    def _compare_block(self, first, second):
+        """
+        Compares all pairs of the given attribute forms.
+        If a distance oracle is enabled for the *Context*, all path lengths are queried at once.
+        Otherwise, each pair is compared using :meth:`compare`.
+
+        :param first: A sequence of :math:`a` attribute forms.
+        :param second: A sequence of :math:`b` attribute forms.
+        :return: The comparison values as 2D numpy array of size :math:`a \\times b`.
+        """
+        oracle = self.__context.get_distance_oracle()
+        if oracle is None:
+            return super()._compare_block(first, second)
+
+        compiled_graph = oracle.get_compiled_graph()
+        first_ids = compiled_graph.get_ids(first)
+        second_ids = compiled_graph.get_ids(second)
+        first_grid, second_grid = np.meshgrid(first_ids, second_ids, indexing="ij")
+
+        distances = oracle.distances(first_grid.ravel(), second_grid.ravel())
+
+        return (1.0 / (1.0 + distances)).reshape(first_grid.shape)
+
+    def get_context(self):
+        """
+        Returns the :class:`.GraphContext` used for comparison.
+
+        :return: The *GraphContext*.
+        """
+        return self.__context
+
+    def _get_parameters(self):
+        """
+        Returns the parameters of the *PathLengthMeasure*,
+        which are the parameters of the distance oracle of the *Context*, since an approximate oracle
+        changes the comparison values.
+
+        :return: A dictionary with the parameters of the distance oracle.
+        """
+        return {"oracle": self.__context.get_distance_oracle_parameters()}
+
+    def _is_reflexive(self):
+        """
+        The path length of identical concepts is zero, unless it is estimated by a distance oracle.
+
+        :return: ``True`` if no distance oracle is enabled for the *Context*.
+        """
+        return self.__context.get_distance_oracle() is None
+
+    def is_vectorized(self):
+        """
+        Returns ``True`` if a distance oracle is enabled for the *Context*,
+        since all path lengths of a block are queried at once.
+
+        :return: ``True`` if the comparison of blocks is vectorized.
+        """
+        return self.__context.get_distance_oracle() is not None
+
+
+class InformationContentMeasure(SimilarityMeasure, ABC):
+    """
+    An abstract base class for tree based similarity measures using the information content (IC) of concepts.
+    The information content of a concept :math:`c` is either calculated from corpus frequencies as
+    :math:`IC(c) = -\\log p(c)`, with :math:`p(c)` being the relative frequency of :math:`c` and all its
+    descendants, or intrinsically from the tree structure as
+    :math:`IC(c) = 1 - \\frac{\\log (desc(c) + 1)}{\\log N}`,
+    with :math:`desc(c)` being the amount of descendants of :math:`c` and :math:`N` the amount of concepts.
+
+    The information content of all concepts is precalculated on the :class:`.TreeIndex` of the context,
+    which also provides the lowest common ancestors.
+    Hence, the comparison of whole blocks of attribute forms is vectorized.
+    """
+
+    def __init__(self, context, frequencies=None):
+        """
+        Initializes the *InformationContentMeasure*.
+
+        :param context: The :class:`.TreeContext` used for comparison.
+        :param frequencies: An optional dictionary mapping concepts to their frequencies in a corpus.
+            Each concept is counted once more (add-one smoothing), so that all probabilities are positive.
+            If ``None``, the intrinsic information content based on the amount of descendants is used.
+        """
+        self.__context = context
+        super().__init__(symmetric=True, multiple_values=False)
+        self.__frequencies = frequencies
+        self.__index = None
+        self.__information_content = None
+
+        return
+
+    def get_context(self):
+        """
+        Returns the :class:`.TreeContext` used for comparison.
+
+        :return: The *TreeContext*.
+        """
+        return self.__context
+
+    def _get_parameters(self):
+        """
+        Returns the parameters of the *InformationContentMeasure*.
+
+        :return: A dictionary with the frequencies.
+        """
+        if self.__frequencies is None:
+            return {"frequencies": None}
+
+        return {"frequencies": sorted((str(c), f) for c, f in self.__frequencies.items())}
+
+    def _get_affected_concepts(self, concepts):
+        """
+        Returns ``None`` for any change, since the information content of a concept depends on
+        the amount of concepts and the descendants of all its ancestors.
+
+        :param concepts: A frozenset of the changed concepts or ``None``, if all concepts changed.
+        :return: ``None`` or an empty frozenset, if nothing changed.
+        """
+        if concepts is not None and len(concepts) == 0:
+            return concepts
+
+        return None
+
+    def is_vectorized(self):
+        """
+        Returns ``True``, since the comparison of blocks is based on the :class:`.TreeIndex`.
+
+        :return: ``True``.
+        """
+        return True
+
+    def get_information_content(self):
+        """
+        Returns the information content of all concepts of the :class:`.TreeIndex` of the context.
+        It is recalculated whenever the context has been modified.
+
+        :return: The information content as 1D numpy array, ordered by the ids of the concepts.
+        """
+        index = self.__context.get_index()
+
+        if index is not self.__index:
+            if self.__frequencies is None:
+                n_nodes = max(len(index), 2)
+                counts = index.get_descendant_counts()
+                information_content = 1.0 - np.log(counts + 1.0) / np.log(n_nodes)
+            else:
+                frequencies = np.ones(len(index))
+                for concept, frequency in self.__frequencies.items():
+                    frequencies[index.get_ids([concept])[0]] += frequency
+                counts = index.accumulate(frequencies)
+                information_content = -np.log(counts / counts[0])
+            self.__information_content = information_content
+            self.__index = index
+
+        return self.__information_content
+
+    @abstractmethod
+    def _similarity(self, first, second, lowest_common_ancestor):
+        """
+        Calculates the similarity given the information content of the concepts and their lowest common ancestors.
+        This method needs to be implemented in a vectorized way by the concrete *Measures*.
+
+        :param first: The information content of the first concepts as numpy array.
+        :param second: The information content of the second concepts as numpy array.
+        :param lowest_common_ancestor: The information content of the lowest common ancestors as numpy array.
+        :return: The similarity values in :math:`[0,1]` as numpy array.
+        """
+        pass
+
+    def _compare(self, first, second):
+        """
+        Compares the two given attribute forms based on their information content.
+
+        :param first: The first attribute form.
+        :param second: The second attribute form.
+        :return: The comparison value.
+        """
+        return float(self._compare_block([first], [second])[0, 0])
+
+    def _compare_block(self, first, second):
+        """
+        Compares all pairs of the given attribute forms in a vectorized way.
+
+        :param first: A sequence of :math:`a` attribute forms.
+        :param second: A sequence of :math:`b` attribute forms.
+        :return: The comparison values as 2D numpy array of size :math:`a \\times b`.
+        """
+        information_content = self.get_information_content()
+        index = self.__context.get_index()
+
+        first_ids = index.get_ids(first)
+        second_ids = index.get_ids(second)
+        first_grid, second_grid = np.meshgrid(first_ids, second_ids, indexing="ij")
+        ancestors = index.lowest_common_ancestors(first_grid, second_grid)
+
+        return self._similarity(
+            information_content[first_grid],
+            information_content[second_grid],
+            information_content[ancestors],
+        )
+
+
+class Resnik(InformationContentMeasure):
+    """
+    The Resnik similarity measure, i.e. the information content of the lowest common ancestor,
+    normalized by the maximum information content of the tree:
+
+    .. centered::
+        :math:`\\mathcal{M}(x, y) = \\frac{IC(lca(x, y))}{\\max_c IC(c)}`.
+    """
+
+    def _similarity(self, first, second, lowest_common_ancestor):
+        """
+        Calculates the normalized Resnik similarity.
+
+        :param first: The information content of the first concepts as numpy array.
+        :param second: The information content of the second concepts as numpy array.
+        :param lowest_common_ancestor: The information content of the lowest common ancestors as numpy array.
+        :return: The similarity values as numpy array.
+        """
+        maximum = self.get_information_content().max()
+        if maximum <= 0.0:
+            return np.ones_like(lowest_common_ancestor)
+
+        return lowest_common_ancestor / maximum
+
+
+class Lin(InformationContentMeasure):
+    """
+    The Lin similarity measure:
+
+    .. centered::
+        :math:`\\mathcal{M}(x, y) = \\frac{2 \\cdot IC(lca(x, y))}{IC(x) + IC(y)}`.
+    """
+
+    def _is_reflexive(self):
+        """
+        The Lin similarity of a concept with itself is one.
+
+        :return: ``True``.
+        """
+        return True
+
+    def _similarity(self, first, second, lowest_common_ancestor):
+        """
+        Calculates the Lin similarity. If both concepts have no information content, the similarity is one.
+
+        :param first: The information content of the first concepts as numpy array.
+        :param second: The information content of the second concepts as numpy array.
+        :param lowest_common_ancestor: The information content of the lowest common ancestors as numpy array.
+        :return: The similarity values as numpy array.
+        """
+        total = first + second
+
+        return np.divide(
+            2.0 * lowest_common_ancestor,
+            total,
+            out=np.ones_like(total),
+            where=total > 0.0,
+        )
+
+
+class JiangConrath(InformationContentMeasure):
+    """
+    The Jiang-Conrath measure, converted to a similarity by normalizing the distance
+    with its maximum value:
+
+    .. centered::
+        :math:`\\mathcal{M}(x, y) = 1 - \\frac{IC(x) + IC(y) - 2 \\cdot IC(lca(x, y))}{2 \\cdot \\max_c IC(c)}`.
+    """
+
+    def _is_reflexive(self):
+        """
+        The Jiang-Conrath distance of a concept to itself is zero.
+
+        :return: ``True``.
+        """
+        return True
+
+    def _similarity(self, first, second, lowest_common_ancestor):
+        """
+        Calculates the normalized Jiang-Conrath similarity.
+
+        :param first: The information content of the first concepts as numpy array.
+        :param second: The information content of the second concepts as numpy array.
+        :param lowest_common_ancestor: The information content of the lowest common ancestors as numpy array.
+        :return: The similarity values as numpy array.
+        """
+        maximum = self.get_information_content().max()
+        if maximum <= 0.0:
+            return np.ones_like(lowest_common_ancestor)
+
+        distance = first + second - 2.0 * lowest_common_ancestor
+
+        return 1.0 - distance / (2.0 * maximum)
@@ -0,0 +1,177 @@
+"""
+LandmarkDistanceOracle
+====================================
+The *LandmarkDistanceOracle* answers shortest path distance queries on very large graphs,
+where neither all-pairs distances nor a graph search for each pair of concepts are feasible.
+
+In advance, the distances from a small set of landmark nodes :math:`L` to all nodes are calculated
+and stored in a compact array of size :math:`|L| \\times N`.
+Due to the triangle inequality, the distance :math:`d(x, y)` between two nodes is then bounded by
+
+.. centered::
+    :math:`\\max_{l \\in L} |d(l, x) - d(l, y)| \\leq d(x, y) \\leq \\min_{l \\in L} d(l, x) + d(l, y)`.
+
+If the oracle is approximate, the upper bound is used as distance, i.e. the length of the shortest path
+via a landmark. If the oracle is exact, the pairs with loose bounds are resolved with a bidirectional search,
+that stops as soon as the upper bound cannot be improved anymore.
+"""
+
+import heapq
+import numpy as np
+from scipy.sparse.csgraph import shortest_path
+
+
+class LandmarkDistanceOracle:
+    """
+    A distance oracle based on precomputed distances from landmark nodes.
+    The graph is considered as undirected.
+    """
+
+    def __init__(
+        self,
+        compiled_graph,
+        n_landmarks=16,
+        exact=True,
+        selection="degree",
+        weighted=False,
+        random_state=None,
+    ):
+        """
+        Initializes the *LandmarkDistanceOracle* and calculates the distances from the landmarks.
+
+        :param compiled_graph: The :class:`.CompiledGraph` of the graph.
+        :param n_landmarks: The amount of landmark nodes.
+        :param exact: If ``True``, distances are exact. If ``False``, the landmark upper bound is used.
+        :param selection: The selection of the landmarks, which can be ``degree`` for the nodes with the
+            highest degrees or ``random``.
+        :param weighted: If ``True``, the weights of the edges are used, otherwise the edges are counted.
+        :param random_state: The seed used for the ``random`` selection.
+        :raise ValueError: The given selection does not exist.
+        """
+        self.__compiled_graph = compiled_graph
+        self.__exact = exact
+
+        adjacency = compiled_graph.to_sparse(undirected=True, weighted=weighted)
+        self.__indptr = adjacency.indptr
+        self.__indices = adjacency.indices
+        self.__weights = adjacency.data
+
+        n_nodes = len(compiled_graph)
+        n_landmarks = min(n_landmarks, n_nodes)
+        if selection == "degree":
+            degrees = np.diff(adjacency.indptr)
+            landmarks = np.argsort(-degrees, kind="stable")[:n_landmarks]
+        elif selection == "random":
+            random = np.random.RandomState(random_state)
+            landmarks = random.choice(n_nodes, n_landmarks, replace=False)
+        else:
+            raise ValueError(f"A landmark selection of type {selection} does not exist.")
+
+        self.__landmarks = landmarks
+        self.__distances = shortest_path(
+            adjacency, directed=False, unweighted=not weighted, indices=landmarks
+        ).astype(np.float32)
+
+        return
+
+    def get_compiled_graph(self):
+        """
+        Returns the :class:`.CompiledGraph` the oracle is built on.
+
+        :return: The *CompiledGraph* instance.
+        """
+        return self.__compiled_graph
+
+    def get_landmarks(self):
+        """
+        Returns the ids of the landmark nodes.
+
+        :return: The ids as 1D numpy array.
+        """
+        return self.__landmarks
+
+    def bounds(self, first, second):
+        """
+        Calculates the lower and upper bounds of the distances between the given pairs of nodes.
+
+        :param first: The ids of the first nodes as 1D numpy array.
+        :param second: The ids of the second nodes as 1D numpy array of the same size.
+        :return: A tuple of the lower and upper bounds as 1D numpy arrays.
+        """
+        first_distances = self.__distances[:, first]
+        second_distances = self.__distances[:, second]
+
+        with np.errstate(invalid="ignore"):
+            upper = np.min(first_distances + second_distances, axis=0)
+            differences = np.abs(first_distances - second_distances)
+
+        # a landmark reaching only one of the nodes proves that they are disconnected
+        disconnected = np.any(
+            np.isinf(first_distances) != np.isinf(second_distances), axis=0
+        )
+        differences[np.isnan(differences)] = 0.0
+        lower = np.max(differences, axis=0)
+        lower[disconnected] = np.inf
+        upper[disconnected] = np.inf
+
+        identical = np.asarray(first) == np.asarray(second)
+        lower[identical] = 0.0
+        upper[identical] = 0.0
+
+        return lower.astype(np.float64), upper.astype(np.float64)
+
+    def distances(self, first, second):
+        """
+        Calculates the distances between the given pairs of nodes.
+
+        :param first: The ids of the first nodes as 1D numpy array.
+        :param second: The ids of the second nodes as 1D numpy array of the same size.
+        :return: The distances as 1D numpy array. Disconnected nodes have an infinite distance.
+        """
+        lower, upper = self.bounds(first, second)
+
+        if not self.__exact:
+            return upper
+
+        distances = upper.copy()
+        for i in np.flatnonzero(lower < upper):
+            distances[i] = self.__bidirectional_search(first[i], second[i], upper[i])
+
+        return distances
+
+    def __bidirectional_search(self, source, target, bound):
+        """
+        Searches the shortest path between two nodes from both sides (bidirectional Dijkstra).
+        The search stops as soon as no path shorter than the given bound can be found.
+
+        :param source: The id of the source node.
+        :param target: The id of the target node.
+        :param bound: An upper bound of the distance, e.g. from the landmarks.
+        :return: The distance between the nodes.
+        """
+        best = bound
+        distances = ({source: 0.0}, {target: 0.0})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        settled = (set(), set())
+
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+
+            # expand the side with the smaller frontier
+            side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            distance, node = heapq.heappop(heaps[side])
+            if node in settled[side]:
+                continue
+            settled[side].add(node)
+
+            for position in range(self.__indptr[node], self.__indptr[node + 1]):
+                neighbor = self.__indices[position]
+                new_distance = distance + self.__weights[position]
+                if new_distance < distances[side].get(neighbor, np.inf):
+                    distances[side][neighbor] = new_distance
+                    heapq.heappush(heaps[side], (new_distance, neighbor))
+                    if neighbor in distances[1 - side]:
+                        best = min(best, new_distance + distances[1 - side][neighbor])
+
+        return best
@@ -0,0 +1,422 @@
+"""
+Planner
+====================================
+The *Planner* decides how the :class:`.ContextualEncoder` computes an encoding, before any comparison
+takes place. It inspects the data and the components in a single linear pass:
+
+- the amount of rows :math:`n` and of distinct rows,
+- the amount of distinct values :math:`u` and distinct forms :math:`f` of each column,
+  as well as the amount of forms per value,
+- the capabilities of the *Measures*, i.e. whether they are frozen, vectorized or based on a distance oracle,
+- the memory needed by the matrices and the *Reducer* compared with the available memory.
+
+For each column, the matrix of the distinct values is computed by one of the following strategies:
+
+============ ===========
+Strategy     Description
+------------ -----------
+table        | The *Measure* is frozen, the form comparisons are looked up, see :meth:`.Measure.freeze`.
+vectorized   | The *Measure* compares whole blocks of forms at once, see :meth:`.Measure.is_vectorized`.
+pairwise     | Each pair of distinct forms is compared once and cached.
+============ ===========
+
+If the matrices are computed in tiles, e.g. with an executor, ``tiled`` is appended to the strategy.
+Rows with the same values in all columns are encoded once, if this saves work and the *Reducer*
+supports weights, see :meth:`.Reducer.supports_weights`.
+A plan that does not fit into the available memory is rejected, before anything is allocated.
+
+In the ``factorized`` mode of the :class:`.ContextualEncoder`, the matrix of all rows is not needed at all,
+the *Reducer* embeds the distinct values of each column instead.
+
+If both the *Aggregator* and the *Reducer* support operators, see :meth:`.Aggregator.supports_operator`
+and :meth:`.Reducer.supports_operator`, the aggregated matrix is not materialized for many rows
+or if it does not fit into the available memory. The *Reducer* multiplies the matrices
+of the distinct values of the columns with vectors instead, see :meth:`.Aggregator.aggregate_operator`.
+"""
+
+import numpy as np
+from .data_utils import DataUtils
+
+
+class ColumnPlan:
+    """
+    The plan of a single column.
+    """
+
+    def __init__(self, column, measure, n_values, n_forms, forms_per_value, strategy):
+        """
+        Initializes the *ColumnPlan*.
+
+        :param column: The index of the column.
+        :param measure: The name of the type of the *Measure*.
+        :param n_values: The amount of distinct values.
+        :param n_forms: The amount of distinct forms.
+        :param forms_per_value: A tuple of the mean and the maximum amount of forms per value.
+        :param strategy: The name of the strategy.
+        """
+        self.__column = column
+        self.__measure = measure
+        self.__n_values = n_values
+        self.__n_forms = n_forms
+        self.__forms_per_value = forms_per_value
+        self.__strategy = strategy
+
+        return
+
+    def get_column(self):
+        """
+        Returns the index of the column.
+
+        :return: The index.
+        """
+        return self.__column
+
+    def get_n_values(self):
+        """
+        Returns the amount of distinct values.
+
+        :return: The amount of distinct values.
+        """
+        return self.__n_values
+
+    def get_n_forms(self):
+        """
+        Returns the amount of distinct forms.
+
+        :return: The amount of distinct forms.
+        """
+        return self.__n_forms
+
+    def get_strategy(self):
+        """
+        Returns the name of the strategy, see :class:`.Planner`.
+
+        :return: The name.
+        """
+        return self.__strategy
+
+    def get_n_comparisons(self):
+        """
+        Returns the amount of form comparisons, which is :math:`f^2` for the ``pairwise`` strategy.
+
+        :return: The amount of comparisons.
+        """
+        return self.__n_forms**2
+
+    def get_bytes(self):
+        """
+        Returns the memory needed for the matrix of the distinct values and its conversion.
+
+        :return: The amount of bytes.
+        """
+        return 2 * 8 * self.__n_values**2
+
+    def explain(self):
+        """
+        Describes the plan of the column.
+
+        :return: A single line as string.
+        """
+        mean_forms, max_forms = self.__forms_per_value
+
+        return (
+            f"column {self.__column}: {self.__measure}, {self.__n_values} values, "
+            f"{self.__n_forms} forms ({mean_forms:.1f} per value, at most {max_forms}), "
+            f"strategy {self.__strategy}, {self.get_n_comparisons()} comparisons, "
+            f"{DataUtils.format_bytes(self.get_bytes())}"
+        )
+
+
+class Plan:
+    """
+    The plan of an encoding, consisting of the plans of the columns and the reduction.
+    """
+
+    def __init__(
+        self,
+        n_rows,
+        n_distinct_rows,
+        deduplicate,
+        column_plans,
+        reducer,
+        reducer_bytes,
+        available_bytes,
+        factorized=False,
+        matrix_free=False,
+    ):
+        """
+        Initializes the *Plan*.
+
+        :param n_rows: The amount of rows.
+        :param n_distinct_rows: The amount of distinct rows.
+        :param deduplicate: ``True`` if the distinct rows are encoded only.
+        :param column_plans: A list with the :class:`.ColumnPlan` of each column.
+        :param reducer: The name of the type of the *Reducer*.
+        :param reducer_bytes: The memory needed by the *Reducer* in bytes.
+        :param available_bytes: The available memory in bytes or ``None``, if it is unknown.
+        :param factorized: ``True`` if the distinct values of each column are embedded instead of the rows.
+        :param matrix_free: ``True`` if the aggregated matrix is passed to the *Reducer* as operator.
+        """
+        self.__n_rows = n_rows
+        self.__n_distinct_rows = n_distinct_rows
+        self.__deduplicate = deduplicate
+        self.__column_plans = column_plans
+        self.__reducer = reducer
+        self.__reducer_bytes = reducer_bytes
+        self.__available_bytes = available_bytes
+        self.__factorized = factorized
+        self.__matrix_free = matrix_free
+
+        return
+
+    def get_column_plans(self):
+        """
+        Returns the plans of the columns.
+
+        :return: A list of :class:`.ColumnPlan` instances.
+        """
+        return self.__column_plans
+
+    def get_deduplicate(self):
+        """
+        Returns ``True`` if only the distinct rows are encoded.
+
+        :return: ``True`` if the rows are deduplicated.
+        """
+        return self.__deduplicate
+
+    def get_matrix_free(self):
+        """
+        Returns ``True`` if the aggregated matrix is passed to the *Reducer* as operator
+        instead of being materialized.
+
+        :return: ``True`` if the aggregation is matrix-free.
+        """
+        return self.__matrix_free
+
+    def get_n_reduced_rows(self):
+        """
+        Returns the amount of rows of the aggregated matrix, that is passed to the *Reducer*.
+
+        :return: The amount of rows, which is ``0`` in the ``factorized`` mode.
+        """
+        if self.__factorized:
+            return 0
+        if self.__deduplicate:
+            return self.__n_distinct_rows
+
+        return self.__n_rows
+
+    def get_bytes(self):
+        """
+        Returns the estimated peak memory of the encoding, i.e. the matrices of all columns,
+        the aggregated matrix, unless it is matrix-free, and the memory of the *Reducer*.
+
+        :return: The amount of bytes.
+        """
+        columns = sum(column_plan.get_bytes() for column_plan in self.__column_plans)
+        if self.__matrix_free:
+            aggregated = 0
+        else:
+            aggregated = 2 * 8 * self.get_n_reduced_rows() ** 2
+
+        return columns + aggregated + self.__reducer_bytes
+
+    def get_available_bytes(self):
+        """
+        Returns the available memory.
+
+        :return: The amount of bytes or ``None``, if it is unknown.
+        """
+        return self.__available_bytes
+
+    def is_feasible(self):
+        """
+        Returns ``True`` if the encoding fits into the available memory.
+        If the available memory is unknown, every plan is feasible.
+
+        :return: ``True`` if the plan is feasible.
+        """
+        if self.__available_bytes is None:
+            return True
+
+        return self.get_bytes() <= self.__available_bytes
+
+    def explain(self):
+        """
+        Describes the plan in a human readable form.
+
+        :return: The description as string with one line per step.
+        """
+        lines = [
+            f"rows: {self.__n_rows}, distinct rows: {self.__n_distinct_rows}, "
+            f"deduplicate: {self.__deduplicate}"
+        ]
+        for column_plan in self.__column_plans:
+            lines.append(column_plan.explain())
+
+        n_reduced_rows = self.get_n_reduced_rows()
+        if self.__factorized:
+            target = "the values of each column"
+        else:
+            target = f"{n_reduced_rows} x {n_reduced_rows}"
+            if self.__matrix_free:
+                target += " (matrix-free)"
+        lines.append(
+            f"reducer: {self.__reducer} on {target}, "
+            f"{DataUtils.format_bytes(self.__reducer_bytes)}"
+        )
+
+        if self.__available_bytes is None:
+            available = "unknown"
+        else:
+            available = DataUtils.format_bytes(self.__available_bytes)
+        lines.append(
+            f"memory: {DataUtils.format_bytes(self.get_bytes())} of {available} available, "
+            f"{'feasible' if self.is_feasible() else 'not feasible'}"
+        )
+
+        return "\n".join(lines)
+
+
+class Planner:
+    """
+    The service class to plan an encoding.
+    """
+
+    # the fraction of the distinct rows below which the rows are deduplicated
+    DEDUPLICATION_RATIO = 0.75
+
+    # the amount of reduced rows above which the aggregated matrix is not materialized
+    MATRIX_FREE_SIZE = 5000
+
+    def __init__(self, memory_limit=None):
+        """
+        Initializes the *Planner*.
+
+        :param memory_limit: The memory in bytes an encoding may use.
+            If ``None``, the available memory of the system is used, see :meth:`.DataUtils.get_available_memory`.
+        """
+        self.__memory_limit = memory_limit
+
+        return
+
+    def plan(
+        self,
+        x_df,
+        computers,
+        reducer,
+        deduplicate=None,
+        factorized=False,
+        aggregator=None,
+        matrix_free=None,
+    ):
+        """
+        Plans the encoding of the given data.
+
+        :param x_df: The data as pandas dataframe.
+        :param computers: A list with the :class:`.MatrixComputer` of each column.
+        :param reducer: The *Reducer*.
+        :param deduplicate: If ``True`` or ``False``, the rows are deduplicated or not.
+            If ``None``, the *Planner* decides.
+        :param factorized: ``True`` if the distinct values of each column are embedded instead of the rows,
+            in which case the rows are never deduplicated.
+        :param aggregator: The *Aggregator* or ``None``, if the aggregated matrix is always materialized.
+        :param matrix_free: If ``True`` or ``False``, the aggregated matrix is passed to the *Reducer*
+            as operator or not. If ``None``, the *Planner* decides, provided that
+            the *Aggregator* and the *Reducer* support operators.
+        :return: The :class:`.Plan`.
+        """
+        n_rows = len(x_df)
+
+        codes = []
+        column_plans = []
+        for col in x_df.columns:
+            col_codes, values = DataUtils.factorize(x_df[col])
+            codes.append(col_codes)
+
+            measure = computers[col].get_measure()
+            if measure.can_handle_multiple_values():
+                n_forms = len(values)
+                forms_per_value = (1.0, 1)
+            else:
+                tokens = computers[col].get_tokenizer().tokenize(values)
+                lengths = tokens.get_lengths()
+                n_forms = len(tokens.get_forms())
+                forms_per_value = (
+                    float(lengths.mean()) if len(lengths) > 0 else 0.0,
+                    int(lengths.max()) if len(lengths) > 0 else 0,
+                )
+
+            if measure.get_table() is not None:
+                strategy = "table"
+            elif measure.is_vectorized():
+                strategy = "vectorized"
+            else:
+                strategy = "pairwise"
+            if computers[col].is_tiled():
+                strategy += ", tiled"
+
+            column_plans.append(
+                ColumnPlan(
+                    col,
+                    type(measure).__name__,
+                    len(values),
+                    n_forms,
+                    forms_per_value,
+                    strategy,
+                )
+            )
+
+        if len(codes) > 0 and n_rows > 0:
+            n_distinct_rows = len(np.unique(np.stack(codes, axis=1), axis=0))
+        else:
+            n_distinct_rows = n_rows
+
+        available_bytes = self.__memory_limit
+        if available_bytes is None:
+            available_bytes = DataUtils.get_available_memory()
+
+        if factorized:
+            deduplicate = False
+            matrix_free = False
+            reducer_bytes = sum(
+                reducer.estimate_bytes(column_plan.get_n_values())
+                for column_plan in column_plans
+            )
+        else:
+            if deduplicate is None:
+                deduplicate = (
+                    reducer.supports_weights()
+                    and n_distinct_rows <= self.DEDUPLICATION_RATIO * n_rows
+                )
+            n_reduced_rows = n_distinct_rows if deduplicate else n_rows
+            reducer_bytes = reducer.estimate_bytes(n_reduced_rows)
+
+            if matrix_free is None:
+                dense_bytes = (
+                    sum(column_plan.get_bytes() for column_plan in column_plans)
+                    + 2 * 8 * n_reduced_rows**2
+                    + reducer_bytes
+                )
+                matrix_free = (
+                    aggregator is not None
+                    and aggregator.supports_operator()
+                    and reducer.supports_operator()
+                    and (
+                        n_reduced_rows > self.MATRIX_FREE_SIZE
+                        or (available_bytes is not None and dense_bytes > available_bytes)
+                    )
+                )
+
+        return Plan(
+            n_rows,
+            n_distinct_rows,
+            deduplicate,
+            column_plans,
+            type(reducer).__name__,
+            reducer_bytes,
+            available_bytes,
+            factorized,
+            matrix_free,
+        )
@@ -18,11 +18,26 @@ Name        Description
 ----------- -----------
 mds         | Creates a low-dimensional representation of the data in which the distances respect well
             | the distances in the original high-dimensional space.
+kpca        | Uses the centered similarity matrix as kernel and projects the data
+            | onto its leading eigenvectors (kernel PCA).
+spectral    | Uses the similarity matrix as affinity graph and embeds the data
+            | by the leading eigenvectors of its normalized adjacency (spectral embedding).
 =========== ===========
+
+The *SimilarityMatrixReducers* only need the leading eigenvectors of the similarity matrix,
+which are computed by truncated eigensolvers, see :class:`.EigenReducer`.
+They accept dense and sparse matrices and skip the conversion to dissimilarities.
+Since they only multiply the similarity matrix with vectors, they also accept a ``LinearOperator``,
+e.g. the mean of the column matrices, which is never materialized, see :meth:`.Aggregator.aggregate_operator`.
 """
 
+import numpy as np
+import scipy.linalg
+import scipy.sparse
 from abc import ABC, abstractmethod
+from scipy.sparse.linalg import LinearOperator, eigsh, lobpcg
 from sklearn.manifold import MDS
+from sklearn.utils import check_random_state
 
 
 class Reducer(ABC):
@@ -50,6 +65,60 @@ class Reducer(ABC):
         """
         pass
 
+    def supports_weights(self):
+        """
+        Returns ``True`` if the *Reducer* accepts weights of the features, i.e. their multiplicities.
+        Such *Reducers* implement ``reduce(matrix, weights=None)``, where a feature with weight :math:`w`
+        is treated like :math:`w` identical features. This allows to reduce the matrix of the distinct
+        features only.
+
+        :return: ``True`` if the *Reducer* supports weights.
+        """
+        return False
+
+    def supports_operator(self):
+        """
+        Returns ``True`` if the *Reducer* accepts a ``scipy.sparse.linalg.LinearOperator``
+        instead of the matrix, i.e. if it only multiplies the matrix with vectors.
+
+        :return: ``True`` if the *Reducer* supports operators.
+        """
+        return False
+
+    def estimate_bytes(self, n_features):
+        """
+        Estimates the memory the *Reducer* needs in addition to the given matrix,
+        which is used by the :class:`.Planner` to reject encodings that do not fit into memory.
+        By default, one further matrix of the size of the given matrix is assumed.
+
+        :param n_features: The amount of features :math:`n`.
+        :return: The amount of bytes.
+        """
+        return 8 * n_features**2
+
+    def can_project(self):
+        """
+        Returns ``True`` if the *Reducer* can project new features into the last reduction,
+        see :meth:`project`.
+
+        :return: ``True`` if the *Reducer* supports projections.
+        """
+        return False
+
+    def project(self, matrix):
+        """
+        Projects new features into the space of the last reduction (out-of-sample extension).
+        This method is implemented by *Reducers*, which support projections.
+
+        :param matrix: The similarity or dissimilarity matrix between :math:`c` new features
+            and the :math:`n` features of the last reduction as 2D numpy array of size :math:`c \\times n`.
+        :return: The set of vectors of size :math:`c \\times m` as 2D numpy array.
+        :raise ValueError: The *Reducer* does not support projections.
+        """
+        raise ValueError(
+            f"The reducer {type(self).__name__} does not support projections."
+        )
+
 
 class SimilarityMatrixReducer(Reducer, ABC):
     """
@@ -73,11 +142,15 @@ class ReducerFactory:
         """
         Creates a concrete *Reducer* instance given the name.
 
-        :param reducer: The name of the *Reducer*, which can be ``mds``.
+        :param reducer: The name of the *Reducer*, which can be ``mds``, ``kpca`` or ``spectral``.
         :return: The instance of the *Reducer*
         """
         if reducer == "mds":
             return MultidimensionalScalingReducer()
+        elif reducer == "kpca":
+            return KernelPCAReducer()
+        elif reducer == "spectral":
+            return SpectralEmbeddingReducer()
         else:
             raise ValueError(f"A reducer of type {reducer} does not exist.")
 
@@ -90,26 +163,252 @@ class MultidimensionalScalingReducer(DissimilarityMatrixReducer):
     It can be used with the ``mds`` option.
     """
 
-    def __init__(self, n_components=2, metric=True):
+    def __init__(
+        self,
+        n_components=2,
+        metric=True,
+        n_init=4,
+        max_iter=300,
+        eps=1e-3,
+        n_jobs=None,
+        random_state=None,
+        warm_start=False,
+    ):
         """
         Initializes the *MultidimensionalScalingReducer*.
 
         :param n_components: The dimension of the output vectors.
         :param metric: If ``True``, perform metric MDS; otherwise, perform non-metric MDS.
+        :param n_init: The number of times the SMACOF algorithm is run with different initializations.
+            The best run in terms of stress is used. If the reduction is warm-started,
+            only a single run is performed.
+        :param max_iter: The maximum number of iterations of a single SMACOF run.
+        :param eps: The relative tolerance with respect to the stress at which convergence is declared.
+        :param n_jobs: The number of jobs used to run the ``n_init`` initializations in parallel.
+        :param random_state: The seed or ``RandomState`` used to initialize the centers.
+        :param warm_start: If ``True``, the embedding of the previous reduction is used as
+            initialization, as long as the given dissimilarity matrix has the same size.
+            This lets a slightly changed matrix converge within a few iterations.
         """
         super().__init__(n_components)
-        self.__mds = MDS(n_components, metric=metric, dissimilarity="precomputed")
+        self.__n_init = n_init
+        self.__warm_start = warm_start
+        self.__embedding = None
+        self.__dissimilarity_matrix = None
+        self.__weights = None
+        self.__stress = None
+        self.__n_iter = None
+        self.__projection = None
+        self.__mds = MDS(
+            n_components,
+            metric=metric,
+            n_init=n_init,
+            max_iter=max_iter,
+            eps=eps,
+            n_jobs=n_jobs,
+            random_state=random_state,
+            dissimilarity="precomputed",
+        )
 
-    def reduce(self, dissimilarity_matrix):
+    def reduce(self, dissimilarity_matrix, init=None, weights=None):
         """
         Reduces the given dissimilarity matrix using the MDS approach.
 
         :param dissimilarity_matrix: The dissimilarity matrix as 2D numpy array.
+        :param init: An optional starting configuration of size :math:`n \\times m` as 2D numpy array.
+            If it is not given and ``warm_start`` is enabled, the previous embedding is used.
+        :param weights: The optional multiplicities of the features as 1D numpy array.
+            If given, the stress of each pair of features is weighted by the product of their multiplicities,
+            see :meth:`supports_weights`.
         :return: Encoded vectors as 2D numpy array of size :math:`n \\times m`,
             with :math:`n` being the amount of features
             and :math:`m` the dimension of the vectors, i.e. ``n_components``.
+        :raise ValueError: Weights are given for non-metric MDS.
+        """
+        if init is None and self.__warm_start and self.__embedding is not None:
+            if self.__embedding.shape[0] == len(dissimilarity_matrix):
+                init = self.__embedding
+
+        if weights is None:
+            # a given starting configuration makes multiple initializations pointless
+            if init is None:
+                self.__mds.set_params(n_init=self.__n_init)
+            else:
+                self.__mds.set_params(n_init=1)
+
+            self.__embedding = self.__mds.fit_transform(dissimilarity_matrix, init=init)
+            self.__stress = self.__mds.stress_
+            self.__n_iter = self.__mds.n_iter_
+        else:
+            if not self.supports_weights():
+                raise ValueError("Weights are only supported by metric MDS.")
+            self.__embedding, self.__stress, self.__n_iter = self.__weighted_smacof(
+                dissimilarity_matrix, np.asarray(weights, dtype=np.float64), init
+            )
+
+        self.__dissimilarity_matrix = dissimilarity_matrix
+        self.__weights = None if weights is None else np.asarray(weights, np.float64)
+        self.__projection = None
+
+        return self.__embedding
+
+    def supports_weights(self):
+        """
+        The metric *MultidimensionalScalingReducer* supports weights using a weighted SMACOF algorithm.
+
+        :return: ``True`` if the MDS is metric.
+        """
+        return self.__mds.metric
+
+    def estimate_bytes(self, n_features):
+        """
+        Estimates the memory of the SMACOF algorithm, which keeps the distances of the configuration,
+        the ratios and the normalized dissimilarities as matrices of size :math:`n \\times n`.
+
+        :param n_features: The amount of features :math:`n`.
+        :return: The amount of bytes.
+        """
+        return 3 * 8 * n_features**2
+
+    def __weighted_smacof(self, dissimilarity_matrix, weights, init):
+        """
+        Runs the SMACOF algorithm with the weights :math:`w_{ij} = m_i m_j`, given the multiplicities :math:`m`.
+        For these weights, the Guttman transform reduces to :math:`X = \\frac{B(Z) Z}{M m_i}` row-wise,
+        with :math:`M` being the sum of the multiplicities, i.e. no pseudo-inverse is needed.
+        The result equals the one of the unweighted algorithm on the matrix with all repetitions,
+        if the repeated features are placed at the same point.
+
+        :param dissimilarity_matrix: The dissimilarity matrix as 2D numpy array.
+        :param weights: The multiplicities of the features as 1D numpy array.
+        :param init: An optional starting configuration as 2D numpy array.
+        :return: A tuple of the embedding, its stress and the amount of iterations of the best run.
+        """
+        n_features = len(dissimilarity_matrix)
+        pair_weights = np.outer(weights, weights)
+        scale = (weights.sum() * weights)[:, np.newaxis]
+        random_state = check_random_state(self.__mds.random_state)
+        n_init = self.__n_init if init is None else 1
+
+        best = None
+        for _ in range(0, n_init):
+            if init is None:
+                points = random_state.uniform(
+                    size=n_features * self.__mds.n_components
+                ).reshape((n_features, self.__mds.n_components))
+            else:
+                points = np.array(init, dtype=np.float64)
+
+            old_stress = None
+            for n_iter in range(1, self.__mds.max_iter + 1):
+                differences = points[:, np.newaxis, :] - points[np.newaxis, :, :]
+                distances = np.linalg.norm(differences, axis=2)
+                stress = (
+                    np.sum(pair_weights * (distances - dissimilarity_matrix) ** 2) / 2
+                )
+
+                distances[distances == 0] = 1e-5
+                b_matrix = -pair_weights * dissimilarity_matrix / distances
+                b_matrix[np.arange(n_features), np.arange(n_features)] = 0.0
+                b_matrix[np.arange(n_features), np.arange(n_features)] = -b_matrix.sum(
+                    axis=1
+                )
+                points = b_matrix @ points / scale
+
+                norm = np.sum(weights * np.sqrt(np.sum(points**2, axis=1)))
+                if old_stress is not None and old_stress - stress / norm < self.__mds.eps:
+                    break
+                old_stress = stress / norm
+
+            if best is None or stress < best[1]:
+                best = (points, stress, n_iter)
+
+        return best
+
+    def can_project(self):
+        """
+        The *MultidimensionalScalingReducer* can project new features into the last embedding.
+
+        :return: ``True``.
+        """
+        return True
+
+    def project(self, dissimilarity_matrix):
         """
-        return self.__mds.fit_transform(dissimilarity_matrix)
+        Projects new features into the last embedding.
+        The new points are initialized by adding them to the classical scaling
+        of the last dissimilarity matrix (Gower's formula).
+        Afterwards, their stress is minimized by SMACOF iterations, while the embedding stays fixed.
+        The initialization only depends on the last embedding and the row means of the squared dissimilarities,
+        which are calculated once.
+
+        :param dissimilarity_matrix: The dissimilarities between :math:`c` new features and the :math:`n`
+            features of the last reduction as 2D numpy array of size :math:`c \\times n`.
+        :return: Encoded vectors as 2D numpy array of size :math:`c \\times m`.
+        :raise ValueError: No reduction was performed yet.
+        """
+        if self.__embedding is None:
+            raise ValueError("The reducer needs to reduce a dissimilarity matrix first.")
+
+        if self.__weights is None:
+            weights = np.ones(len(self.__embedding))
+        else:
+            weights = self.__weights
+        total = weights.sum()
+
+        if self.__projection is None:
+            squared = np.power(self.__dissimilarity_matrix, 2)
+            row_means = squared @ weights / total
+            center = weights @ self.__embedding / total
+            root_weights = np.sqrt(weights)
+            pseudo_inverse = np.linalg.pinv(
+                (self.__embedding - center) * root_weights[:, np.newaxis]
+            )
+            self.__projection = (
+                row_means,
+                row_means @ weights / total,
+                center,
+                pseudo_inverse * root_weights,
+            )
+
+        row_means, grand_mean, center, pseudo_inverse = self.__projection
+
+        squared = np.power(dissimilarity_matrix, 2)
+        inner_products = -0.5 * (
+            squared - (squared @ weights / total)[:, np.newaxis] - row_means + grand_mean
+        )
+        points = inner_products @ pseudo_inverse.T + center
+
+        # Guttman transform of the new points only, each point stops on its own
+        active = np.arange(len(points))
+        old_stress = np.full(len(points), np.inf)
+        for _ in range(0, self.__mds.max_iter):
+            differences = (
+                points[active, np.newaxis, :] - self.__embedding[np.newaxis, :, :]
+            )
+            distances = np.linalg.norm(differences, axis=2)
+            dissimilarities = dissimilarity_matrix[active]
+            stress = (distances - dissimilarities) ** 2 @ weights
+
+            converged = old_stress[active] - stress <= self.__mds.eps * stress
+            old_stress[active] = stress
+            differences = differences[~converged]
+            distances = distances[~converged]
+            dissimilarities = dissimilarities[~converged]
+            active = active[~converged]
+            if len(active) == 0:
+                break
+
+            ratios = np.divide(
+                dissimilarities,
+                distances,
+                out=np.zeros_like(distances),
+                where=distances > 0,
+            )
+            points[active] = center + np.einsum(
+                "j,ijk->ik", weights / total, ratios[:, :, np.newaxis] * differences
+            )
+
+        return points
 
     def get_stress(self):
         """
@@ -117,4 +416,478 @@ class MultidimensionalScalingReducer(DissimilarityMatrixReducer):
 
         :return: The stress level of the MDS.
         """
-        return self.__mds.stress_
+        return self.__stress
+
+    def get_n_iter(self):
+        """
+        Gets the number of iterations of the best SMACOF run of the performed MDS.
+
+        :return: The number of iterations.
+        """
+        return self.__n_iter
+
+    def get_embedding(self):
+        """
+        Gets the embedding of the last reduction, which is used for warm starts.
+
+        :return: The embedding as 2D numpy array or ``None``, if no reduction was performed yet.
+        """
+        return self.__embedding
+
+
+class EigenReducer(SimilarityMatrixReducer, ABC):
+    """
+    An abstract base class for *SimilarityMatrixReducers*, which embed the features by the leading
+    eigenvectors of a symmetric operator derived from the similarity matrix.
+    The operator is never materialized for the iterative eigensolvers,
+    so sparse similarity matrices stay sparse.
+
+    The following eigensolvers are available:
+
+    ============ ===========
+    Name         Description
+    ------------ -----------
+    dense        | Computes the leading eigenpairs of the materialized operator with LAPACK.
+    arpack       | Uses the implicitly restarted Lanczos method of ARPACK.
+    lobpcg       | Uses the locally optimal block preconditioned conjugate gradient method.
+    randomized   | Uses a randomized range finder with power iterations (Halko et al.).
+    auto         | Uses ``dense`` for small matrices and ``arpack`` otherwise.
+    ============ ===========
+    """
+
+    # the amount of features up to which the ``auto`` solver uses the dense solver
+    DENSE_SIZE = 500
+
+    def __init__(
+        self, n_components, eigen_solver="auto", tol=0.0, max_iter=None, random_state=None
+    ):
+        """
+        Initializes the *EigenReducer*.
+
+        :param n_components: The dimension of the output vectors.
+        :param eigen_solver: The name of the eigensolver, which can be ``auto``, ``dense``, ``arpack``,
+            ``lobpcg`` or ``randomized``.
+        :param tol: The convergence tolerance of the iterative eigensolvers. If ``0``, the machine precision is used.
+        :param max_iter: The maximum number of iterations of the iterative eigensolvers.
+            If ``None``, the default of the eigensolver is used.
+        :param random_state: The seed or ``RandomState`` used for the starting vectors.
+        :raise ValueError: The given eigensolver does not exist.
+        """
+        super().__init__(n_components)
+        if eigen_solver not in ("auto", "dense", "arpack", "lobpcg", "randomized"):
+            raise ValueError(f"An eigensolver of type {eigen_solver} does not exist.")
+
+        self.__n_components = n_components
+        self.__eigen_solver = eigen_solver
+        self.__tol = tol
+        self.__max_iter = max_iter
+        self.__random_state = random_state
+
+        return
+
+    def get_n_components(self):
+        """
+        Gets the dimension of the output vectors.
+
+        :return: The dimension.
+        """
+        return self.__n_components
+
+    def supports_weights(self):
+        """
+        The *EigenReducers* support weights by scaling the operator with the square roots of the multiplicities.
+
+        :return: ``True``.
+        """
+        return True
+
+    def supports_operator(self):
+        """
+        The *EigenReducers* only multiply the similarity matrix with vectors.
+
+        :return: ``True``.
+        """
+        return True
+
+    def estimate_bytes(self, n_features):
+        """
+        Estimates the memory of the eigensolver.
+        The dense solver materializes the operator and its decomposition,
+        the iterative solvers only keep a few blocks of vectors of size :math:`n \\times k`.
+
+        :param n_features: The amount of features :math:`n`.
+        :return: The amount of bytes.
+        """
+        solver = self.__eigen_solver
+        if solver == "auto":
+            solver = "dense" if n_features <= self.DENSE_SIZE else "arpack"
+
+        if solver == "dense":
+            return 2 * 8 * n_features**2
+
+        return 8 * n_features * max(4 * self.__n_components, 40)
+
+    def _largest_eigenpairs(self, operator, n_eigenpairs):
+        """
+        Computes the largest eigenvalues and the corresponding eigenvectors of a symmetric operator.
+
+        :param operator: The symmetric operator as ``LinearOperator`` of size :math:`n \\times n`.
+        :param n_eigenpairs: The amount of eigenpairs :math:`k`.
+        :return: A tuple of the eigenvalues in descending order as 1D numpy array of size :math:`k`
+            and the eigenvectors as columns of a 2D numpy array of size :math:`n \\times k`.
+        """
+        n_features = operator.shape[0]
+        n_eigenpairs = min(n_eigenpairs, n_features)
+        random_state = check_random_state(self.__random_state)
+
+        solver = self.__eigen_solver
+        if solver == "auto":
+            solver = "dense" if n_features <= self.DENSE_SIZE else "arpack"
+
+        # the iterative solvers need sufficiently more features than eigenpairs
+        if solver == "arpack" and n_eigenpairs >= n_features - 1:
+            solver = "dense"
+        if solver == "lobpcg" and 5 * n_eigenpairs >= n_features:
+            solver = "dense"
+
+        if solver == "dense":
+            matrix = operator.matmat(np.eye(n_features))
+            values, vectors = scipy.linalg.eigh(
+                matrix, subset_by_index=(n_features - n_eigenpairs, n_features - 1)
+            )
+        elif solver == "arpack":
+            values, vectors = eigsh(
+                operator,
+                k=n_eigenpairs,
+                which="LA",
+                tol=self.__tol,
+                maxiter=self.__max_iter,
+                v0=random_state.uniform(-1, 1, n_features),
+            )
+        elif solver == "lobpcg":
+            values, vectors = lobpcg(
+                operator,
+                random_state.normal(size=(n_features, n_eigenpairs)),
+                tol=self.__tol if self.__tol > 0 else None,
+                maxiter=self.__max_iter if self.__max_iter is not None else 100,
+                largest=True,
+            )
+        else:
+            values, vectors = self.__randomized_eigenpairs(
+                operator, n_eigenpairs, random_state
+            )
+
+        order = np.argsort(-values, kind="stable")
+
+        return values[order], vectors[:, order]
+
+    def __randomized_eigenpairs(self, operator, n_eigenpairs, random_state):
+        """
+        Approximates the largest eigenpairs by a randomized range finder with power iterations.
+        The operator is projected onto an orthonormal basis of its approximate range,
+        and the small projected matrix is decomposed densely.
+
+        :param operator: The symmetric operator as ``LinearOperator``.
+        :param n_eigenpairs: The amount of eigenpairs.
+        :param random_state: The ``RandomState`` for the test matrix.
+        :return: A tuple of the eigenvalues and the eigenvectors.
+        """
+        n_features = operator.shape[0]
+        n_samples = min(n_eigenpairs + 10, n_features)
+        n_iter = self.__max_iter if self.__max_iter is not None else 7
+
+        basis = random_state.normal(size=(n_features, n_samples))
+        basis, _ = np.linalg.qr(operator.matmat(basis))
+        for _ in range(0, n_iter):
+            basis, _ = np.linalg.qr(operator.matmat(basis))
+
+        projected = basis.T @ operator.matmat(basis)
+        values, vectors = np.linalg.eigh((projected + projected.T) / 2)
+        values = values[-n_eigenpairs:]
+        vectors = basis @ vectors[:, -n_eigenpairs:]
+
+        return values, vectors
+
+    @staticmethod
+    def _prepare_weights(matrix, weights):
+        """
+        Validates the matrix and the multiplicities of the features.
+
+        :param matrix: The similarity matrix as 2D numpy array, scipy sparse matrix or ``LinearOperator``.
+        :param weights: The multiplicities of the features as 1D numpy array or ``None``.
+        :return: A tuple of the matrix as 2D numpy array, sparse CSR matrix or ``LinearOperator``
+            and the weights as 1D numpy array.
+        """
+        if isinstance(matrix, LinearOperator):
+            pass
+        elif scipy.sparse.issparse(matrix):
+            matrix = scipy.sparse.csr_matrix(matrix, dtype=np.float64)
+        else:
+            matrix = np.asarray(matrix, dtype=np.float64)
+
+        if weights is None:
+            weights = np.ones(matrix.shape[0])
+        else:
+            weights = np.asarray(weights, dtype=np.float64)
+
+        return matrix, weights
+
+
+class KernelPCAReducer(EigenReducer):
+    """
+    A reducer using kernel PCA, which takes the similarity matrix :math:`K` as kernel matrix.
+    The kernel is centered, i.e. :math:`\\tilde{K} = K - \\mathbf{1} r^T - r \\mathbf{1}^T + g`,
+    with :math:`r` being the row means and :math:`g` the grand mean,
+    and the features are embedded by the leading eigenvectors :math:`v_k` scaled by :math:`\\sqrt{\\lambda_k}`.
+    The centering is applied implicitly, so sparse kernels are never densified by the iterative eigensolvers.
+    It can be used with the ``kpca`` option.
+
+    New features are projected with the Nyström formula :math:`x_k = \\tilde{k}^T v_k / \\sqrt{\\lambda_k}`,
+    with :math:`\\tilde{k}` being their similarities to the features of the last reduction,
+    centered with the means of the last reduction.
+    """
+
+    def __init__(
+        self,
+        n_components=2,
+        eigen_solver="auto",
+        tol=0.0,
+        max_iter=None,
+        random_state=None,
+    ):
+        """
+        Initializes the *KernelPCAReducer*.
+
+        :param n_components: The dimension of the output vectors.
+        :param eigen_solver: The name of the eigensolver, see :class:`.EigenReducer`.
+        :param tol: The convergence tolerance of the iterative eigensolvers.
+        :param max_iter: The maximum number of iterations of the iterative eigensolvers.
+        :param random_state: The seed or ``RandomState`` used for the starting vectors.
+        """
+        super().__init__(n_components, eigen_solver, tol, max_iter, random_state)
+        self.__weights = None
+        self.__row_means = None
+        self.__grand_mean = None
+        self.__eigenvalues = None
+        self.__projection = None
+
+        return
+
+    def reduce(self, similarity_matrix, weights=None):
+        """
+        Reduces the given similarity matrix using kernel PCA.
+
+        :param similarity_matrix: The symmetric similarity matrix as 2D numpy array, scipy sparse matrix
+            or ``LinearOperator``.
+        :param weights: The optional multiplicities of the features as 1D numpy array,
+            see :meth:`.Reducer.supports_weights`.
+        :return: Encoded vectors as 2D numpy array of size :math:`n \\times m`.
+        """
+        kernel, weights = self._prepare_weights(similarity_matrix, weights)
+        total = weights.sum()
+        root_weights = np.sqrt(weights)
+        row_means = np.asarray(kernel @ weights).ravel() / total
+        grand_mean = row_means @ weights / total
+
+        def centered(vectors):
+            # W^(1/2) (K - 1 r^T - r 1^T + g) W^(1/2) applied to the columns of the vectors
+            scaled = vectors * root_weights[:, np.newaxis]
+            sums = scaled.sum(axis=0)
+            result = np.asarray(kernel @ scaled)
+            result -= np.outer(row_means, sums)
+            result -= row_means @ scaled - grand_mean * sums
+            return result * root_weights[:, np.newaxis]
+
+        n_features = kernel.shape[0]
+        operator = LinearOperator(
+            (n_features, n_features),
+            matvec=lambda v: centered(v.reshape(-1, 1)).ravel(),
+            matmat=centered,
+            dtype=np.float64,
+        )
+
+        eigenvalues, eigenvectors = self._largest_eigenpairs(
+            operator, self.get_n_components()
+        )
+        eigenvalues = np.maximum(eigenvalues, 0.0)
+
+        self.__weights = weights
+        self.__row_means = row_means
+        self.__grand_mean = grand_mean
+        self.__eigenvalues = eigenvalues
+
+        # the eigenvectors of the expanded kernel repeat v_i / sqrt(w_i) for each repetition
+        vectors = eigenvectors / root_weights[:, np.newaxis]
+        self.__projection = np.divide(
+            eigenvectors * root_weights[:, np.newaxis],
+            np.sqrt(eigenvalues),
+            out=np.zeros_like(eigenvectors),
+            where=eigenvalues > 0,
+        )
+
+        return vectors * np.sqrt(eigenvalues)
+
+    def can_project(self):
+        """
+        The *KernelPCAReducer* can project new features using the Nyström formula.
+
+        :return: ``True``.
+        """
+        return True
+
+    def project(self, similarity_matrix):
+        """
+        Projects new features into the last embedding using the Nyström formula.
+
+        :param similarity_matrix: The similarities between :math:`c` new features and the :math:`n`
+            features of the last reduction as 2D numpy array or scipy sparse matrix of size :math:`c \\times n`.
+        :return: Encoded vectors as 2D numpy array of size :math:`c \\times m`.
+        :raise ValueError: No reduction was performed yet.
+        """
+        if self.__projection is None:
+            raise ValueError("The reducer needs to reduce a similarity matrix first.")
+
+        new_means = np.asarray(similarity_matrix @ self.__weights).ravel()
+        new_means /= self.__weights.sum()
+        sums = self.__projection.sum(axis=0)
+
+        # centering with the means of the last reduction
+        points = np.asarray(similarity_matrix @ self.__projection)
+        points -= np.outer(new_means, sums)
+        points -= self.__row_means @ self.__projection - self.__grand_mean * sums
+
+        return points
+
+    def get_eigenvalues(self):
+        """
+        Gets the eigenvalues of the centered kernel of the last reduction.
+
+        :return: The eigenvalues in descending order as 1D numpy array or ``None``,
+            if no reduction was performed yet.
+        """
+        return self.__eigenvalues
+
+
+class SpectralEmbeddingReducer(EigenReducer):
+    """
+    A reducer using a spectral embedding, which takes the similarity matrix :math:`A` as affinity matrix.
+    With the degrees :math:`D = \\operatorname{diag}(A \\mathbf{1})`, the features are embedded by the
+    eigenvectors :math:`y_k = D^{-1/2} u_k` of the leading eigenvectors :math:`u_k` of the normalized adjacency
+    :math:`D^{-1/2} A D^{-1/2}` without the trivial first one, as in Laplacian eigenmaps.
+    The affinities need to be non-negative.
+    It can be used with the ``spectral`` option.
+
+    New features are projected with the Nyström formula :math:`y_k = \\frac{a^T y_k}{\\lambda_k \\, a^T \\mathbf{1}}`,
+    with :math:`a` being their affinities to the features of the last reduction.
+    """
+
+    def __init__(
+        self,
+        n_components=2,
+        eigen_solver="auto",
+        tol=0.0,
+        max_iter=None,
+        random_state=None,
+    ):
+        """
+        Initializes the *SpectralEmbeddingReducer*.
+
+        :param n_components: The dimension of the output vectors.
+        :param eigen_solver: The name of the eigensolver, see :class:`.EigenReducer`.
+        :param tol: The convergence tolerance of the iterative eigensolvers.
+        :param max_iter: The maximum number of iterations of the iterative eigensolvers.
+        :param random_state: The seed or ``RandomState`` used for the starting vectors.
+        """
+        super().__init__(n_components, eigen_solver, tol, max_iter, random_state)
+        self.__weights = None
+        self.__eigenvalues = None
+        self.__embedding = None
+
+        return
+
+    def reduce(self, similarity_matrix, weights=None):
+        """
+        Reduces the given similarity matrix using a spectral embedding.
+
+        :param similarity_matrix: The symmetric, non-negative similarity matrix
+            as 2D numpy array or scipy sparse matrix.
+        :param weights: The optional multiplicities of the features as 1D numpy array,
+            see :meth:`.Reducer.supports_weights`.
+        :return: Encoded vectors as 2D numpy array of size :math:`n \\times m`.
+        :raise ValueError: A feature has no positive affinity.
+        """
+        affinity, weights = self._prepare_weights(similarity_matrix, weights)
+        degrees = np.asarray(affinity @ weights).ravel()
+        if np.any(degrees <= 0):
+            raise ValueError(
+                "The spectral embedding needs a positive affinity for each feature."
+            )
+
+        # D^(-1/2) W^(1/2) A W^(1/2) D^(-1/2) has the spectrum of the random walk on the expanded graph
+        scale = np.sqrt(weights / degrees)
+
+        def normalized(vectors):
+            return (
+                np.asarray(affinity @ (vectors * scale[:, np.newaxis]))
+                * scale[:, np.newaxis]
+            )
+
+        n_features = affinity.shape[0]
+        operator = LinearOperator(
+            (n_features, n_features),
+            matvec=lambda v: normalized(v.reshape(-1, 1)).ravel(),
+            matmat=normalized,
+            dtype=np.float64,
+        )
+
+        eigenvalues, eigenvectors = self._largest_eigenpairs(
+            operator, self.get_n_components() + 1
+        )
+
+        embedding = eigenvectors / np.sqrt(weights * degrees)[:, np.newaxis]
+        # the first eigenvector is constant and carries no information
+        self.__weights = weights
+        self.__eigenvalues = eigenvalues[1:]
+        self.__embedding = embedding[:, 1:]
+
+        return self.__embedding
+
+    def can_project(self):
+        """
+        The *SpectralEmbeddingReducer* can project new features using the Nyström formula.
+
+        :return: ``True``.
+        """
+        return True
+
+    def project(self, similarity_matrix):
+        """
+        Projects new features into the last embedding using the Nyström formula.
+
+        :param similarity_matrix: The non-negative similarities between :math:`c` new features and the :math:`n`
+            features of the last reduction as 2D numpy array or scipy sparse matrix of size :math:`c \\times n`.
+        :return: Encoded vectors as 2D numpy array of size :math:`c \\times m`.
+            New features without a positive affinity are placed at the origin.
+        :raise ValueError: No reduction was performed yet.
+        """
+        if self.__embedding is None:
+            raise ValueError("The reducer needs to reduce a similarity matrix first.")
+
+        degrees = np.asarray(similarity_matrix @ self.__weights).ravel()
+        points = np.asarray(
+            similarity_matrix @ (self.__embedding * self.__weights[:, np.newaxis])
+        )
+        scale = np.divide(1.0, degrees, out=np.zeros_like(degrees), where=degrees > 0)[
+            :, np.newaxis
+        ]
+
+        return points * scale / self.__eigenvalues
+
+    def get_eigenvalues(self):
+        """
+        Gets the eigenvalues of the normalized adjacency of the last reduction without the trivial first one.
+
+        :return: The eigenvalues in descending order as 1D numpy array or ``None``,
+            if no reduction was performed yet.
+        """
+        return self.__eigenvalues
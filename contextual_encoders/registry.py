@@ -0,0 +1,109 @@
+"""
+CacheRegistry
+====================================
+The *CacheRegistry* shares expensive state between objects that are equal by content,
+but not identical, e.g. the *Measures* of the clones that scikit-learn creates for each fold of a grid search,
+or two columns using the same *Context* (like origin and destination city).
+
+Each entry is identified by a deterministic fingerprint:
+
+- A :class:`.GraphBasedContext` is identified by its type, its name and the content of its graph,
+  see :meth:`.GraphBasedContext.get_fingerprint`. Contexts with the same fingerprint share their
+  compiled indexes, i.e. the :class:`.CompiledGraph`, the :class:`.TreeIndex` and the distance oracles.
+- A :class:`.Measure` is identified by its type, its parameters and the fingerprint of its *Context*,
+  see :meth:`.Measure.get_fingerprint`. Measures with the same fingerprint share their cache
+  and their table, see :meth:`.Measure.share_cache`.
+
+The registry is process-wide and holds at most ``max_size`` entries.
+If it is full, the least recently used entry is dropped. Objects that already use a dropped entry keep it,
+it is only not shared with new objects anymore.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class CacheRegistry:
+    """
+    A process-wide, size-bounded registry of shared state, identified by fingerprints.
+    """
+
+    __entries = OrderedDict()
+    __lock = threading.Lock()
+    __max_size = 64
+
+    @staticmethod
+    def get(key, factory):
+        """
+        Returns the shared state of the given key.
+        If the key is not registered yet, the state is created by the factory and registered.
+
+        :param key: A hashable key, e.g. a tuple of the kind of the state and a fingerprint.
+        :param factory: A function without arguments, that creates the state.
+        :return: The shared state.
+        """
+        with CacheRegistry.__lock:
+            if key in CacheRegistry.__entries:
+                CacheRegistry.__entries.move_to_end(key)
+                return CacheRegistry.__entries[key]
+
+            state = factory()
+            CacheRegistry.__entries[key] = state
+            while len(CacheRegistry.__entries) > CacheRegistry.__max_size:
+                CacheRegistry.__entries.popitem(last=False)
+
+        return state
+
+    @staticmethod
+    def contains(key):
+        """
+        Checks whether the given key is registered.
+
+        :param key: The key.
+        :return: ``True`` if the key is registered.
+        """
+        with CacheRegistry.__lock:
+            return key in CacheRegistry.__entries
+
+    @staticmethod
+    def size():
+        """
+        Returns the amount of registered entries.
+
+        :return: The amount of entries.
+        """
+        with CacheRegistry.__lock:
+            return len(CacheRegistry.__entries)
+
+    @staticmethod
+    def get_max_size():
+        """
+        Returns the maximum amount of entries.
+
+        :return: The maximum amount of entries.
+        """
+        return CacheRegistry.__max_size
+
+    @staticmethod
+    def set_max_size(max_size):
+        """
+        Sets the maximum amount of entries and drops the least recently used entries, if necessary.
+
+        :param max_size: The maximum amount of entries. If ``0``, nothing is shared.
+        """
+        with CacheRegistry.__lock:
+            CacheRegistry.__max_size = max_size
+            while len(CacheRegistry.__entries) > max_size:
+                CacheRegistry.__entries.popitem(last=False)
+
+        return
+
+    @staticmethod
+    def clear():
+        """
+        Drops all entries.
+        """
+        with CacheRegistry.__lock:
+            CacheRegistry.__entries.clear()
+
+        return
@@ -0,0 +1,167 @@
+"""
+Tokenizer
+====================================
+The *Tokenizer* splits the values of an attribute into their forms.
+It is used by the :class:`.MatrixComputer` to prepare the distinct values of a column in a single pass,
+before any comparison takes place.
+
+The result is a :class:`.TokenizedColumn`, which stores the forms in a CSR-like structure:
+All forms are interned, i.e. each distinct form is stored once within the vocabulary and referred to by its id.
+The form ids of the :math:`i`-th value are given by ``form_ids[offsets[i]:offsets[i + 1]]``.
+This way, the *Gatherers* can reduce over arrays rather than splitting strings for each comparison.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+
+
+class TokenizedColumn:
+    """
+    The forms of the values of a column in a CSR-like structure.
+    """
+
+    def __init__(self, offsets, form_ids, forms):
+        """
+        Initializes the *TokenizedColumn*.
+
+        :param offsets: The offsets of the values within the ``form_ids`` as 1D numpy array of size :math:`u + 1`,
+            with :math:`u` being the amount of values.
+        :param form_ids: The ids of the forms of all values as 1D numpy array.
+        :param forms: The vocabulary of distinct forms as 1D numpy array.
+        """
+        self.__offsets = offsets
+        self.__form_ids = form_ids
+        self.__forms = forms
+
+        return
+
+    def __len__(self):
+        """
+        Returns the amount of values.
+
+        :return: The amount of values.
+        """
+        return len(self.__offsets) - 1
+
+    def get_offsets(self):
+        """
+        Returns the offsets of the values within the form ids.
+
+        :return: The offsets as 1D numpy array of size :math:`u + 1`.
+        """
+        return self.__offsets
+
+    def get_form_ids(self):
+        """
+        Returns the ids of the forms of all values.
+
+        :return: The form ids as 1D numpy array.
+        """
+        return self.__form_ids
+
+    def get_forms(self):
+        """
+        Returns the vocabulary of distinct forms.
+
+        :return: The forms as 1D numpy array.
+        """
+        return self.__forms
+
+    def get_lengths(self):
+        """
+        Returns the amount of forms of each value.
+
+        :return: The amount of forms as 1D numpy array of size :math:`u`.
+        """
+        return np.diff(self.__offsets)
+
+    def get_first_form_ids(self):
+        """
+        Returns the id of the first form of each value.
+
+        :return: The form ids as 1D numpy array of size :math:`u`.
+        """
+        return self.__form_ids[self.__offsets[:-1]]
+
+    def get_value(self, index):
+        """
+        Returns the forms of the value with the given index.
+
+        :param index: The index of the value.
+        :return: A list of the forms.
+        """
+        start = self.__offsets[index]
+        end = self.__offsets[index + 1]
+
+        return list(self.__forms[self.__form_ids[start:end]])
+
+
+class Tokenizer:
+    """
+    The service class to split the values of a column into their forms.
+    """
+
+    def __init__(self, separator_token=",", strip=False, unique=False):
+        """
+        Initializes the *Tokenizer*.
+
+        :param separator_token: A string for separating forms of attributes.
+        :param strip: If ``True``, leading and trailing whitespaces are removed from the forms.
+        :param unique: If ``True``, repeated forms within a value are only kept once.
+        """
+        self.__separator_token = separator_token
+        self.__strip = strip
+        self.__unique = unique
+
+        return
+
+    def get_separator_token(self):
+        """
+        Returns the string for separating forms of attributes.
+
+        :return: The separator token.
+        """
+        return self.__separator_token
+
+    def get_parameters(self):
+        """
+        Returns the parameters of the *Tokenizer*, which determine the forms of the values.
+
+        :return: A dictionary of the parameters, which can be serialized to JSON.
+        """
+        return {
+            "separator_token": self.__separator_token,
+            "strip": self.__strip,
+            "unique": self.__unique,
+        }
+
+    def tokenize(self, values):
+        """
+        Splits the given values into their forms using vectorized string operations.
+
+        :param values: The values as 1D numpy array. Each value is converted to a string before splitting.
+        :return: The :class:`.TokenizedColumn` of the values.
+        """
+        n_values = len(values)
+
+        strings = pd.Series(values, dtype=object).map(str)
+        # the separator is escaped, since pandas treats separators of more than one character as regex
+        forms = strings.str.split(re.escape(self.__separator_token)).explode()
+        if self.__strip:
+            forms = forms.str.strip()
+
+        value_ids = forms.index.to_numpy()
+        form_ids, vocabulary = pd.factorize(forms.to_numpy(dtype=object))
+
+        if self.__unique:
+            pairs = pd.DataFrame({"value": value_ids, "form": form_ids})
+            keep = ~pairs.duplicated().to_numpy()
+            value_ids = value_ids[keep]
+            form_ids = form_ids[keep]
+
+        counts = np.bincount(value_ids, minlength=n_values)
+        offsets = np.zeros(n_values + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return TokenizedColumn(offsets, form_ids, np.asarray(vocabulary, dtype=object))
@@ -0,0 +1,137 @@
+"""
+ValueMatrix
+====================================
+A *ValueMatrix* is the compact representation of the similarity or dissimilarity matrix of one attribute.
+Since the comparison value of two rows only depends on their values, the matrix
+:math:`D \\in \\mathbb{R}^{n_1 \\times n_2}` is fully determined by the matrix of the distinct values
+:math:`V \\in \\mathbb{R}^{u_1 \\times u_2}` and the codes of the rows, i.e. :math:`D_{i,j} = V_{r_i, c_j}`.
+
+Element-wise operations, like the conversions of the :class:`.Inverter`, are applied to :math:`V` only.
+The expansion to all rows takes place once, fused with the aggregation of the attributes,
+see :meth:`.Aggregator.aggregate_values`.
+
+Products with vectors do not need the expansion at all.
+With the indicator matrices :math:`P_r` and :math:`P_c` of the codes, i.e. :math:`D = P_r V P_c^T`,
+the product :math:`D X` is calculated from right to left in :math:`O((n_1 + n_2) m + u_1 u_2 m)`,
+see :meth:`ValueMatrix.matmat`.
+"""
+
+import numpy as np
+
+# the amount of matrix entries that are expanded at once
+BLOCK_SIZE = 1 << 22
+
+
+class ValueMatrix:
+    """
+    A similarity or dissimilarity matrix given by the matrix of the distinct values and the codes of the rows.
+    """
+
+    def __init__(self, values, row_codes, column_codes):
+        """
+        Initializes the *ValueMatrix*.
+
+        :param values: The matrix of the distinct values as 2D numpy array of size :math:`u_1 \\times u_2`.
+        :param row_codes: The codes of the rows as 1D integer numpy array of size :math:`n_1`,
+            referring to the rows of ``values``.
+        :param column_codes: The codes of the columns as 1D integer numpy array of size :math:`n_2`,
+            referring to the columns of ``values``.
+        """
+        self.__values = values
+        self.__row_codes = row_codes
+        self.__column_codes = column_codes
+
+        return
+
+    def get_values(self):
+        """
+        Returns the matrix of the distinct values.
+
+        :return: The matrix as 2D numpy array.
+        """
+        return self.__values
+
+    def get_row_codes(self):
+        """
+        Returns the codes of the rows.
+
+        :return: The codes as 1D numpy array.
+        """
+        return self.__row_codes
+
+    def get_column_codes(self):
+        """
+        Returns the codes of the columns.
+
+        :return: The codes as 1D numpy array.
+        """
+        return self.__column_codes
+
+    def get_shape(self):
+        """
+        Returns the shape of the expanded matrix.
+
+        :return: A tuple of the amount of rows and columns.
+        """
+        return len(self.__row_codes), len(self.__column_codes)
+
+    def apply(self, function):
+        """
+        Applies an element-wise function to the matrix.
+        The function is only evaluated on the matrix of the distinct values.
+
+        :param function: A function, that maps a 2D numpy array element-wise to a 2D numpy array,
+            e.g. :meth:`.Inverter.similarity_to_dissimilarity`.
+        :return: The resulting *ValueMatrix*.
+        """
+        return ValueMatrix(function(self.__values), self.__row_codes, self.__column_codes)
+
+    def expand(self, start=0, end=None, out=None):
+        """
+        Expands the given rows of the matrix.
+
+        :param start: The first row.
+        :param end: The row after the last one. If ``None``, all remaining rows are expanded.
+        :param out: An optional 2D numpy array of the expanded size the result is written into.
+        :return: The expanded rows as 2D numpy array of size :math:`(end - start) \\times n_2`.
+        """
+        rows = self.__values[self.__row_codes[start:end]]
+
+        return np.take(rows, self.__column_codes, axis=1, out=out)
+
+    def matmat(self, vectors):
+        """
+        Multiplies the expanded matrix with the given vectors without expanding it,
+        i.e. the vectors are summed per column value, multiplied with the matrix of the distinct values,
+        and the result is looked up for each row.
+
+        :param vectors: A 1D numpy array of size :math:`n_2` or a 2D numpy array of size :math:`n_2 \\times m`.
+        :return: The product as numpy array of size :math:`n_1` or :math:`n_1 \\times m`.
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+        if vectors.ndim == 1:
+            return self.matmat(vectors[:, np.newaxis]).ravel()
+
+        n_values = self.__values.shape[1]
+        sums = np.empty((n_values, vectors.shape[1]))
+        for j in range(0, vectors.shape[1]):
+            sums[:, j] = np.bincount(
+                self.__column_codes, weights=vectors[:, j], minlength=n_values
+            )
+
+        return (self.__values @ sums)[self.__row_codes]
+
+    def iterate_blocks(self, block_size=None):
+        """
+        Splits the rows of the matrix into blocks, such that the expansion of a block has a bounded size.
+
+        :param block_size: The amount of rows of each block.
+            If ``None``, it is chosen such that each block has about ``BLOCK_SIZE`` entries.
+        :return: A generator of tuples with the first row and the row after the last one of each block.
+        """
+        n_rows, n_columns = self.get_shape()
+        if block_size is None:
+            block_size = max(BLOCK_SIZE // max(n_columns, 1), 1)
+
+        for start in range(0, n_rows, block_size):
+            yield start, min(start + block_size, n_rows)
@@ -0,0 +1,46 @@
+from unittest import TestCase
+import numpy as np
+from contextual_encoders import AggregatorFactory, SqrtInverter, ValueMatrix
+
+
+class TestAggregator(TestCase):
+    def test_aggregate_values_equals_aggregate(self):
+        random = np.random.RandomState(0)
+        value_matrices = [
+            ValueMatrix(
+                random.rand(3, 4), random.randint(0, 3, 25), random.randint(0, 4, 20)
+            )
+            for _ in range(0, 3)
+        ]
+        value_matrices = [
+            m.apply(SqrtInverter().similarity_to_dissimilarity) for m in value_matrices
+        ]
+        matrices = [m.expand() for m in value_matrices]
+
+        for name in ["mean", "median", "max", "min"]:
+            aggregator = AggregatorFactory.create(name)
+            np.testing.assert_allclose(
+                aggregator.aggregate_values(value_matrices, block_size=7),
+                aggregator.aggregate(matrices),
+            )
+
+    def test_aggregate_operator_equals_aggregate(self):
+        random = np.random.RandomState(0)
+        value_matrices = [
+            ValueMatrix(
+                random.rand(3, 4), random.randint(0, 3, 25), random.randint(0, 4, 20)
+            )
+            for _ in range(0, 3)
+        ]
+        vectors = random.rand(20, 2)
+
+        aggregator = AggregatorFactory.create("mean")
+        operator = aggregator.aggregate_operator(value_matrices)
+        expected = aggregator.aggregate([m.expand() for m in value_matrices])
+
+        np.testing.assert_allclose(operator.matmat(vectors), expected @ vectors)
+        np.testing.assert_allclose(
+            operator.matvec(vectors[:, 0]), expected @ vectors[:, 0]
+        )
+        with self.assertRaises(ValueError):
+            AggregatorFactory.create("max").aggregate_operator(value_matrices)
@@ -0,0 +1,127 @@
+import glob
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+import numpy as np
+from contextual_encoders import PathLengthMeasure
+from contextual_encoders.computer import MatrixComputer
+from tests.test_encoder import create_day_measure
+
+
+class RecordingMeasure(PathLengthMeasure):
+    def __init__(self, context):
+        super().__init__(context)
+        self.pairs = []
+
+    def _get_parameters(self):
+        # each instance has its own cache
+        return {"id": id(self)}
+
+    def _compare(self, first, second):
+        self.pairs.append((first, second))
+        return super()._compare(first, second)
+
+
+class TestMatrixComputer(TestCase):
+    values = np.array(["Mon", "Tue", "Wed", "Thur", "Fri", "Sat", "Sun", "Sat,Sun"])
+
+    def test_tiles_equal_matrix(self):
+        expected = MatrixComputer(create_day_measure(), "smm", ",").compute_values(
+            self.values
+        )
+
+        with ThreadPoolExecutor(2) as executor:
+            computer = MatrixComputer(
+                create_day_measure(), "smm", ",", tile_size=3, executor=executor
+            )
+            actual = computer.compute_values(self.values)
+
+        np.testing.assert_allclose(actual, expected)
+
+    def test_identical_forms_are_not_compared(self):
+        for name in ["first", "smm", "mean", "hausdorff", "jaccard"]:
+            measure = RecordingMeasure(create_day_measure().get_context())
+            expected = MatrixComputer(create_day_measure(), name, ",").compute_values(
+                self.values
+            )
+
+            actual = MatrixComputer(measure, name, ",").compute_values(self.values)
+
+            np.testing.assert_allclose(actual, expected, err_msg=name)
+            self.assertTrue(measure.pairs, "Should compare different forms")
+            self.assertFalse(
+                any(first == second for first, second in measure.pairs),
+                "Should not compare identical forms",
+            )
+
+    def test_resume_from_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            computer = MatrixComputer(
+                create_day_measure(), "smm", ",", tile_size=3, checkpoint_dir=directory
+            )
+            expected = computer.compute_values(self.values)
+
+            tiles = sorted(glob.glob(os.path.join(directory, "*", "tile_*.npy")))
+            self.assertEqual(len(tiles), 9, "Should store nine tiles")
+
+            # a finished tile is loaded instead of being recomputed, a missing one is recomputed
+            np.save(tiles[0], np.full((3, 3), -1.0))
+            os.remove(tiles[1])
+            actual = computer.compute_values(self.values)
+
+            np.testing.assert_allclose(actual[:3, :3], -1.0)
+            np.testing.assert_allclose(actual[:, 3:], expected[:, 3:])
+            self.assertTrue(os.path.exists(tiles[1]), "Should store the missing tile")
+
+    def test_context_change_invalidates_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            measure = create_day_measure()
+            computer = MatrixComputer(
+                measure, "smm", ",", tile_size=3, checkpoint_dir=directory
+            )
+            before = computer.compute_values(self.values)
+
+            # a shortcut from Mon to Thur changes the path lengths
+            measure.get_context().add_concept("Mon", "Thur")
+            actual = computer.compute_values(self.values)
+
+            expected_measure = create_day_measure()
+            expected_measure.get_context().add_concept("Mon", "Thur")
+            expected = MatrixComputer(expected_measure, "smm", ",").compute_values(
+                self.values
+            )
+
+            self.assertEqual(
+                len(glob.glob(os.path.join(directory, "*", "manifest.json"))),
+                2,
+                "Should not reuse the tiles of the old context",
+            )
+            self.assertFalse(np.allclose(actual, before))
+            np.testing.assert_allclose(actual, expected)
+
+    def test_unknown_values(self):
+        values = np.array(["Mon", "Holiday", "Tue,Xmas"])
+
+        with self.assertRaises(ValueError):
+            MatrixComputer(create_day_measure(), "smm", ",").compute_values(values)
+
+        computer = MatrixComputer(create_day_measure(), "smm", ",", unknown=0.0)
+        matrix = computer.compute_values(values)
+
+        np.testing.assert_allclose(matrix[1], 0.0)
+        self.assertAlmostEqual(matrix[0, 2], 0.375, msg="Should compare Xmas with zero")
+
+    def test_unknown_value_is_scoped_to_the_computation(self):
+        values = np.array(["Mon", "Holiday"])
+        measure = create_day_measure()
+
+        MatrixComputer(measure, "smm", ",", unknown=0.0).compute_values(values)
+
+        # the fixed value is not assigned to the shared measure
+        with self.assertRaises(Exception):
+            measure.compare_block(["Holiday"], ["Mon"])
+        with self.assertRaises(ValueError):
+            MatrixComputer(measure, "smm", ",").compute_values(values)
+        with self.assertRaises(ValueError):
+            MatrixComputer(measure, "smm", ",", unknown=True)
@@ -1,5 +1,8 @@
 from unittest import TestCase
-from contextual_encoders import TreeContext
+import os
+import tempfile
+import pandas as pd
+from contextual_encoders import TreeContext, GraphContext, TreeIndex
 
 
 class TestTreeContext(TestCase):
@@ -40,3 +43,181 @@ class TestTreeContext(TestCase):
         self.assertEqual(
             tree["Dark"]["Darkblue"]["weight"], 0.4, "Edge should have weight 0.4"
         )
+
+    def test_lowest_common_ancestors(self):
+        tree_context = TreeContext("Color")
+        tree_context.add_concept("Dark")
+        tree_context.add_concept("Light")
+        tree_context.add_concept("Yellow", "Light")
+        tree_context.add_concept("Darkblue", "Dark")
+        tree_context.add_concept("Navy", "Darkblue")
+
+        index = tree_context.get_index()
+        first = index.get_ids(["Navy", "Navy", "Yellow", "Dark"])
+        second = index.get_ids(["Dark", "Yellow", "Light", "Dark"])
+        ancestors = index.get_nodes()[index.lowest_common_ancestors(first, second)]
+
+        self.assertEqual(
+            list(ancestors), ["Dark", "Color", "Light", "Dark"], "Should be the LCAs"
+        )
+        self.assertEqual(
+            list(index.get_descendant_counts()[index.get_ids(["Color", "Dark"])]),
+            [5.0, 2.0],
+            "Should count the descendants",
+        )
+
+    def test_index_rejects_multiple_parents(self):
+        tree_context = TreeContext("Color")
+        tree_context.add_concept("Dark")
+        tree_context.add_concept("Light")
+        tree_context.add_concept("Grey", "Dark")
+        tree_context.add_concept("Grey", "Light")
+
+        with self.assertRaises(ValueError):
+            tree_context.get_index()
+
+    def test_create_tree_context_from_dataframe(self):
+        df = pd.DataFrame(
+            {
+                "child": ["Dark", "Light", "Yellow", "Darkblue", "Navy"],
+                "parent": [None, None, "Light", "Dark", "Darkblue"],
+                "weight": [1.0, 1.0, 2.0, 1.0, 1.0],
+            }
+        )
+        tree_context = TreeContext.from_dataframe(
+            "Color", df, "child", "parent", "weight"
+        )
+
+        tree = tree_context.get_tree()
+        index = tree_context.get_index()
+        ancestors = index.lowest_common_ancestors(
+            index.get_ids(["Navy", "Navy"]), index.get_ids(["Dark", "Yellow"])
+        )
+
+        self.assertEqual(tree.number_of_edges(), 5, "Should contain all edges")
+        self.assertEqual(tree["Light"]["Yellow"]["weight"], 2.0, "Should use the weight")
+        self.assertEqual(
+            list(index.get_nodes()[ancestors]), ["Dark", "Color"], "Should be the LCAs"
+        )
+
+    def test_add_concepts_rejects_cycles(self):
+        tree_context = TreeContext("Color")
+        tree_context.add_concept("Dark")
+
+        with self.assertRaises(ValueError):
+            tree_context.add_concepts([("Blue", "Navy"), ("Navy", "Blue")])
+        with self.assertRaises(ValueError):
+            tree_context.add_concepts([("Dark", "Light")])
+        self.assertEqual(
+            tree_context.get_tree().number_of_edges(), 1, "Should not be modified"
+        )
+
+    def test_export_and_import(self):
+        tree_context = TreeContext("Color")
+        tree_context.add_concept("Dark")
+        tree_context.add_concept("Light", weight=2.0)
+        tree_context.add_concept("Navy", "Dark")
+
+        with tempfile.TemporaryDirectory() as directory:
+            tree_context.export_to_file(os.path.join(directory, "tree.json"))
+            tree_context.export_to_binary(os.path.join(directory, "tree.bin"))
+            json_context = TreeContext("Color")
+            json_context.import_from_file(os.path.join(directory, "tree.json"))
+            binary_context = TreeContext("Color")
+            binary_context.import_from_binary(os.path.join(directory, "tree.bin"))
+
+            index = binary_context.get_index()
+            ancestors = index.lowest_common_ancestors(
+                index.get_ids(["Navy"]), index.get_ids(["Light"])
+            )
+
+            self.assertEqual(
+                sorted(json_context.get_tree().edges(data="weight")),
+                sorted(tree_context.get_tree().edges(data="weight")),
+                "Should be the same tree",
+            )
+            self.assertEqual(
+                sorted(binary_context.get_tree().edges(data="weight")),
+                sorted(tree_context.get_tree().edges(data="weight")),
+                "Should be the same tree",
+            )
+            self.assertEqual(
+                list(index.get_nodes()[ancestors]), ["Color"], "Should be the LCA"
+            )
+
+    def test_add_leaf_updates_index(self):
+        tree_context = TreeContext("Color")
+        tree_context.add_concept("Dark")
+        tree_context.add_concept("Light")
+        tree_context.add_concept("Darkblue", "Dark")
+        index = tree_context.get_index()
+        version = tree_context.get_version()
+
+        tree_context.add_concept("Navy", "Darkblue")
+        tree_context.add_concept("Yellow", "Light")
+        updated = tree_context.get_index()
+        rebuilt = TreeIndex.from_graph(tree_context.get_tree(), "Color")
+
+        self.assertIsNot(updated, index, "Should be a new index")
+        nodes = ["Color", "Dark", "Light", "Darkblue", "Navy", "Yellow"]
+        for getter in ["get_depths", "get_preorder", "get_subtree_sizes"]:
+            self.assertEqual(
+                list(getattr(updated, getter)()[updated.get_ids(nodes)]),
+                list(getattr(rebuilt, getter)()[rebuilt.get_ids(nodes)]),
+            )
+        first = updated.get_ids(["Navy", "Yellow", "Navy"])
+        second = updated.get_ids(["Yellow", "Light", "Dark"])
+        self.assertEqual(
+            list(updated.get_nodes()[updated.lowest_common_ancestors(first, second)]),
+            ["Color", "Light", "Dark"],
+        )
+
+        self.assertEqual(tree_context.get_version(), version + 2, "Should count changes")
+        self.assertEqual(tree_context.get_changes(version), {"Navy", "Yellow"})
+        tree_context.add_concept("Darkblue", "Dark", weight=2.0)
+        self.assertEqual(
+            tree_context.get_changes(version + 2),
+            {"Darkblue", "Navy"},
+            "Should contain the subtree",
+        )
+
+
+class TestGraphContext(TestCase):
+    def test_distance_oracle(self):
+        graph_context = GraphContext("Color")
+        graph_context.add_concept("Red", "Color")
+        graph_context.add_concept("Blue", "Color")
+        graph_context.add_concept("Navy", "Blue")
+        graph_context.add_concept("Cyan", "Blue")
+        graph_context.add_concept("Cyan", "Navy")
+        graph_context.add_concept("Pink", "Red")
+
+        self.assertIsNone(graph_context.get_distance_oracle(), "Should be disabled")
+        graph_context.set_distance_oracle(n_landmarks=2)
+        oracle = graph_context.get_distance_oracle()
+
+        graph = oracle.get_compiled_graph()
+        first = graph.get_ids(["Pink", "Navy", "Cyan", "Red"])
+        second = graph.get_ids(["Cyan", "Cyan", "Cyan", "Blue"])
+
+        self.assertEqual(
+            list(oracle.distances(first, second)),
+            [4.0, 1.0, 0.0, 2.0],
+            "Should be the shortest path lengths",
+        )
+
+    def test_create_graph_context_from_edge_list(self):
+        graph_context = GraphContext.from_edge_list(
+            "Color", [("Red", "Color"), ("Blue", "Color", 2.0), ("Pink", None)]
+        )
+
+        graph = graph_context.get_graph()
+        compiled_graph = graph_context.compile()
+
+        self.assertTrue("Pink" in graph.nodes, "Should contain Pink")
+        self.assertEqual(graph["Blue"]["Color"]["weight"], 2.0, "Should use the weight")
+        self.assertEqual(
+            compiled_graph.to_sparse()[tuple(compiled_graph.get_ids(["Blue", "Color"]))],
+            2.0,
+            "Should compile the edges",
+        )
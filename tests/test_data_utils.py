@@ -0,0 +1,82 @@
+import os
+import tempfile
+from unittest import TestCase
+import pytest
+import numpy as np
+import pandas as pd
+from contextual_encoders.data_utils import DataUtils
+
+
+class TestDataUtils(TestCase):
+    def test_categorical_codes_are_not_copied(self):
+        codes = np.array([0, 1, 1, 2], dtype=np.int8)
+
+        x_df = DataUtils.ensure_pandas_dataframe(codes, categories=["a", "b", "c"])
+        factorized_codes, values = DataUtils.factorize(x_df[0])
+
+        self.assertTrue(np.shares_memory(factorized_codes, codes), "Should share memory")
+        self.assertEqual(list(values), ["a", "b", "c"], "Should be the categories")
+
+    def test_factorize_drops_unused_categories(self):
+        column = pd.Series(
+            pd.Categorical(["c", None, "a", "c"], categories=["a", "b", "c"])
+        )
+
+        codes, values = DataUtils.factorize(column)
+
+        self.assertEqual(list(codes), [1, 2, 0, 1], "Should remap the codes")
+        self.assertEqual(list(values[:2]), ["a", "c"], "Should drop the unused category")
+        self.assertEqual(len(values), 3, "Should contain a missing value")
+
+    def test_factorize_missing_values(self):
+        for column in [
+            pd.Series(pd.Categorical(["a", None, "b", "a"])),
+            pd.Series(["a", None, "b", "a"], dtype=object),
+        ]:
+            codes, values = DataUtils.factorize(column)
+
+            self.assertEqual(list(codes), [0, 2, 1, 0], "Should map missing values to 2")
+            self.assertEqual(len(values), 3, "Should contain a missing value")
+
+    def test_read_codes_from_chunks(self):
+        chunks = iter(
+            [np.array([["a", "x"], ["b", None]]), np.array([["b", "y"], ["c", "x"]])]
+        )
+
+        x_df = DataUtils.read_codes(chunks)
+        codes, values = DataUtils.factorize(x_df[0])
+        other_codes, other_values = DataUtils.factorize(x_df[1])
+
+        self.assertEqual(
+            list(values[codes]), ["a", "b", "b", "c"], "Should keep the values"
+        )
+        self.assertEqual(
+            list(other_codes), [0, 2, 1, 0], "Should map missing values to 2"
+        )
+        self.assertEqual(list(other_values[:2]), ["x", "y"], "Should be the vocabulary")
+
+    def test_read_codes_from_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.csv")
+            pd.DataFrame({"day": ["Mon", "Tue", "Mon", "Sun"]}).to_csv(path, index=False)
+
+            x_df = DataUtils.read_codes(path, chunk_size=3)
+
+        self.assertIsInstance(x_df[0].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(x_df[0]), ["Mon", "Tue", "Mon", "Sun"])
+        self.assertEqual(list(x_df[0].cat.categories), ["Mon", "Tue", "Sun"])
+
+    def test_read_codes_from_parquet(self):
+        pytest.importorskip("pyarrow")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.parquet")
+            pd.DataFrame({"day": ["Mon", "Tue", "Mon", "Sun"]}).to_parquet(
+                path, index=False, row_group_size=2
+            )
+
+            x_df = DataUtils.read_codes(path, chunk_size=3)
+
+        self.assertIsInstance(x_df[0].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(x_df[0]), ["Mon", "Tue", "Mon", "Sun"])
+        self.assertEqual(list(x_df[0].cat.categories), ["Mon", "Tue", "Sun"])
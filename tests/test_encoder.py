@@ -0,0 +1,247 @@
+import asyncio
+import os
+import tempfile
+from unittest import TestCase, mock
+import numpy as np
+from scipy.spatial.distance import pdist
+from sklearn.base import clone
+from contextual_encoders import (
+    ContextualEncoder,
+    GraphContext,
+    PathLengthMeasure,
+    MultidimensionalScalingReducer,
+)
+from contextual_encoders.computer import MatrixComputer
+
+
+def create_day_measure():
+    day = GraphContext("day")
+    day.add_concept("Mon", "Tue")
+    day.add_concept("Tue", "Wed")
+    day.add_concept("Wed", "Thur")
+    day.add_concept("Thur", "Fri")
+    day.add_concept("Fri", "Sat")
+    day.add_concept("Sat", "Sun")
+    day.add_concept("Sun", "Mon")
+
+    return PathLengthMeasure(day)
+
+
+class TestContextualEncoder(TestCase):
+    def test_atransform_equals_transform(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed"])
+
+        encoder = ContextualEncoder(
+            create_day_measure(),
+            reducer=MultidimensionalScalingReducer(random_state=0),
+        )
+        expected = encoder.transform(x)
+        expected_matrix = encoder.get_dissimilarity_matrix()
+
+        encoder = ContextualEncoder(
+            create_day_measure(),
+            reducer=MultidimensionalScalingReducer(random_state=0),
+        )
+        actual = asyncio.run(encoder.atransform(x))
+
+        np.testing.assert_allclose(encoder.get_dissimilarity_matrix(), expected_matrix)
+        np.testing.assert_allclose(actual, expected)
+
+    def test_codes_equal_strings(self):
+        categories = ["Mon", "Tue", "Wed", "Fri", "Sat"]
+        codes = np.array([3, 1, 3, 4, 0, 1, 2], dtype=np.int8)
+
+        encoder = ContextualEncoder(create_day_measure())
+        encoder.transform(np.array(categories)[codes])
+        expected = encoder.get_similarity_matrix()
+
+        encoder.transform(codes, categories=categories)
+
+        np.testing.assert_allclose(encoder.get_similarity_matrix(), expected)
+
+    def test_unused_categories_are_ignored(self):
+        categories = ["Mon", "Tue", "Wed", "Holiday"]
+        codes = np.array([0, 1, 2, 1], dtype=np.int8)
+
+        encoder = ContextualEncoder(create_day_measure())
+        encoder.transform(np.array(categories)[codes])
+        expected = encoder.get_similarity_matrix()
+
+        encoder.transform(codes, categories=categories)
+
+        np.testing.assert_allclose(encoder.get_similarity_matrix(), expected)
+
+    def test_pairwise_equals_matrix_rows(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed"])
+
+        encoder = ContextualEncoder(create_day_measure())
+        encoder.transform(x)
+        expected = encoder.get_dissimilarity_matrix()[[1, 3]]
+
+        actual = encoder.pairwise(x[[1, 3]], x, dissimilarity=True, chunk_size=3)
+
+        np.testing.assert_allclose(actual, expected)
+
+    def test_most_similar_equals_pairwise(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed", "Sun", "Thur"])
+        query = np.array(["Fri", "Sun"])
+
+        encoder = ContextualEncoder(create_day_measure())
+        encoder.fit(x)
+        indices, similarities = encoder.most_similar(query, k=3)
+        expected = encoder.pairwise(query, x)
+
+        np.testing.assert_allclose(similarities, -np.sort(-expected, axis=1)[:, :3])
+        np.testing.assert_allclose(
+            np.take_along_axis(expected, indices, axis=1), similarities
+        )
+
+    def test_transform_to_file_equals_transform_iter(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed", "Sun", "Thur"])
+        new_rows = np.array(["Sun", "Mon", "Fri", "Thur", "Sat"])
+
+        encoder = ContextualEncoder(
+            create_day_measure(),
+            reducer=MultidimensionalScalingReducer(random_state=0),
+        )
+        encoder.fit_transform(x)
+        expected = np.concatenate(list(encoder.transform_iter(new_rows, chunk_size=2)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "encoded.npy")
+            n_rows = encoder.transform_to_file(iter([new_rows[:3], new_rows[3:]]), path)
+            actual = np.load(path, mmap_mode="r")
+
+            self.assertEqual(n_rows, 5, "Should write five rows")
+            np.testing.assert_allclose(actual, expected)
+            del actual
+
+    def test_save_and_load(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed", "Sun", "Thur"])
+        new_rows = np.array(["Sun", "Mon", "Fri"])
+
+        encoder = ContextualEncoder(
+            create_day_measure(),
+            reducer=MultidimensionalScalingReducer(random_state=0),
+        )
+        encoder.fit_transform(x)
+        expected = next(encoder.transform_iter(new_rows))
+
+        with tempfile.TemporaryDirectory() as directory:
+            encoder.save(directory)
+            loaded = ContextualEncoder.load(directory)
+
+            np.testing.assert_allclose(
+                loaded.get_dissimilarity_matrix(), encoder.get_dissimilarity_matrix()
+            )
+            np.testing.assert_allclose(next(loaded.transform_iter(new_rows)), expected)
+            np.testing.assert_array_equal(
+                loaded.most_similar(new_rows, k=2)[0],
+                encoder.most_similar(new_rows, k=2)[0],
+            )
+            del loaded
+
+    def test_deduplicate_rows(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed", "Fri", "Tue"])
+
+        expected = ContextualEncoder(create_day_measure())
+        expected.transform(x)
+
+        encoder = ContextualEncoder(
+            create_day_measure(),
+            reducer=MultidimensionalScalingReducer(random_state=0),
+            deduplicate=True,
+        )
+        encoded = encoder.transform(x)
+
+        np.testing.assert_allclose(
+            encoder.get_dissimilarity_matrix(), expected.get_dissimilarity_matrix()
+        )
+        np.testing.assert_array_equal(encoded[0], encoded[2])
+        np.testing.assert_array_equal(encoded[1], encoded[8])
+
+    def test_kernel_pca_projects_catalog_rows(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed", "Sun", "Thur"])
+
+        encoder = ContextualEncoder(create_day_measure(), reducer="kpca")
+        encoded = encoder.fit_transform(x)
+        projected = np.concatenate(list(encoder.transform_iter(x, chunk_size=4)))
+
+        np.testing.assert_allclose(projected, encoded, atol=1e-8)
+        self.assertEqual(
+            encoder.get_dissimilarity_matrix().shape, (9, 9), "Should aggregate on demand"
+        )
+
+    def test_fit_transform_computes_values_once(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed", "Sun", "Thur"])
+        expected = ContextualEncoder(create_day_measure(), reducer="kpca")
+        expected = expected.fit(x).transform(x)
+
+        with mock.patch.object(
+            MatrixComputer,
+            "compute_values",
+            autospec=True,
+            side_effect=MatrixComputer.compute_values,
+        ) as compute_values:
+            encoded = ContextualEncoder(
+                create_day_measure(), reducer="kpca"
+            ).fit_transform(x)
+
+        self.assertEqual(compute_values.call_count, 1, "Should reuse the fitted values")
+        np.testing.assert_allclose(pdist(encoded), pdist(expected), atol=1e-8)
+
+    def test_matrix_free_equals_dense(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed", "Sun", "Thur"])
+        x = np.stack([x, x[::-1]], axis=1)
+        measures = [create_day_measure(), create_day_measure()]
+
+        expected = ContextualEncoder(measures, reducer="kpca").fit_transform(x)
+        encoder = ContextualEncoder(measures, reducer="kpca", matrix_free=True)
+        encoded = encoder.fit_transform(x)
+
+        self.assertTrue(encoder.plan(x).get_matrix_free(), "Should not materialize")
+        # the eigenvectors are unique up to their signs
+        np.testing.assert_allclose(pdist(encoded), pdist(expected), atol=1e-8)
+        self.assertEqual(
+            encoder.get_similarity_matrix().shape, (9, 9), "Should aggregate on demand"
+        )
+        with self.assertRaises(ValueError):
+            ContextualEncoder(measures, reducer="mds", matrix_free=True)
+
+    def test_clone_reuses_measures(self):
+        measure = create_day_measure()
+        encoder = ContextualEncoder(measure, reducer="kpca", deduplicate=True)
+        cloned = clone(encoder)
+
+        self.assertEqual(cloned.get_params()["reducer"], "kpca", "Should keep parameters")
+        self.assertIsNot(cloned.measures, measure, "Should copy the measure")
+        self.assertIsNot(cloned.measures.get_context(), measure.get_context())
+        self.assertEqual(
+            cloned.measures.get_fingerprint(),
+            measure.get_fingerprint(),
+            "Should share the cache by fingerprint",
+        )
+
+    def test_factorized_mode(self):
+        x = np.array(["Fri", "Tue", "Fri", "Sat", "Mon", "Tue", "Wed", "Fri"])
+
+        encoder = ContextualEncoder(
+            [create_day_measure(), create_day_measure()],
+            reducer="kpca",
+            mode="factorized",
+            column_weights=[1.0, 4.0],
+        )
+        encoded = encoder.fit_transform(np.stack([x, x[::-1]], axis=1))
+
+        self.assertEqual(encoded.shape, (8, 4), "Should concatenate the columns")
+        np.testing.assert_array_equal(encoded[0, :2], encoded[2, :2])
+        # the second column has the same values in reversed order and four times the weight
+        np.testing.assert_allclose(
+            pdist(encoded[:, 2:]), 2 * pdist(encoded[::-1, :2]), atol=1e-8
+        )
+
+        # unseen values are projected, seen values are looked up
+        new_rows = np.array([["Sun", "Fri"], ["Fri", "Thur"]])
+        projected = next(encoder.transform_iter(new_rows))
+        np.testing.assert_array_equal(projected[0, 2:], encoded[0, 2:])
+        np.testing.assert_array_equal(projected[1, :2], encoded[0, :2])
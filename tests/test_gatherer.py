@@ -0,0 +1,67 @@
+from unittest import TestCase
+import numpy as np
+from contextual_encoders import GathererFactory, SimilarityMeasure, Tokenizer
+from tests.test_encoder import create_day_measure
+
+
+class CountingMeasure(SimilarityMeasure):
+    def __init__(self):
+        super().__init__(symmetric=True, multiple_values=False)
+        self.calls = 0
+
+    def _compare(self, first, second):
+        self.calls += 1
+        return 0.5
+
+    def _is_reflexive(self):
+        return True
+
+
+class IrreflexiveMeasure(CountingMeasure):
+    def _is_reflexive(self):
+        return False
+
+
+class TestGatherer(TestCase):
+    values = np.array(["Mon", "Tue,Wed", "Sat,Sun,Mon", "Fri,Tue", "Sun"])
+
+    def test_block_equals_pairs(self):
+        tokens = Tokenizer(",").tokenize(self.values)
+
+        for name in ["first", "smm", "mean", "hausdorff", "jaccard"]:
+            gatherer = GathererFactory.create(name)
+            gatherer.set_measure(create_day_measure())
+
+            expected = np.array(
+                [
+                    [gatherer.gather(a.split(","), b.split(",")) for b in self.values]
+                    for a in self.values
+                ]
+            )
+            actual = gatherer.gather_block(tokens, tokens)
+
+            np.testing.assert_allclose(actual, expected, err_msg=name)
+            if name != "mean":
+                np.testing.assert_allclose(np.diag(actual), 1.0, err_msg=name)
+
+    def test_exact_matches_skip_measure(self):
+        measure = CountingMeasure()
+        gatherer = GathererFactory.create("smm")
+        gatherer.set_measure(measure)
+
+        value = gatherer.gather(["Mon", "Tue", "Wed"], ["Wed", "Mon", "Tue"])
+
+        self.assertEqual(value, 1.0, "Should be an exact match")
+        self.assertEqual(measure.calls, 0, "Should not call the measure")
+
+    def test_irreflexive_measures_compare_identical_forms(self):
+        measure = IrreflexiveMeasure()
+        tokens = Tokenizer(",").tokenize(np.array(["Mon,Tue"]))
+
+        for name in ["first", "smm", "mean", "hausdorff", "jaccard"]:
+            gatherer = GathererFactory.create(name)
+            gatherer.set_measure(measure)
+
+            value = gatherer.gather(["Mon", "Tue"], ["Mon", "Tue"])
+            self.assertLess(value, 1.0, "Should not be an exact match")
+            self.assertAlmostEqual(gatherer.gather_block(tokens, tokens)[0, 0], value)
@@ -0,0 +1,170 @@
+import copy
+import weakref
+from unittest import TestCase
+import numpy as np
+from contextual_encoders import TreeContext, Lin, Resnik, JiangConrath, WuPalmer
+from contextual_encoders.data_utils import DataUtils
+
+
+def create_job_context():
+    job = TreeContext("job")
+    job.add_concept("Education")
+    job.add_concept("Safety")
+    job.add_concept("Teacher", "Education")
+    job.add_concept("Student", "Education")
+    job.add_concept("Police Man", "Safety")
+
+    return job
+
+
+class TestInformationContentMeasure(TestCase):
+    def test_block_equals_single_comparisons(self):
+        job = create_job_context()
+        forms = ["Teacher", "Student", "Police Man", "Education", "job"]
+
+        for measure in [Lin(job), Resnik(job), JiangConrath(job, {"Teacher": 3})]:
+            block = measure.compare_block(forms, forms)
+            single = [[measure.compare(a, b) for b in forms] for a in forms]
+
+            np.testing.assert_allclose(block, single)
+            self.assertTrue(np.all((block >= 0.0) & (block <= 1.0)), "Should be in [0,1]")
+
+    def test_lin_similarity(self):
+        measure = Lin(create_job_context())
+
+        self.assertEqual(measure.compare("Teacher", "Teacher"), 1.0, "Should be one")
+        self.assertEqual(measure.compare("Teacher", "Police Man"), 0.0, "Should be zero")
+        self.assertGreater(
+            measure.compare("Teacher", "Student"), 0.0, "Should be positive"
+        )
+
+
+class TestFrozenMeasure(TestCase):
+    def test_frozen_measure_equals_measure(self):
+        job = create_job_context()
+        forms = ["Teacher", "Student", "Police Man", "Education"]
+        expected = WuPalmer(job).compare_block(forms, forms)
+
+        measure = WuPalmer(job)
+        measure.freeze(["Teacher", "Student", "Police Man"])
+        job.freeze()
+
+        np.testing.assert_allclose(measure.compare_block(forms, forms), expected)
+        self.assertEqual(
+            measure.compare("Teacher", "Student"), expected[0, 1], "Should use the table"
+        )
+
+    def test_attach_shared_measure(self):
+        measure = Lin(create_job_context())
+        table = measure.freeze(np.repeat(["Teacher", "Student", "Police Man"], 100))
+
+        memory = DataUtils.share_object(measure)
+        try:
+            forms, attached_table = DataUtils.attach_object(memory.name).get_table()
+
+            np.testing.assert_allclose(attached_table, table)
+            self.assertFalse(attached_table.flags.writeable, "Should be read-only")
+
+            released = []
+            weakref.finalize(attached_table.base, released.append, True)
+            del attached_table
+            self.assertEqual(released, [True], "Should release the attached memory")
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+class TestSharedMeasure(TestCase):
+    def test_fingerprint_depends_on_content(self):
+        self.assertEqual(
+            WuPalmer(create_job_context()).get_fingerprint(),
+            WuPalmer(create_job_context()).get_fingerprint(),
+        )
+        self.assertNotEqual(
+            WuPalmer(create_job_context()).get_fingerprint(),
+            WuPalmer(create_job_context(), offset=1.0).get_fingerprint(),
+        )
+
+        job = create_job_context()
+        fingerprint = Lin(job).get_fingerprint()
+        job.add_concept("Nurse", "Safety")
+        self.assertNotEqual(Lin(job).get_fingerprint(), fingerprint)
+
+    def test_copies_and_siblings_share_the_cache(self):
+        measure = WuPalmer(create_job_context())
+        sibling = WuPalmer(create_job_context())
+        measure.share_cache()
+        sibling.share_cache()
+
+        value = measure.compare("Teacher", "Student")
+        measure_copy = copy.deepcopy(measure)
+        measure_copy.share_cache()
+
+        # a deep copy is independent of the original
+        measure_copy.get_context().add_concept("Nurse", "Safety")
+        self.assertNotIn("Nurse", measure.get_context().get_tree())
+
+        # the cache is hit, since the cached value is returned even for a replaced context
+        for shared in [sibling, measure_copy]:
+            shared._WuPalmer__context = None
+            self.assertEqual(shared.compare("Teacher", "Student"), value)
+
+
+class TestContextVersioning(TestCase):
+    def test_invalidate_affected_pairs(self):
+        job = create_job_context()
+        measure = WuPalmer(job)
+        measure.compare("Teacher", "Student")
+        measure.compare("Teacher", "Police Man")
+
+        job.add_concept("Nurse", "Safety")
+        measure.compare("Nurse", "Teacher")
+        cache = measure._Measure__cache
+        self.assertIn(("Teacher", "Student"), cache, "Should keep unaffected pairs")
+
+        # moving the police man below the nurse changes its depth
+        job.add_concept("Police Man", "Nurse", weight=2.0)
+        job.get_tree().remove_edge("Safety", "Police Man")
+        measure.compare("Teacher", "Student")
+        cache = measure._Measure__cache
+        self.assertNotIn(("Teacher", "Police Man"), cache, "Should drop affected pairs")
+        self.assertIn(("Teacher", "Student"), cache, "Should keep unaffected pairs")
+        self.assertAlmostEqual(
+            measure.compare("Teacher", "Police Man"),
+            WuPalmer(job).compare("Teacher", "Police Man"),
+        )
+
+    def test_depth_offset_follows_tree(self):
+        job = create_job_context()
+        measure = WuPalmer(job, offset="depth")
+        measure.compare("Teacher", "Student")
+
+        job.add_concept("Trainee", "Teacher")
+        self.assertAlmostEqual(
+            measure.compare("Teacher", "Student"),
+            WuPalmer(job, offset="depth").compare("Teacher", "Student"),
+        )
+
+    def test_depth_offset_of_earlier_measure(self):
+        job = create_job_context()
+        measure = WuPalmer(job, offset="depth")
+
+        job.add_concept("Trainee", "Teacher")
+        job.add_concept("Junior", "Trainee")
+        self.assertAlmostEqual(
+            measure.compare("Teacher", "Student"),
+            WuPalmer(job, offset="depth").compare("Teacher", "Student"),
+        )
+
+    def test_invalidate_without_tree_index(self):
+        context = TreeContext("root")
+        context.add_concept("a")
+        context.add_concept("b")
+        context.add_concept("c", "a")
+        context.add_concept("c", "b")
+        measure = WuPalmer(context)
+        value = measure.compare("c", "a")
+
+        context.add_concept("d", "a")
+        self.assertEqual(measure.compare("c", "a"), value, "Should keep the value")
+        self.assertAlmostEqual(measure.compare("d", "c"), 0.5)
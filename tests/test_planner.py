@@ -0,0 +1,45 @@
+from unittest import TestCase
+import numpy as np
+from contextual_encoders import ContextualEncoder
+from tests.test_encoder import create_day_measure
+
+
+class TestPlanner(TestCase):
+    x = np.array(["Fri", "Tue", "Fri", "Sat", "Sat,Sun", "Tue", "Fri", "Fri"])
+
+    def test_explain(self):
+        encoder = ContextualEncoder(
+            create_day_measure(), reducer="kpca", deduplicate=None
+        )
+        plan = encoder.plan(self.x)
+
+        column_plan = plan.get_column_plans()[0]
+        self.assertEqual(column_plan.get_n_values(), 4)
+        self.assertEqual(column_plan.get_n_forms(), 4)
+        self.assertEqual(column_plan.get_strategy(), "pairwise")
+        self.assertTrue(plan.get_deduplicate(), "Should deduplicate the repeated rows")
+        self.assertEqual(plan.get_n_reduced_rows(), 4)
+
+        explanation = encoder.explain(self.x)
+        self.assertIn("rows: 8, distinct rows: 4", explanation)
+        self.assertIn("strategy pairwise", explanation)
+
+    def test_reject_infeasible_plan(self):
+        encoder = ContextualEncoder(create_day_measure(), memory_limit=1024)
+
+        self.assertFalse(encoder.plan(self.x).is_feasible())
+        with self.assertRaises(ValueError):
+            encoder.transform(self.x)
+
+    def test_matrix_free_when_dense_does_not_fit(self):
+        encoder = ContextualEncoder(
+            create_day_measure(), reducer="kpca", memory_limit=2000
+        )
+        plan = encoder.plan(self.x)
+
+        self.assertTrue(plan.get_matrix_free(), "Should not materialize the 8 x 8 matrix")
+        self.assertTrue(plan.is_feasible())
+        self.assertIn("8 x 8 (matrix-free)", plan.explain())
+        self.assertFalse(
+            ContextualEncoder(create_day_measure()).plan(self.x).get_matrix_free()
+        )
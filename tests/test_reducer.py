@@ -0,0 +1,82 @@
+from unittest import TestCase
+import numpy as np
+import scipy.sparse
+from sklearn.decomposition import KernelPCA
+from sklearn.metrics import euclidean_distances
+from sklearn.metrics.pairwise import rbf_kernel
+from contextual_encoders import (
+    MultidimensionalScalingReducer,
+    KernelPCAReducer,
+    SpectralEmbeddingReducer,
+)
+
+
+class TestMultidimensionalScalingReducer(TestCase):
+    def test_warm_start_converges_faster(self):
+        points = np.random.RandomState(0).rand(30, 5)
+        matrix = euclidean_distances(points)
+
+        reducer = MultidimensionalScalingReducer(
+            max_iter=1000, eps=1e-6, random_state=0, warm_start=True
+        )
+        reducer.reduce(matrix)
+        cold_iterations = reducer.get_n_iter()
+
+        reducer.reduce(matrix * 1.01)
+        warm_iterations = reducer.get_n_iter()
+
+        self.assertLess(warm_iterations, cold_iterations, "Should converge faster")
+
+    def test_explicit_init_is_used(self):
+        points = np.random.RandomState(1).rand(10, 2)
+        matrix = euclidean_distances(points)
+
+        reducer = MultidimensionalScalingReducer(max_iter=1, random_state=0)
+        embedding = reducer.reduce(matrix, init=points)
+
+        self.assertEqual(embedding.shape, (10, 2), "Should have shape (10, 2)")
+        self.assertEqual(reducer.get_n_iter(), 1, "Should stop after one iteration")
+
+
+class TestKernelPCAReducer(TestCase):
+    def test_equals_kernel_pca(self):
+        kernel = rbf_kernel(np.random.RandomState(0).rand(100, 3))
+        expected = np.abs(KernelPCA(2, kernel="precomputed").fit_transform(kernel))
+
+        for solver in ["dense", "arpack", "lobpcg", "randomized"]:
+            reducer = KernelPCAReducer(eigen_solver=solver, random_state=0)
+            embedding = reducer.reduce(kernel)
+            np.testing.assert_allclose(np.abs(embedding), expected, atol=1e-5)
+            np.testing.assert_allclose(reducer.project(kernel), embedding, atol=1e-6)
+
+    def test_sparse_and_weighted_input(self):
+        kernel = rbf_kernel(np.random.RandomState(1).rand(20, 3))
+        weights = np.arange(1, 21)
+        inverse = np.repeat(np.arange(20), weights)
+
+        expected = KernelPCAReducer(eigen_solver="dense").reduce(
+            kernel[np.ix_(inverse, inverse)]
+        )
+        embedding = KernelPCAReducer(eigen_solver="arpack", random_state=0).reduce(
+            scipy.sparse.csr_matrix(kernel), weights=weights
+        )
+
+        np.testing.assert_allclose(
+            np.abs(embedding[inverse]), np.abs(expected), atol=1e-8
+        )
+
+
+class TestSpectralEmbeddingReducer(TestCase):
+    def test_weighted_and_projected(self):
+        affinity = rbf_kernel(np.random.RandomState(2).rand(20, 3))
+        weights = np.arange(1, 21)
+        inverse = np.repeat(np.arange(20), weights)
+
+        reducer = SpectralEmbeddingReducer()
+        embedding = reducer.reduce(affinity, weights=weights)
+        expected = SpectralEmbeddingReducer().reduce(affinity[np.ix_(inverse, inverse)])
+
+        np.testing.assert_allclose(
+            np.abs(embedding[inverse]), np.abs(expected), atol=1e-8
+        )
+        np.testing.assert_allclose(reducer.project(affinity), embedding, atol=1e-8)
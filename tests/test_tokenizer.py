@@ -0,0 +1,25 @@
+from unittest import TestCase
+import numpy as np
+from contextual_encoders import Tokenizer
+
+
+class TestTokenizer(TestCase):
+    def test_tokenize_multiple_forms(self):
+        values = np.array(["Pilot", "Student, Pilot", "Teacher,Teacher"], dtype=object)
+
+        tokens = Tokenizer(",", strip=True, unique=True).tokenize(values)
+
+        self.assertEqual(len(tokens), 3, "Should have three values")
+        self.assertEqual(
+            list(tokens.get_offsets()), [0, 1, 3, 4], "Should be CSR offsets"
+        )
+        self.assertEqual(tokens.get_value(1), ["Student", "Pilot"], "Should strip forms")
+        self.assertEqual(tokens.get_value(2), ["Teacher"], "Should remove repeated forms")
+        self.assertEqual(len(tokens.get_forms()), 3, "Should intern the forms")
+
+    def test_separator_is_literal(self):
+        values = np.array(["a.b", "a|b|c", "ab"], dtype=object)
+
+        self.assertEqual(Tokenizer(".").tokenize(values).get_value(0), ["a", "b"])
+        self.assertEqual(Tokenizer("|").tokenize(values).get_value(1), ["a", "b", "c"])
+        self.assertEqual(Tokenizer("b|").tokenize(values).get_value(1), ["a|", "c"])